@@ -1,7 +1,46 @@
 from collections.abc import Callable
 from inspect import signature
 from operator import itemgetter
+from types import FunctionType
 from typing import Any
+from weakref import WeakKeyDictionary
+
+# Default value of arguments not given to specialized wrappers
+MISSING = object()
+
+# Number of arguments of functions, keyed by code object for plain functions
+# (lambdas created at the same place share it) and by function otherwise.
+ARITIES = WeakKeyDictionary()
+
+
+def arity(func: Callable[..., Any]) -> int:
+    """
+    Returns the number of parameters of :code:`func`. Results are cached
+    for functions which support weak references.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        Function
+
+    Returns
+    -------
+    int
+        Number of parameters
+    """
+    if isinstance(func, itemgetter):
+        return 1
+    key = func.__code__ if type(func) is FunctionType and not func.__dict__ else func
+    try:
+        return ARITIES[key]
+    except (KeyError, TypeError):
+        pass
+    nargs = len(signature(func).parameters)
+    try:
+        ARITIES[key] = nargs
+    except TypeError:
+        pass
+    return nargs
 
 
 class argpass:
@@ -9,17 +48,29 @@ class argpass:
     Determines the number of arguments needed by the given function and returns
     a wrapper function which selects the correct number of arguments.
 
+    Functions with up to three parameters are wrapped by specialized classes
+    which pass their arguments without slicing. Wrapping an :code:`argpass`
+    object returns it unchanged.
+
     Parameters
     ----------
     func : Callable[..., Any]
         Function to decorate
     """
 
-    def __init__(self, func: Callable[..., Any]):
+    __slots__ = ("_func", "_nargs")
+
+    def __new__(cls, func: Callable[..., Any]):
+        if isinstance(func, argpass):
+            return func
+        nargs = arity(func)
+        self = object.__new__(SPECIALIZED.get(nargs, argpass))
         self._func = func
-        self._nargs = (
-            1 if isinstance(func, itemgetter) else len(signature(func).parameters)
-        )
+        self._nargs = nargs
+        return self
+
+    def __reduce__(self) -> tuple[type, tuple[Callable[..., Any]]]:
+        return (argpass, (self._func,))
 
     def __call__(self, *args: Any) -> Any:
         """
@@ -57,3 +108,42 @@ class argpass:
             return self._func == other
         else:
             return False
+
+
+class argpass0(argpass):
+    __slots__ = ()
+
+    def __call__(self, *args: Any) -> Any:
+        return self._func()
+
+
+class argpass1(argpass):
+    __slots__ = ()
+
+    def __call__(self, a: Any = MISSING, *args: Any) -> Any:
+        if a is MISSING:
+            return self._func()
+        return self._func(a)
+
+
+class argpass2(argpass):
+    __slots__ = ()
+
+    def __call__(self, a: Any = MISSING, b: Any = MISSING, *args: Any) -> Any:
+        if b is MISSING:
+            return self._func(*(() if a is MISSING else (a,)))
+        return self._func(a, b)
+
+
+class argpass3(argpass):
+    __slots__ = ()
+
+    def __call__(
+        self, a: Any = MISSING, b: Any = MISSING, c: Any = MISSING, *args: Any
+    ) -> Any:
+        if c is MISSING:
+            return self._func(*(arg for arg in (a, b) if arg is not MISSING))
+        return self._func(a, b, c)
+
+
+SPECIALIZED = {0: argpass0, 1: argpass1, 2: argpass2, 3: argpass3}
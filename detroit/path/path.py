@@ -1,5 +1,10 @@
+from __future__ import annotations
+
 import math
-from io import StringIO
+import re
+from array import array
+from collections.abc import Sequence
+from functools import lru_cache
 
 from .string_round import string_round
 
@@ -7,10 +12,161 @@ TAU = 2 * math.pi
 EPSILON = 1e-6
 TAU_EPSILON = TAU - EPSILON
 
+# Command codes stored in `Path._commands`; each `%s` of their template is
+# replaced by the next coordinate stored in `Path._values`.
+LITERAL = 0  # Preformatted text stored in `Path._literals`
+MOVE = 1
+LINE = 2
+CLOSE = 3
+QUADRATIC = 4
+BEZIER = 5
+POINT = 6
+ARC = 7
+CIRCLE = 8
+RECT = 9
+
+TEMPLATES = (
+    "",
+    "M%s,%s",
+    "L%s,%s",
+    "Z",
+    "Q%s,%s,%s,%s",
+    "C%s,%s,%s,%s,%s,%s",
+    "%s,%s",
+    "A%s,%s,0,%s,%s,%s,%s",
+    "A%s,%s,0,1,%s,%s,%sA%s,%s,0,1,%s,%s,%s",
+    "M%s,%sh%sv%sh-%sZ",
+)
+
+# Kind of each value of commands: 1 for x positions, 2 for y positions and 0
+# for other values (radii, flags and sizes).
+COORDINATES = (
+    (),
+    (1, 2),
+    (1, 2),
+    (),
+    (1, 2, 1, 2),
+    (1, 2, 1, 2, 1, 2),
+    (1, 2),
+    (0, 0, 0, 0, 1, 2),
+    (0, 0, 0, 1, 2, 0, 0, 0, 1, 2),
+    (1, 2, 0, 0, 0),
+)
+
+# Negative zero left after removing trailing zeros
+NEGATIVE_ZERO = re.compile(r"-0(?![\d.])")
+
+# Placeholder of the literal minus sign of the last side of rectangles in
+# fixed templates, restored once negative zeros are removed
+RECT_MINUS = "~"
+
+
+@lru_cache(maxsize=16)
+def fixed_templates(digit: int) -> tuple[list[str], re.Pattern]:
+    """
+    Returns the command templates formatting coordinates with :code:`digit`
+    decimals and the pattern of trailing zeros of rounded integers.
+
+    Parameters
+    ----------
+    digit : int
+        Number of digits
+
+    Returns
+    -------
+    tuple[list[str], re.Pattern]
+        Templates and pattern of trailing zeros
+    """
+    templates = [template.replace("%s", f"%.{digit}f") for template in TEMPLATES]
+    templates[RECT] = templates[RECT].replace("h-", f"h{RECT_MINUS}")
+    return templates, re.compile(rf"\.0{{{digit}}}(?!\d)")
+
+
+def is_fixed(values: array, digit: int) -> bool:
+    """
+    Returns :code:`True` if values are finite and small enough to be written
+    with :code:`digit` decimals exactly as :func:`string_round` does, once
+    trailing zeros of integers are removed.
+
+    Parameters
+    ----------
+    values : array
+        Values
+    digit : int
+        Number of digits
+
+    Returns
+    -------
+    bool
+        :code:`True` if values can be formatted with fixed decimals
+    """
+    if not values:
+        return True
+    limit = 10.0 ** (15 - digit)
+    return math.isfinite(sum(values)) and -limit < min(values) and max(values) < limit
+
+
+def as_array(values: Sequence[int | float]) -> array:
+    """
+    Returns values as an :code:`array` of doubles, copying buffers of doubles
+    without iterating over them. Values which are not numbers, such as
+    numeric strings, are converted with :code:`float`.
+
+    Parameters
+    ----------
+    values : Sequence[int | float]
+        Values as a sequence, an :code:`array` or any object supporting the
+        buffer protocol
+
+    Returns
+    -------
+    array
+        Array of doubles
+    """
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        try:
+            return array("d", values)
+        except TypeError:
+            return array("d", map(float, values))
+    result = array("d")
+    if view.format == "d" and view.ndim == 1 and view.c_contiguous:
+        result.frombytes(view.cast("B"))
+    else:
+        result.extend(map(float, view.tolist()))
+    return result
+
+
+def extend_values(values: array, items: tuple):
+    """
+    Appends :code:`items` to :code:`values`, converting them with
+    :code:`float` when some of them are not numbers, such as numeric strings.
+
+    Parameters
+    ----------
+    values : array
+        Array of doubles
+    items : tuple
+        Values to append
+    """
+    size = len(values)
+    try:
+        values.extend(items)
+    except TypeError:
+        del values[size:]
+        values.extend(map(float, items))
+
 
 class Path:
     """
-    Builds a path serializer
+    Builds a path serializer.
+
+    Commands and coordinates are stored in compact arrays and are only
+    formatted when the path is converted into a string. The same path can be
+    reused for several renders after calling :meth:`clear`.
 
     Parameters
     ----------
@@ -27,10 +183,23 @@ class Path:
         self.digit = digits or 3
         self._x0 = self._y0 = 0  # start of current subpath
         self._x1 = self._y1 = None  # end of current subpath
-        self._string = StringIO()
+        self._commands = array("b")
+        self._values = array("d")
+        self._literals = []
+
+    def clear(self):
+        """
+        Removes all commands of the path.
+        """
+        self._x0 = self._y0 = 0
+        self._x1 = self._y1 = None
+        del self._commands[:]
+        del self._values[:]
+        self._literals.clear()
 
-    def _round(self, *values):
-        return (string_round(value, self.digit) for value in values)
+    def _literal(self, text: str):
+        self._commands.append(LITERAL)
+        self._literals.append(text)
 
     def move_to(self, x: int | float, y: int | float):
         """
@@ -43,10 +212,10 @@ class Path:
         y : int | float
             y position
         """
+        extend_values(self._values, (x, y))
         self._x0 = self._x1 = x
         self._y0 = self._y1 = y
-        x, y = self._round(x, y)
-        self._string.write(f"M{x},{y}")
+        self._commands.append(MOVE)
 
     def close_path(self):
         """
@@ -56,7 +225,7 @@ class Path:
         """
         if self._x1 is not None:
             self._x1, self._y1 = self._x0, self._y0
-            self._string.write("Z")
+            self._commands.append(CLOSE)
 
     def line_to(self, x: int | float, y: int | float):
         """
@@ -70,10 +239,10 @@ class Path:
         y : int | float
             y position
         """
+        extend_values(self._values, (x, y))
         self._x1 = x
         self._y1 = y
-        x, y = self._round(x, y)
-        self._string.write(f"L{x},{y}")
+        self._commands.append(LINE)
 
     def quadratic_curve_to(
         self, cpx: int | float, cpy: int | float, x: int | float, y: int | float
@@ -93,10 +262,10 @@ class Path:
         y : int | float
             y position
         """
+        extend_values(self._values, (cpx, cpy, x, y))
         self._x1 = x
         self._y1 = y
-        x, y, cpx, cpy = self._round(x, y, cpx, cpy)
-        self._string.write(f"Q{cpx},{cpy},{x},{y}")
+        self._commands.append(QUADRATIC)
 
     def bezier_curve_to(
         self,
@@ -127,10 +296,10 @@ class Path:
         y : int | float
             y position
         """
+        extend_values(self._values, (cpx1, cpy1, cpx2, cpy2, x, y))
         self._x1 = x
         self._y1 = y
-        x, y, cpx1, cpy1, cpx2, cpy2 = self._round(x, y, cpx1, cpy1, cpx2, cpy2)
-        self._string.write(f"C{cpx1},{cpy1},{cpx2},{cpy2},{x},{y}")
+        self._commands.append(BEZIER)
 
     def arc_to(
         self,
@@ -174,7 +343,7 @@ class Path:
         if self._x1 is None:
             self._x1 = x1
             self._y1 = y1
-            self._string.write(f"M{x1},{y1}")
+            self._literal(f"M{x1},{y1}")
 
         # Or, is (x1,y1) coincident with (x0,y0)? Do nothing.
         elif not (l01_2 > EPSILON):
@@ -186,7 +355,7 @@ class Path:
         elif not (abs(y01 * x21 - y21 * x01) > EPSILON) or not r:
             self._x1 = int(x1)
             self._y1 = int(y1)
-            self._string.write(f"L{x1},{y1}")
+            self._literal(f"L{x1},{y1}")
 
         # Otherwise, draw an arc!
         else:
@@ -203,14 +372,15 @@ class Path:
 
             # If the start tangent is not coincident with (x0,y0), line to.
             if abs(t01 - 1) > EPSILON:
-                a1, a2 = self._round(x1 + t01 * x01, y1 + t01 * y01)
-                self._string.write(f"L{a1},{a2}")
+                self._commands.append(LINE)
+                self._values.extend((x1 + t01 * x01, y1 + t01 * y01))
 
             m1 = int(y01 * x20 > x01 * y20)
             self._x1 = x1 + t21 * x21
             self._y1 = y1 + t21 * y21
-            m2, m3 = self._round(self._x1, self._y1)
-            self._string.write(f"A{r},{r},0,0,{m1},{m2},{m3}")
+            self._literal(f"A{r},{r},0,0,{m1},")
+            self._commands.append(POINT)
+            self._values.extend((self._x1, self._y1))
 
     def arc(
         self,
@@ -259,13 +429,13 @@ class Path:
 
         # Is this path empty? Move to (x0, y0).
         if self._x1 is None:
-            t1, t2 = self._round(x0, y0)
-            self._string.write(f"M{t1},{t2}")
+            self._commands.append(MOVE)
+            self._values.extend((x0, y0))
 
         # Or, is (x0,y0) not coincident with the previous point? Line to (x0,y0).
         elif abs(self._x1 - x0) > EPSILON or abs(self._y1 - y0) > EPSILON:
-            t1, t2 = self._round(x0, y0)
-            self._string.write(f"L{t1},{t2}")
+            self._commands.append(LINE)
+            self._values.extend((x0, y0))
 
         # Is this arc empty? We're done.
         if not r:
@@ -280,17 +450,15 @@ class Path:
         if da > TAU_EPSILON:
             self._x1 = x0
             self._y1 = y0
-            r, x0, y0, ddx, ddy = self._round(r, x0, y0, x - dx, y - dy)
-            self._string.write(
-                f"A{r},{r},0,1,{cw},{ddx},{ddy}A{r},{r},0,1,{cw},{x0},{y0}"
-            )
+            self._commands.append(CIRCLE)
+            self._values.extend((r, r, cw, x - dx, y - dy, r, r, cw, x0, y0))
 
         # Is this arc non-empty? Draw an arc!
         elif da > EPSILON:
             self._x1 = x + r * math.cos(a1)
             self._y1 = y + r * math.sin(a1)
-            r, x1, y1 = self._round(r, self._x1, self._y1)
-            self._string.write(f"A{r},{r},0,{int(da >= math.pi)},{cw},{x1},{y1}")
+            self._commands.append(ARC)
+            self._values.extend((r, r, int(da >= math.pi), cw, self._x1, self._y1))
 
     def rect(self, x: int | float, y: int | float, w: int | float, h: int | float):
         """
@@ -309,10 +477,133 @@ class Path:
         h : int | float
             Rectangle height
         """
+        extend_values(self._values, (x, y, w, h, w))
         self._x0 = self._x1 = x
         self._y0 = self._y1 = y
-        x, y, w, h = self._round(x, y, w, h)
-        self._string.write(f"M{x},{y}h{w}v{h}h-{w}Z")
+        self._commands.append(RECT)
+
+    def polyline(
+        self,
+        xs: Sequence[int | float],
+        ys: Sequence[int | float],
+        closed: bool = False,
+    ):
+        """
+        Creates a new subpath moving to the first point (xs[0], ys[0]) and
+        drawing straight lines through the next points. It is equivalent to
+        :meth:`move_to` followed by :meth:`line_to` for each next point but
+        all points are added at once.
+
+        Parameters
+        ----------
+        xs : Sequence[int | float]
+            x positions as a list, an :code:`array` or any object supporting
+            the buffer protocol
+        ys : Sequence[int | float]
+            y positions, with the same length as :code:`xs`
+        closed : bool
+            :code:`True` to close the subpath
+        """
+        xs = as_array(xs)
+        ys = as_array(ys)
+        n = len(xs)
+        if n != len(ys):
+            raise ValueError(
+                f"'xs' and 'ys' must have the same length (found {n} and {len(ys)})."
+            )
+        if n == 0:
+            return
+        values = array("d", bytes(16 * n))
+        values[0::2] = xs
+        values[1::2] = ys
+        self._commands.append(MOVE)
+        self._commands.frombytes(bytes([LINE]) * (n - 1))
+        self._values.extend(values)
+        self._x0 = xs[0]
+        self._y0 = ys[0]
+        if closed:
+            self._commands.append(CLOSE)
+            self._x1, self._y1 = self._x0, self._y0
+        else:
+            self._x1 = xs[-1]
+            self._y1 = ys[-1]
+
+    def polygon(self, xs: Sequence[int | float], ys: Sequence[int | float]):
+        """
+        Creates a new closed subpath through the points (xs[i], ys[i]). It is
+        equivalent to :code:`path.polyline(xs, ys, closed=True)`.
+
+        Parameters
+        ----------
+        xs : Sequence[int | float]
+            x positions as a list, an :code:`array` or any object supporting
+            the buffer protocol
+        ys : Sequence[int | float]
+            y positions, with the same length as :code:`xs`
+        """
+        self.polyline(xs, ys, closed=True)
+
+    def repeat(
+        self,
+        path: Path,
+        xs: Sequence[int | float],
+        ys: Sequence[int | float],
+    ):
+        """
+        Appends a copy of :code:`path` translated by (xs[i], ys[i]) for each
+        point. It is equivalent to drawing the commands of :code:`path` once
+        per point with coordinates shifted by the point position, but copies
+        are built in bulk.
+
+        Parameters
+        ----------
+        path : Path
+            Path to copy, which cannot contain arcs drawn by :meth:`arc_to`
+        xs : Sequence[int | float]
+            x translations
+        ys : Sequence[int | float]
+            y translations, with the same length as :code:`xs`
+        """
+        if path._literals:
+            raise ValueError("Paths containing 'arc_to' segments cannot be repeated.")
+        xs = as_array(xs)
+        ys = as_array(ys)
+        n = len(xs)
+        if n != len(ys):
+            raise ValueError(
+                f"'xs' and 'ys' must have the same length (found {n} and {len(ys)})."
+            )
+        if n == 0 or not path._commands:
+            return
+        kinds = [kind for code in path._commands for kind in COORDINATES[code]]
+        stride = len(kinds)
+        values = path._values * n
+        for k, (value, kind) in enumerate(zip(path._values, kinds)):
+            if kind:
+                offsets = xs if kind == 1 else ys
+                values[k::stride] = array("d", map(value.__add__, offsets))
+        self._commands.extend(path._commands * n)
+        self._values.extend(values)
+        if path._x1 is not None:
+            self._x0 = path._x0 + xs[-1]
+            self._y0 = path._y0 + ys[-1]
+            self._x1 = path._x1 + xs[-1]
+            self._y1 = path._y1 + ys[-1]
 
     def __str__(self) -> str:
-        return self._string.getvalue()
+        commands = self._commands
+        values = self._values
+        digit = self.digit
+        if not self._literals and is_fixed(values, digit):
+            templates, zeros = fixed_templates(digit)
+            text = "".join(map(templates.__getitem__, commands)) % tuple(values)
+            text = NEGATIVE_ZERO.sub("0", zeros.sub("", text))
+            return text.replace(RECT_MINUS, "-") if RECT in commands else text
+        literals = iter(self._literals)
+        template = "".join(
+            [
+                next(literals) if code == LITERAL else TEMPLATES[code]
+                for code in commands
+            ]
+        )
+        return template % tuple(string_round(value, digit) for value in values)
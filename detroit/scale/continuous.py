@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from bisect import bisect
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime
-from math import isnan, nan
+from math import inf, isnan, nan
+from operator import le
 from typing import Any, overload
 
 from ..interpolate import (
@@ -15,6 +16,7 @@ from ..interpolate import (
 )
 from ..types import IntoFloat, Number, T
 from .abc import ContinuousScaler
+from .tick_cache import TickCache
 from .utils import as_float, constant, identity
 
 
@@ -81,6 +83,81 @@ def clamper(a: IntoFloat, b: IntoFloat) -> Callable[[IntoFloat], float]:
     return clamp
 
 
+def linear_map(
+    domain: list[IntoFloat],
+    range_vals: list[Number],
+    bounds: tuple[float, float] | None = None,
+) -> Callable[[IntoFloat], float]:
+    """
+    Makes a function equivalent to :code:`BiMap(domain, range_vals,
+    interpolate_number)` in a single closure. Values are first clamped
+    between :code:`bounds` when specified. The arithmetic of
+    :func:`normalize` and :func:`interpolate_number
+    <detroit.interpolate_number>` is kept so that results are identical.
+
+    Parameters
+    ----------
+    domain : list[IntoFloat]
+        Two values of the domain
+    range_vals : list[Number]
+        Two numbers of the range
+    bounds : tuple[float, float] | None
+        Lower and upper bounds of input values
+
+    Returns
+    -------
+    Callable[[IntoFloat], float]
+        Mapping function
+    """
+    d0, d1 = domain[0], domain[1]
+    r0, r1 = range_vals[0], range_vals[1]
+    if d1 < d0:  # type: ignore
+        d0, d1 = d1, d0
+        r0, r1 = r1, r0
+    a = as_float(d0)
+    span = as_float(d1) - a
+    r0 = float(r0)
+    r1 = float(r1)
+
+    if isnan(span) or span == 0:
+        t = nan if isnan(span) else 0.5
+        return constant(r0 * (1 - t) + r1 * t)
+
+    if bounds is None:
+
+        def scale(x):
+            if type(x) is not float:
+                x = as_float(x)
+            t = (x - a) / span
+            return r0 * (1 - t) + r1 * t
+
+        return scale
+
+    lo, hi = bounds
+
+    def scale_clamped(x):
+        if type(x) is not float:
+            x = as_float(x)
+        # Same as `max(lo, min(hi, x))`, which returns `hi` for NaN values
+        if x < lo:
+            x = lo
+        elif x > hi or isnan(x):
+            x = hi
+        t = (x - a) / span
+        return r0 * (1 - t) + r1 * t
+
+    return scale_clamped
+
+
+def is_number(x: Any) -> bool:
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+# Minimal number of segments for which index arithmetic is faster than the
+# binary search of `bisect`
+UNIFORM_MIN_SEGMENTS = 256
+
+
 class BiMap:
     def __init__(
         self,
@@ -102,6 +179,13 @@ class BiMap:
 
 
 class PolyMap:
+    """
+    Piecewise mapping between a domain and a range of the same length.
+
+    When the domain has many evenly spaced numbers, the segment of a value
+    is found by index arithmetic instead of a binary search.
+    """
+
     def __init__(
         self,
         domain: list[IntoFloat],
@@ -121,10 +205,111 @@ class PolyMap:
             self.d.append(normalize(self.domain[i], self.domain[i + 1]))
             self.r.append(interpolate(range_vals[i], range_vals[i + 1]))
 
+        self.start = self.scale = None
+        breakpoints = self.domain[: j + 1]
+        try:
+            self.monotonic = all(map(le, breakpoints, breakpoints[1:]))
+        except TypeError:
+            self.monotonic = False
+        if j >= UNIFORM_MIN_SEGMENTS and all(map(is_number, breakpoints)):
+            start = breakpoints[0]
+            step = (breakpoints[-1] - start) / j
+            tolerance = abs(step) * 1e-9
+            if step > 0 and all(
+                abs(x - (start + k * step)) <= tolerance
+                for k, x in enumerate(breakpoints)
+            ):
+                self.start = start
+                self.scale = 1 / step
+
+    def index(self, x: IntoFloat) -> int:
+        """
+        Returns the index of the segment of :code:`x`, as
+        :code:`bisect(domain, x, 1, j) - 1` does.
+
+        Parameters
+        ----------
+        x : IntoFloat
+            Input value
+
+        Returns
+        -------
+        int
+            Index of the segment
+        """
+        if self.scale is None:
+            return bisect(self.domain, x, 1, self.j) - 1  # type: ignore
+        t = (x - self.start) * self.scale  # type: ignore
+        if not 0 <= t < self.j:
+            # Outside of the domain, infinite or NaN
+            return bisect(self.domain, x, 1, self.j) - 1  # type: ignore
+        last = self.j - 1
+        i = min(int(t), last)
+        # The estimation is corrected with the breakpoints themselves to
+        # match the binary search
+        domain = self.domain
+        while i < last and x >= domain[i + 1]:  # type: ignore
+            i += 1
+        while i > 0 and x < domain[i]:  # type: ignore
+            i -= 1
+        return i
+
     def __call__(self, x: IntoFloat) -> float:
-        i = bisect(self.domain, x, 1, self.j) - 1  # type: ignore
+        scale = self.scale
+        if scale is None:
+            i = bisect(self.domain, x, 1, self.j) - 1  # type: ignore
+        else:
+            t = (x - self.start) * scale  # type: ignore
+            domain = self.domain
+            if 0 <= t < self.j:
+                i = int(t)
+                if not domain[i] <= x < domain[i + 1]:  # type: ignore
+                    i = self.index(x)
+            else:
+                i = self.index(x)
         return self.r[i](self.d[i](x))
 
+    def map_many(self, values: Iterable[IntoFloat | None], unknown: Any = None) -> list:
+        """
+        Maps values, keeping the segment of the previous value while values
+        stay in it: when values are sorted, segments are searched only when
+        values move to the next segments. :code:`None` values are mapped to
+        :code:`unknown`. When breakpoints are not sorted, each value is
+        mapped as :meth:`__call__` does.
+
+        Parameters
+        ----------
+        values : Iterable[IntoFloat | None]
+            Input values
+        unknown : Any
+            Output of :code:`None` values
+
+        Returns
+        -------
+        list
+            Output values
+        """
+        if not self.monotonic:
+            return [unknown if x is None else self(x) for x in values]
+        domain = self.domain
+        j = self.j
+        d = self.d
+        r = self.r
+        i = 0
+        low = -inf
+        high = domain[1] if j > 1 else inf
+        outputs = []
+        for x in values:
+            if x is None:
+                outputs.append(unknown)
+                continue
+            if not low <= x < high:  # type: ignore
+                i = bisect(domain, x, 1, j) - 1  # type: ignore
+                low = domain[i] if i > 0 else -inf
+                high = domain[i + 1] if i < j - 1 else inf
+            outputs.append(r[i](d[i](x)))
+        return outputs
+
 
 def copy(source, target):
     return (
@@ -136,7 +321,7 @@ def copy(source, target):
     )
 
 
-class Transformer(ContinuousScaler[Number | datetime, T]):
+class Transformer(ContinuousScaler[Number | datetime, T], TickCache):
     """
     Continuous transformation
 
@@ -162,6 +347,8 @@ class Transformer(ContinuousScaler[Number | datetime, T]):
         self._unknown = None
         self._input = None
         self._output = None
+        self._linear = None
+        self._linear_inverse = None
         self._rescale()
 
     def _rescale(self) -> Transformer:
@@ -172,12 +359,44 @@ class Transformer(ContinuousScaler[Number | datetime, T]):
         * :code:`piecewise` attribute
         * :code:`input` attribute
         * :code:`output` attribute
+        * :code:`linear` attribute, a fused mapping used instead of the
+          piecewise mappings when the domain and the range have two numbers,
+          without transform and with a number interpolator
+
+        Cached ticks and tick formats are dropped.
         """
+        self._invalidate_ticks()
         n = min(len(self._domain), len(self._range))
         if self._clamp != identity:
             self._clamp = clamper(self._domain[0], self._domain[n - 1])
         self.piecewise = PolyMap if n > 2 else BiMap
         self._output = self._input = None
+        self._linear = self._linear_inverse = None
+        if (
+            n == 2
+            and self._transform is identity
+            and self._untransform is identity
+            and self._interpolate in (interpolate_value, interpolate_number)
+            and all(is_number(x) or isinstance(x, datetime) for x in self._domain[:2])
+            and all(map(is_number, self._range[:2]))
+        ):
+            domain = self._transformed_domain()
+            bounds = None
+            if self._clamp != identity:
+                d0, d1 = as_float(domain[0]), as_float(domain[1])
+                bounds = (min(d0, d1), max(d0, d1))
+            self._linear = linear_map(domain, self._range, bounds)
+            inverse = linear_map(self._range, domain)
+            if bounds is None:
+                self._linear_inverse = inverse
+            else:
+                lo, hi = bounds
+
+                def inverse_clamped(y):
+                    x = inverse(y)
+                    return lo if x < lo else hi if x > hi or isnan(x) else x
+
+                self._linear_inverse = inverse_clamped
         return self
 
     def __call__(self, x: Number | datetime) -> T:
@@ -197,15 +416,80 @@ class Transformer(ContinuousScaler[Number | datetime, T]):
         """
         if x is None or (isinstance(x, float) and isnan(x)):
             return self._unknown  # type: ignore
+        elif self._linear is not None:
+            return self._linear(x)  # type: ignore
         else:
-            if not self._output:
-                domain = [
-                    x.timestamp() if isinstance(x, datetime) else x
-                    for x in self._domain
-                ]
-                domain = [self._transform(x) for x in domain]
-                self._output = self.piecewise(domain, self._range, self._interpolate)  # type: ignore
-            return self._output(self._transform(self._clamp(x)))  # type: ignore
+            return self._get_output()(self._transform(self._clamp(x)))  # type: ignore
+
+    def _transformed_domain(self) -> list[float]:
+        domain = [x.timestamp() if isinstance(x, datetime) else x for x in self._domain]
+        return [self._transform(x) for x in domain]
+
+    def _get_output(self) -> Callable[[float], T]:
+        if not self._output:
+            self._output = self.piecewise(
+                self._transformed_domain(), self._range, self._interpolate
+            )  # type: ignore
+        return self._output  # type: ignore
+
+    def _get_input(self) -> Callable[[T], float]:
+        if not self._input:
+            self._input = self.piecewise(
+                self._range, self._transformed_domain(), interpolate_number
+            )  # type: ignore
+        return self._input  # type: ignore
+
+    def map_many(self, values: Iterable[Number | datetime]) -> list[T]:
+        """
+        Returns the values of the range corresponding to the given values of
+        the domain, as :code:`[scale(x) for x in values]` would. The
+        interpolators, the clamp and the transform are looked up once for all
+        values.
+
+        Parameters
+        ----------
+        values : Iterable[Number | datetime]
+            Input values, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[T]
+            Corresponding values from the range
+
+        Examples
+        --------
+
+        >>> d3.scale_linear([0, 10], [0, 100]).map_many([1, 2.5, 10])
+        [10.0, 25.0, 100.0]
+        """
+        unknown = self._unknown
+        if self._linear is not None:
+            scale = self._linear
+        else:
+            output = self._get_output()
+            transform = self._transform
+            clamp = self._clamp
+            if isinstance(output, PolyMap):
+                return output.map_many(
+                    (
+                        None
+                        if x is None or (isinstance(x, float) and isnan(x))
+                        else transform(clamp(x))
+                        for x in values
+                    ),
+                    unknown,
+                )
+            if transform is identity and clamp is identity:
+                scale = output
+            else:
+
+                def scale(x):
+                    return output(transform(clamp(x)))
+
+        return [
+            unknown if x is None or (isinstance(x, float) and isnan(x)) else scale(x)
+            for x in values
+        ]
 
     def invert(self, y: T) -> Number:
         """
@@ -223,13 +507,36 @@ class Transformer(ContinuousScaler[Number | datetime, T]):
         Number
             Corresponding value from the domain
         """
-        if not self._input:
-            domain = [
-                x.timestamp() if isinstance(x, datetime) else x for x in self._domain
-            ]
-            domain = [self._transform(x) for x in domain]
-            self._input = self.piecewise(self._range, domain, interpolate_number)  # type: ignore
-        return self._clamp(self._untransform(self._input(y)))  # type: ignore
+        if self._linear_inverse is not None:
+            return self._linear_inverse(y)  # type: ignore
+        return self._clamp(self._untransform(self._get_input()(y)))  # type: ignore
+
+    def invert_many(self, values: Iterable[T]) -> list[Number]:
+        """
+        Returns the values of the domain corresponding to the given values of
+        the range, as :code:`[scale.invert(y) for y in values]` would.
+
+        Parameters
+        ----------
+        values : Iterable[T]
+            Values from the range, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[Number]
+            Corresponding values from the domain
+        """
+        if self._linear_inverse is not None:
+            return list(map(self._linear_inverse, values))
+        inverse = self._get_input()
+        untransform = self._untransform
+        clamp = self._clamp
+        if isinstance(inverse, PolyMap):
+            values = inverse.map_many(values)
+            inverse = identity
+        if untransform is identity and clamp is identity:
+            return list(map(inverse, values))
+        return [clamp(untransform(inverse(y))) for y in values]
 
     @overload
     def set_domain(self, domain: list[int | float]) -> Transformer[T]: ...
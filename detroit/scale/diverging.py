@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from typing import Any, overload
 
@@ -12,7 +12,12 @@ from .init import init_interpolator
 from .linear import LinearBase
 from .log import LogBase, logp, powp, reflect, transform_log, transform_logn
 from .pow import transform_pow, transform_sqrt
-from .sequential import copy
+from .sequential import (
+    check_quantization,
+    copy,
+    lookup_table,
+    quantize_interpolator,
+)
 from .symlog import transform_symlog
 
 
@@ -47,6 +52,8 @@ class Diverging:
         self._interpolator = identity
         self._clamp = False
         self._unknown = None
+        self._quantization = None
+        self._quantized = None
 
     def __call__(self, x: Number) -> float:
         """
@@ -62,13 +69,49 @@ class Diverging:
         T
             Corresponding value from the range
         """
-        if isinstance(x, float) and math.isnan(x):
+        if x is None or (isinstance(x, float) and math.isnan(x)):
             return self._unknown
         else:
             x = self._transform(x)
             k = self._k10 if self._s * x < self._s * self._t1 else self._k21
             x = 0.5 + (x - self._t1) * k
-            return self._interpolator(max(0, min(1, x)) if self._clamp else x)
+            interpolator = self._output_interpolator()
+            return interpolator(max(0, min(1, x)) if self._clamp else x)
+
+    def map_many(self, values: Iterable[Number]) -> list[T]:
+        """
+        Returns the values of the range corresponding to the given values of
+        the domain, as :code:`[scale(x) for x in values]` would. The domain
+        and the interpolator are looked up once for all values.
+
+        Parameters
+        ----------
+        values : Iterable[Number]
+            Input values, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[T]
+            Corresponding values from the range
+        """
+        transform = self._transform
+        interpolator = self._output_interpolator()
+        unknown = self._unknown
+        clamp = self._clamp
+        t1 = self._t1
+        k10 = self._k10
+        k21 = self._k21
+        s = self._s
+        st1 = s * t1
+        outputs = []
+        for x in values:
+            if x is None or (isinstance(x, float) and math.isnan(x)):
+                outputs.append(unknown)
+                continue
+            x = transform(x)
+            x = 0.5 + (x - t1) * (k10 if s * x < st1 else k21)
+            outputs.append(interpolator(max(0, min(1, x)) if clamp else x))
+        return outputs
 
     def set_domain(self, domain: list[Number]) -> Diverging:
         """
@@ -204,6 +247,69 @@ class Diverging:
     def get_unknown(self) -> Any:
         return self._unknown
 
+    def set_quantization(self, n: int | None) -> Diverging:
+        """
+        Enables or disables the lookup table mode. When :code:`n` is an
+        integer, :code:`n` outputs of the interpolator are precomputed for
+        evenly spaced values of :code:`[0, 1]` (see :meth:`to_lut`) and each
+        input is mapped to the output of the nearest one.
+
+        The output is exact for inputs whose normalized position
+        :code:`t` is :code:`k / (n - 1)`; otherwise the position is off by at
+        most :code:`1 / (2 * (n - 1))`. An odd :code:`n` keeps the midpoint
+        of the domain exact. Positions outside of :code:`[0, 1]` (when the
+        scale is not clamped) still call the interpolator. The table is
+        rebuilt after the interpolator or the range changes.
+
+        Parameters
+        ----------
+        n : int | None
+            Number of precomputed outputs, at least :code:`2`, or
+            :code:`None` to call the interpolator for each input
+
+        Returns
+        -------
+        Diverging
+            Itself
+        """
+        if n is not None:
+            check_quantization(n)
+        self._quantization = n
+        self._quantized = None
+        return self
+
+    def get_quantization(self) -> int | None:
+        return self._quantization
+
+    def to_lut(self, n: int) -> list[T]:
+        """
+        Returns the :code:`n` outputs of the interpolator for evenly spaced
+        values of :code:`[0, 1]`, from the start to the end of the range.
+
+        Parameters
+        ----------
+        n : int
+            Number of outputs, at least :code:`2`
+
+        Returns
+        -------
+        list[T]
+            Lookup table
+        """
+        return lookup_table(self._interpolator, n)
+
+    def _output_interpolator(self) -> Callable[[float], T]:
+        if self._quantization is None:
+            return self._interpolator
+        quantized = self._quantized
+        if quantized is None or quantized[0] is not self._interpolator:
+            interpolator = self._interpolator
+            quantized = self._quantized = (
+                interpolator,
+                quantize_interpolator(interpolator, self._quantization),
+            )
+        return quantized[1]
+
     def __str__(self) -> str:
         name = self.__class__.__name__
         attrbs = ["domain", "range"]
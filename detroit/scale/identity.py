@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable
 from typing import Any, Generic
 
 from ..types import T
@@ -49,6 +50,44 @@ class Identity(LinearBase, Generic[T]):
         """
         return self(x)
 
+    def map_many(self, values: Iterable[T]) -> list[T]:
+        """
+        Returns the given values, replacing invalid values by the unknown
+        value, as :code:`[scale(x) for x in values]` would.
+
+        Parameters
+        ----------
+        values : Iterable[T]
+            Input values, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[T]
+            Input values if valid type
+        """
+        unknown = self._unknown
+        return [
+            unknown if x is None or (isinstance(x, float) and math.isnan(x)) else x
+            for x in values
+        ]
+
+    def invert_many(self, values: Iterable[T]) -> list[T]:
+        """
+        Returns the given values, replacing invalid values by the unknown
+        value, as :code:`[scale.invert(x) for x in values]` would.
+
+        Parameters
+        ----------
+        values : Iterable[T]
+            Input values, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[T]
+            Input values if valid type
+        """
+        return self.map_many(values)
+
     def set_domain(self, domain: list[T]) -> Identity:
         """
         Sets the scale’s domain
@@ -8,10 +8,12 @@ from ..types import Number, T
 from .abc import Scaler
 from .continuous import Transformer, copy
 from .init import init_range
+from .tick_cache import TickCache, cached_ticks
 from .tick_format import tick_format
 
 
-class LinearBase(Scaler[Number, T]):
+class LinearBase(Scaler[Number, T], TickCache):
+    @cached_ticks
     def ticks(self, count: int | None = None) -> list[Number]:
         """
         Returns approximately count representative values
@@ -34,6 +36,7 @@ class LinearBase(Scaler[Number, T]):
         d = self.get_domain()
         return ticks(d[0], d[-1], count if count is not None else 10)
 
+    @cached_ticks
     def tick_format(
         self, count: int | None = None, specifier: str | None = None
     ) -> Callable[[Number], str]:
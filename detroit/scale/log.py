@@ -6,11 +6,12 @@ from datetime import datetime
 from typing import overload
 
 from ..array import ticks
-from ..format import format_specifier, locale_format
+from ..format import default_locale, format_specifier
 from ..types import Number
 from .continuous import Transformer, copy
 from .init import init_range
 from .nice import nice
+from .tick_cache import TickCache, cached_ticks
 
 
 def transform_log(x: datetime | float) -> float:
@@ -70,7 +71,7 @@ def reflect(f: Callable[[float], float]) -> Callable[[float], float]:
     return local_reflect
 
 
-class LogBase:
+class LogBase(TickCache):
     """
     Logarithmic ("log") scales are like linear scales except that
     a logarithmic transform is applied to the input domain value
@@ -99,11 +100,13 @@ class LogBase:
             Itself
         """
         self._base = float(base)
+        self._invalidate_ticks()
         return self._log_rescale()
 
     def get_base(self) -> Number:
         return self._base
 
+    @cached_ticks
     def ticks(self, count: int | None = None) -> LogBase:
         """
         Like :code:`ScaleLinear.ticks`, but customized for a log scale.
@@ -161,6 +164,7 @@ class LogBase:
             z = list(map(self._pows, ticks(i, j, min(j - i, n))))
         return z[::-1] if r else z
 
+    @cached_ticks
     def tick_format(
         self, count: int | None = None, specifier: str | None = None
     ) -> LogBase:
@@ -195,7 +199,7 @@ class LogBase:
                 and specifier_obj.precision is None
             ):
                 specifier_obj.trim = True
-            specifier = locale_format(specifier_obj or specifier)
+            specifier = default_locale.locale.format(specifier_obj or specifier)
         if math.isinf(count):
             return specifier
         k = max(1, self._base * count / len(self.ticks()))
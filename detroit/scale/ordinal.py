@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any, overload
 
 from ..types import U, V
@@ -49,6 +50,35 @@ class ScaleOrdinal(Scaler[U, V]):
             return None
         return self._range_vals[index]
 
+    def map_many(self, values: Iterable[U]) -> list[V]:
+        """
+        Returns the values of the range corresponding to the given values of
+        the domain, as :code:`[scale(d) for d in values]` would. Values missing
+        from the domain are handled as in :meth:`__call__`.
+
+        Parameters
+        ----------
+        values : Iterable[U]
+            Input values
+
+        Returns
+        -------
+        list[V]
+            Corresponding values from the range
+        """
+        index = self._index
+        range_vals = self._range_vals
+        length = len(range_vals)
+        outputs = []
+        for d in values:
+            i = index.get(d)
+            if i is None or not length:
+                # Unknown value or implicit domain extension
+                outputs.append(self(d))
+            else:
+                outputs.append(range_vals[i % length])
+        return outputs
+
     def set_domain(self, domain: list[U]) -> ScaleOrdinal:
         """
         Sets the scale’s domain to the specified array of values.
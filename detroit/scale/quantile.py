@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 from bisect import bisect
+from collections.abc import Iterable
 from statistics import quantiles
 from typing import Any, Generic, overload
 
@@ -50,6 +51,32 @@ class ScaleQuantile(Generic[T]):
             return self._unknown
         return self._range_vals[bisect(self._thresholds, x)]
 
+    def map_many(self, values: Iterable[Number]) -> list[T]:
+        """
+        Returns the values of the range corresponding to the given values of
+        the domain, as :code:`[scale(x) for x in values]` would. The quantile
+        thresholds are looked up once for all values.
+
+        Parameters
+        ----------
+        values : Iterable[Number]
+            Input values, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[T]
+            Corresponding values from the range
+        """
+        thresholds = self._thresholds
+        range_vals = self._range_vals
+        unknown = self._unknown
+        return [
+            unknown
+            if x is None or (isinstance(x, float) and math.isnan(x))
+            else range_vals[bisect(thresholds, x)]
+            for x in values
+        ]
+
     def invert_extent(self, y: T) -> Number:
         """
         Returns the extent of values in the domain :math:`[x_0, x_1]`
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 from bisect import bisect
+from collections.abc import Iterable
 from typing import Any, Generic, overload
 
 from ..types import Number, T
@@ -38,6 +39,33 @@ class ScaleQuantize(LinearBase, Generic[T]):
         else:
             return self._unknown
 
+    def map_many(self, values: Iterable[Number]) -> list[T]:
+        """
+        Returns the values of the range corresponding to the given values of
+        the domain, as :code:`[scale(x) for x in values]` would. The thresholds
+        are looked up once for all values.
+
+        Parameters
+        ----------
+        values : Iterable[Number]
+            Input values, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[T]
+            Corresponding values from the range
+        """
+        domain = self._domain
+        range_vals = self._range_vals
+        unknown = self._unknown
+        n = self._n
+        return [
+            unknown
+            if x is None or math.isnan(x)
+            else range_vals[bisect(domain, x, 0, n)]
+            for x in values
+        ]
+
     def rescale(self):
         x0, x1 = self._x0, self._x1
         n = self._n
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import overload
 
 from ..types import Number
@@ -90,6 +90,49 @@ class ScaleRadial(Transformer[float], LinearBase):
         """
         return super().invert(square(y))
 
+    def map_many(self, values: Iterable[Number]) -> list[Number]:
+        """
+        Returns the values of the range corresponding to the given values of
+        the domain, as :code:`[scale(x) for x in values]` would.
+
+        Parameters
+        ----------
+        values : Iterable[Number]
+            Input values, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[Number]
+            Corresponding values from the range
+        """
+        unknown = self._unknown
+        rounded = self._round
+        outputs = []
+        for y in super().map_many(values):
+            y = unsquare(y)
+            if isinstance(y, float) and math.isnan(y):
+                outputs.append(unknown)
+            else:
+                outputs.append(round(y) if rounded else y)
+        return outputs
+
+    def invert_many(self, values: Iterable[Number]) -> list[Number]:
+        """
+        Returns the values of the domain corresponding to the given values of
+        the range, as :code:`[scale.invert(y) for y in values]` would.
+
+        Parameters
+        ----------
+        values : Iterable[Number]
+            Values from the range, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[Number]
+            Corresponding values from the domain
+        """
+        return super().invert_many(map(square, values))
+
     def set_range(self, range_vals: list[Number]) -> ScaleRadial:
         """
         Sets the scale's range to the specified array of values
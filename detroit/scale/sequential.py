@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from typing import Any, TypeVar, overload
 
@@ -18,6 +18,65 @@ from .symlog import transform_symlog
 T = TypeVar("T", bound=int | float | str | datetime)
 
 
+def check_quantization(n: int):
+    if isinstance(n, bool) or not isinstance(n, int) or n < 2:
+        raise ValueError(f"Invalid quantization: {n!r}")
+
+
+def lookup_table(interpolator: Callable[[float], T], n: int) -> list[T]:
+    """
+    Returns the outputs of :code:`interpolator` for :code:`n` evenly spaced
+    values of :code:`[0, 1]`, from :code:`0` to :code:`1` included.
+
+    Parameters
+    ----------
+    interpolator : Callable[[float], T]
+        Interpolator function
+    n : int
+        Number of outputs, at least :code:`2`
+
+    Returns
+    -------
+    list[T]
+        Outputs of the interpolator
+    """
+    check_quantization(n)
+    m = n - 1
+    return [interpolator(i / m) for i in range(n)]
+
+
+def quantize_interpolator(
+    interpolator: Callable[[float], T], n: int
+) -> Callable[[float], T]:
+    """
+    Returns an interpolator which maps values of :code:`[0, 1]` to the output
+    of the nearest of :code:`n` evenly spaced values, precomputed by
+    :func:`lookup_table`. Other values, such as values outside of
+    :code:`[0, 1]` or NaN, are passed to :code:`interpolator`.
+
+    Parameters
+    ----------
+    interpolator : Callable[[float], T]
+        Interpolator function
+    n : int
+        Number of precomputed outputs, at least :code:`2`
+
+    Returns
+    -------
+    Callable[[float], T]
+        Quantized interpolator
+    """
+    table = lookup_table(interpolator, n)
+    m = n - 1
+
+    def quantized(t: float) -> T:
+        if 0 <= t <= 1:
+            return table[int(t * m + 0.5)]
+        return interpolator(t)
+
+    return quantized
+
+
 class Sequential(SequentialScaler[Number, T]):
     """
     Sequential transformation
@@ -38,6 +97,8 @@ class Sequential(SequentialScaler[Number, T]):
         self._interpolator = identity
         self._clamp = False
         self._unknown = None
+        self._quantization = None
+        self._quantized = None
 
     def __call__(self, x: Number) -> T:
         """
@@ -61,7 +122,50 @@ class Sequential(SequentialScaler[Number, T]):
             x = (self._transform(x) - self._t0) * self._k10
             if self._clamp:
                 x = max(0, min(1, x))
-        return self._interpolator(x)
+        return self._output_interpolator()(x)
+
+    def map_many(self, values: Iterable[Number]) -> list[T]:
+        """
+        Returns the values of the range corresponding to the given values of
+        the domain, as :code:`[scale(x) for x in values]` would. The domain
+        and the interpolator are looked up once for all values.
+
+        Parameters
+        ----------
+        values : Iterable[Number]
+            Input values, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[T]
+            Corresponding values from the range
+        """
+        interpolator = self._output_interpolator()
+        unknown = self._unknown
+        if self._k10 == 0:
+            middle = interpolator(0.5)
+            return [
+                unknown
+                if x is None or (isinstance(x, float) and math.isnan(x))
+                else middle
+                for x in values
+            ]
+        transform = self._transform
+        t0 = self._t0
+        k10 = self._k10
+        if self._clamp:
+            return [
+                unknown
+                if x is None or (isinstance(x, float) and math.isnan(x))
+                else interpolator(max(0, min(1, (transform(x) - t0) * k10)))
+                for x in values
+            ]
+        return [
+            unknown
+            if x is None or (isinstance(x, float) and math.isnan(x))
+            else interpolator((transform(x) - t0) * k10)
+            for x in values
+        ]
 
     def set_domain(self, domain: list[Number]) -> Sequential:
         """
@@ -191,6 +295,68 @@ class Sequential(SequentialScaler[Number, T]):
     def get_unknown(self) -> Any:
         return self._unknown
 
+    def set_quantization(self, n: int | None) -> Sequential:
+        """
+        Enables or disables the lookup table mode. When :code:`n` is an
+        integer, :code:`n` outputs of the interpolator are precomputed for
+        evenly spaced values of :code:`[0, 1]` (see :meth:`to_lut`) and each
+        input is mapped to the output of the nearest one.
+
+        The output is exact for inputs whose normalized position
+        :code:`t` is :code:`k / (n - 1)`; otherwise the position is off by at
+        most :code:`1 / (2 * (n - 1))`. Positions outside of :code:`[0, 1]`
+        (when the scale is not clamped) still call the interpolator. The table
+        is rebuilt after the interpolator or the range changes.
+
+        Parameters
+        ----------
+        n : int | None
+            Number of precomputed outputs, at least :code:`2`, or
+            :code:`None` to call the interpolator for each input
+
+        Returns
+        -------
+        Sequential
+            Itself
+        """
+        if n is not None:
+            check_quantization(n)
+        self._quantization = n
+        self._quantized = None
+        return self
+
+    def get_quantization(self) -> int | None:
+        return self._quantization
+
+    def to_lut(self, n: int) -> list[T]:
+        """
+        Returns the :code:`n` outputs of the interpolator for evenly spaced
+        values of :code:`[0, 1]`, from the start to the end of the range.
+
+        Parameters
+        ----------
+        n : int
+            Number of outputs, at least :code:`2`
+
+        Returns
+        -------
+        list[T]
+            Lookup table
+        """
+        return lookup_table(self._interpolator, n)
+
+    def _output_interpolator(self) -> Callable[[float], T]:
+        if self._quantization is None:
+            return self._interpolator
+        quantized = self._quantized
+        if quantized is None or quantized[0] is not self._interpolator:
+            interpolator = self._interpolator
+            quantized = self._quantized = (
+                interpolator,
+                quantize_interpolator(interpolator, self._quantization),
+            )
+        return quantized[1]
+
     def __str__(self) -> str:
         name = self.__class__.__name__
         attrbs = ["domain", "range"]
@@ -210,6 +376,7 @@ def copy(source, target):
         .set_interpolator(source.get_interpolator())
         .set_clamp(source.get_clamp())
         .set_unknown(source.get_unknown())
+        .set_quantization(source.get_quantization())
     )
 
 
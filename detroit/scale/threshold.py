@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 from bisect import bisect
+from collections.abc import Iterable
 from typing import Any, Generic, overload
 
 from ..types import T
@@ -43,6 +44,33 @@ class ScaleThreshold(Generic[T]):
         else:
             return self._unknown
 
+    def map_many(self, values: Iterable[int | float | None]) -> list[T]:
+        """
+        Returns the values of the range corresponding to the given values of
+        the domain, as :code:`[scale(x) for x in values]` would. The thresholds
+        are looked up once for all values.
+
+        Parameters
+        ----------
+        values : Iterable[int | float | None]
+            Input values, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[T]
+            Corresponding values from the range
+        """
+        domain = self._domain
+        range_vals = self._range_vals
+        unknown = self._unknown
+        n = self._n
+        return [
+            unknown
+            if x is None or (isinstance(x, float) and math.isnan(x))
+            else range_vals[bisect(domain, x, 0, n)]
+            for x in values
+        ]
+
     def set_domain(self, domain: list[int | float]) -> ScaleThreshold:
         """
         Sets the scale’s domain to the specified array of values.
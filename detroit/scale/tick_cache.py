@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import wraps
+from typing import NamedTuple, TypeVar
+
+from ..format import default_locale
+
+F = TypeVar("F", bound=Callable)
+
+TICK_CACHE_MAXSIZE = 32
+
+
+class TickCacheInfo(NamedTuple):
+    """
+    Statistics of the tick cache of a scale.
+
+    Attributes
+    ----------
+    hits : int
+        Number of calls answered by the cache
+    misses : int
+        Number of calls which computed their result
+    currsize : int
+        Number of results currently stored
+    """
+
+    hits: int
+    misses: int
+    currsize: int
+
+
+class TickCache:
+    """
+    Memoizes the results of methods decorated by :func:`cached_ticks`, such
+    as :code:`ticks` and :code:`tick_format`. Results are keyed on the
+    domain of the scale, the arguments of the call and the default number
+    locale; they are dropped each time the domain, the range or the
+    parameters of the scale change.
+    """
+
+    _tick_cache = None
+    _tick_hits = 0
+    _tick_misses = 0
+
+    def tick_cache_info(self) -> TickCacheInfo:
+        """
+        Returns statistics about the cached ticks and tick formats.
+
+        Returns
+        -------
+        TickCacheInfo
+            Named tuple :code:`(hits, misses, currsize)`
+        """
+        cache = self._tick_cache
+        return TickCacheInfo(
+            self._tick_hits, self._tick_misses, 0 if cache is None else len(cache)
+        )
+
+    def tick_cache_clear(self):
+        """
+        Removes cached ticks and tick formats and resets the statistics.
+        """
+        self._tick_cache = None
+        self._tick_hits = self._tick_misses = 0
+
+    def _invalidate_ticks(self):
+        self._tick_cache = None
+
+
+def cached_ticks(method: F) -> F:
+    """
+    Decorates a method of a :class:`TickCache` scale such that its results
+    are memoized. Lists are copied before being returned since callers may
+    modify them.
+
+    Parameters
+    ----------
+    method : F
+        Method computing ticks or a tick format
+
+    Returns
+    -------
+    F
+        Memoized method
+    """
+
+    @wraps(method)
+    def cached(self, *args, **kwargs):
+        key = (
+            method.__name__,
+            tuple(self.get_domain()),
+            args,
+            tuple(sorted(kwargs.items())),
+            default_locale.locale,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        cache = self._tick_cache
+        if cache is None:
+            cache = self._tick_cache = {}
+        if key in cache:
+            self._tick_hits += 1
+            value = cache[key]
+        else:
+            self._tick_misses += 1
+            value = method(self, *args, **kwargs)
+            if len(cache) >= TICK_CACHE_MAXSIZE:
+                del cache[next(iter(cache))]
+            cache[key] = value
+        return value.copy() if isinstance(value, list) else value
+
+    return cached
@@ -3,9 +3,8 @@ from collections.abc import Callable
 
 from ..array import tick_step
 from ..format import (
-    format_prefix,
+    default_locale,
     format_specifier,
-    locale_format,
     precision_fixed,
     precision_prefix,
     precision_round,
@@ -43,7 +42,7 @@ def tick_format(
             precision := precision_prefix(step, value)
         ):
             specifier.precision = precision
-        return format_prefix(specifier, value)
+        return default_locale.locale.format_prefix(specifier, value)
     elif specifier.type in ("", "e", "g", "p", "r"):
         if specifier.precision is None and not math.isnan(
             precision := precision_round(step, max(abs(start), abs(stop)))
@@ -55,4 +54,4 @@ def tick_format(
         ):
             specifier.precision = precision - (specifier.type == "%") * 2
 
-    return locale_format(specifier)
+    return default_locale.locale.format(specifier)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from typing import overload
 
@@ -20,6 +20,7 @@ from ..types import Formatter, T
 from .continuous import Transformer, copy, identity
 from .init import init_range
 from .nice import nice
+from .tick_cache import cached_ticks
 
 
 class ScaleTime(Transformer[datetime]):
@@ -136,6 +137,24 @@ class ScaleTime(Transformer[datetime]):
         """
         return datetime.fromtimestamp(super().invert(y))
 
+    def invert_many(self, values: Iterable[T]) -> list[datetime]:
+        """
+        Returns the dates of the domain corresponding to the given values of
+        the range, as :code:`[scale.invert(y) for y in values]` would.
+
+        Parameters
+        ----------
+        values : Iterable[T]
+            Values from the range, such as a list or an :code:`array`
+
+        Returns
+        -------
+        list[datetime]
+            Corresponding dates from the domain
+        """
+        return list(map(datetime.fromtimestamp, super().invert_many(values)))
+
+    @cached_ticks
     def ticks(self, count: int | None = None) -> list[datetime]:
         """
         Returns representative dates from the scale’s domain.
@@ -159,6 +178,7 @@ class ScaleTime(Transformer[datetime]):
         d = self.get_domain()
         return self._ticks(d[0], d[-1], count if count is not None else 10)
 
+    @cached_ticks
     def tick_format(self, _: int = 0, specifier: str | None = None) -> Formatter[str]:
         """
         Returns a formatter function suitable for displaying a tick value,
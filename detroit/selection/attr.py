@@ -4,6 +4,30 @@ from lxml import etree
 
 from ..array import argpass
 from ..types import Accessor, EtreeFunction, Number, T
+from .namespace import namespace
+
+
+def attr_name(name: str) -> str:
+    """
+    Returns the qualified attribute name, expanding known namespace prefixes
+    such as :code:`xlink:`.
+
+    Parameters
+    ----------
+    name : str
+        Attribute name
+
+    Returns
+    -------
+    str
+        Qualified attribute name
+    """
+    fullname = namespace(name)
+    return (
+        f"{{{fullname['space']}}}{fullname['local']}"
+        if isinstance(fullname, dict)
+        else fullname
+    )
 
 
 def tostring(value: list[Any] | Any) -> str:
@@ -23,6 +47,8 @@ def tostring(value: list[Any] | Any) -> str:
     str
         Output
     """
+    if type(value) is str:
+        return value
     return " ".join(map(str, value)) if isinstance(value, list) else str(value)
 
 
@@ -70,8 +96,55 @@ def attr_function(
         Function which adds an attribute to nodes
     """
     value = argpass(value)
+    func = value._func
+
+    # Calls the accessor directly for the most common signatures
+    if value._nargs == 1:
+
+        def callback(node: etree.Element, data: T, i: int, group: list[etree.Element]):
+            node.set(name, tostring(func(data)))
+
+    elif value._nargs == 2:
+
+        def callback(node: etree.Element, data: T, i: int, group: list[etree.Element]):
+            node.set(name, tostring(func(data, i)))
+
+    else:
+
+        def callback(node: etree.Element, data: T, i: int, group: list[etree.Element]):
+            node.set(name, tostring(value(data, i, group)))
+
+    return callback
+
+
+def attrs_function(
+    values: dict[str, Accessor[T, str | Number] | list[Any] | Any],
+) -> EtreeFunction[T, None]:
+    """
+    Returns a function which adds several attributes to nodes at once. Constant
+    values are converted to strings once and accessor functions are wrapped
+    once.
+
+    Parameters
+    ----------
+    values : dict[str, Accessor[T, str | Number] | list[Any] | Any]
+        Attribute names associated to accessor functions or constant values
+
+    Returns
+    -------
+    EtreeFunction[T, None]
+        Function which adds attributes to nodes
+    """
+    attributes = [
+        (attr_name(name), argpass(value) if callable(value) else tostring(value))
+        for name, value in values.items()
+    ]
 
     def callback(node: etree.Element, data: T, i: int, group: list[etree.Element]):
-        node.set(name, tostring(value(data, i, group)))
+        for name, value in attributes:
+            if isinstance(value, str):
+                node.set(name, value)
+            else:
+                node.set(name, tostring(value(data, i, group)))
 
     return callback
@@ -1,47 +1,90 @@
+from dataclasses import dataclass
+from time import perf_counter
+
 from ..array import argpass
 from .enter import EnterNode
 
 
-def bind_index(node_data, parent, group, enter, update, exit, data, _):
+@dataclass
+class BindStats:
+    """
+    Statistics of a data join made by :code:`Selection.data`.
+
+    Parameters
+    ----------
+    enter : int
+        Number of data without corresponding nodes
+    update : int
+        Number of nodes bound to new data
+    exit : int
+        Number of nodes without new data
+    key_time : float
+        Time spent computing keys, in seconds
+    join_time : float
+        Time spent matching nodes and data, in seconds
+    """
+
+    enter: int = 0
+    update: int = 0
+    exit: int = 0
+    key_time: float = 0.0
+    join_time: float = 0.0
+
+
+def bind_index(node_data, parent, group, enter, update, exit, data, _, stats):
+    start = perf_counter()
+    nodes = []
+    values = []
     for i in range(len(data)):
         node = group[i] if i < len(group) else None
         if node is not None:
-            node_data[node] = data[i]
+            nodes.append(node)
+            values.append(data[i])
             update[i] = node
         else:
             enter[i] = EnterNode(parent, data[i])
+    node_data.set_many(nodes, values)
 
     for i in range(len(data), len(group)):
         node = group[i] if i < len(group) else None
         if node is not None:
             exit[i] = node
+    stats.join_time += perf_counter() - start
 
 
-def bind_key(node_data, parent, group, enter, update, exit, data, key):
-    node_by_key_value = {}
-    key_values = [None] * len(group)
+def bind_key(node_data, parent, group, enter, update, exit, data, key, stats):
+    start = perf_counter()
     key = argpass(key)
+    key_values = [
+        None if node is None else key(datum, i, group)
+        for i, (node, datum) in enumerate(zip(group, node_data.get_many(group)))
+    ]
+    data_key_values = [key(datum, i, data) for i, datum in enumerate(data)]
+    middle = perf_counter()
 
-    for i in range(len(group)):
-        node = group[i]
+    node_by_key_value = {}
+    for i, (node, key_value) in enumerate(zip(group, key_values)):
         if node is not None:
-            key_value = key(node_data.get(node), i, group)
             if key_value in node_by_key_value:
                 exit[i] = node
             else:
                 node_by_key_value[key_value] = node
 
-    for i in range(len(data)):
-        key_value = key(data[i], i, data)
-        node = node_by_key_value.get(key_value)
+    nodes = []
+    values = []
+    for i, key_value in enumerate(data_key_values):
+        node = node_by_key_value.pop(key_value, None)
         if node is not None:
             update[i] = node
-            node_data[node] = data[i]
-            del node_by_key_value[key_value]
+            nodes.append(node)
+            values.append(data[i])
         else:
             enter[i] = EnterNode(parent, data[i])
+    node_data.set_many(nodes, values)
 
-    for i in range(len(group)):
-        node = group[i]
-        if node is not None and node_by_key_value.get(key_values[i]) == node:
+    for i, (node, key_value) in enumerate(zip(group, key_values)):
+        if node is not None and node_by_key_value.get(key_value) is node:
             exit[i] = node
+
+    stats.key_time += middle - start
+    stats.join_time += perf_counter() - middle
@@ -1,11 +1,12 @@
 from lxml import etree
 
 from ..types import T
+from .emit import create_emit
 from .namespace import namespace
 from .selection import Selection
 
 
-def create(name: str) -> Selection[T]:
+def create(name: str, emit: bool = False) -> Selection[T]:
     """
     Given the specified element name, returns a single-element selection
     containing a detached element of the given name in the current document.
@@ -16,12 +17,19 @@ def create(name: str) -> Selection[T]:
     ----------
     name : str
         Tag name
+    emit : bool
+        :code:`True` to return an :code:`EmitSelection` which serializes
+        directly into SVG text without building an :code:`lxml` tree. It is
+        lighter for large charts; see :code:`EmitSelection` for the supported
+        subset.
 
     Returns
     -------
     Selection[T]
         XML tree
     """
+    if emit:
+        return create_emit(name)
     fullname = namespace(name)
     document = (
         etree.Element(fullname["local"], attrib={"xmlns": fullname["space"]})
@@ -0,0 +1,571 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+from typing import IO, Any
+
+from lxml import etree
+
+from ..types import Accessor, T
+from .attr import attr_name
+from .namespace import namespace
+from .selection import Selection
+
+ATTRIBUTE_ESCAPES = str.maketrans(
+    {
+        "&": "&amp;",
+        "<": "&lt;",
+        ">": "&gt;",
+        '"': "&quot;",
+        "\n": "&#10;",
+        "\r": "&#13;",
+        "\t": "&#9;",
+    }
+)
+ATTRIBUTE_SPECIALS = re.compile('[&<>"\n\r\t]')
+TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\r": "&#13;"})
+
+
+def escape_attribute(value: str) -> str:
+    """
+    Escapes an attribute value as :code:`lxml` does: special characters are
+    replaced by entities and non-ASCII characters by character references.
+
+    Parameters
+    ----------
+    value : str
+        Attribute value
+
+    Returns
+    -------
+    str
+        Escaped value
+    """
+    value = value.translate(ATTRIBUTE_ESCAPES)
+    if value.isascii():
+        return value
+    return value.encode("ascii", "xmlcharrefreplace").decode("ascii")
+
+
+def escape_text(text: str) -> str:
+    """
+    Escapes a text content as :code:`lxml` does: special characters are
+    replaced by entities and non-ASCII characters by character references.
+
+    Parameters
+    ----------
+    text : str
+        Text content
+
+    Returns
+    -------
+    str
+        Escaped text
+    """
+    text = text.translate(TEXT_ESCAPES)
+    if text.isascii():
+        return text
+    return text.encode("ascii", "xmlcharrefreplace").decode("ascii")
+
+
+class EmitNode:
+    """
+    Lightweight element used by :class:`EmitSelection` in place of
+    :code:`etree.Element`. It supports the part of the element interface used
+    by selections: attributes (:code:`get`, :code:`set`, :code:`attrib`),
+    text, children (iteration, :code:`index`, :code:`append`,
+    :code:`insert`, :code:`remove`, :code:`addprevious`) and copies. As with
+    :code:`lxml`, adding a node which already has a parent moves it.
+
+    Parameters
+    ----------
+    tag : str
+        Tag name
+    parent : EmitNode | None
+        Parent node
+    scope : str | None
+        Default namespace in scope for this node
+    space : str | None
+        Namespace of the node when it was created with a namespaced name
+    """
+
+    __slots__ = ("_children", "_parent", "_scope", "_space", "attrib", "tag", "text")
+
+    def __init__(
+        self,
+        tag: str,
+        parent: EmitNode | None,
+        scope: str | None,
+        space: str | None = None,
+    ):
+        self.tag = tag
+        self.text = None
+        self.attrib = {}
+        self._children = []
+        self._parent = parent
+        self._scope = scope
+        self._space = space
+
+    def get(self, name: str, default: str | None = None) -> str | None:
+        return self.attrib.get(name, default)
+
+    def set(self, name: str, value: str):
+        self.attrib[name] = value
+
+    def getparent(self) -> EmitNode | None:
+        return self._parent
+
+    def getnext(self) -> EmitNode | None:
+        parent = self._parent
+        if parent is None:
+            return None
+        siblings = parent._children
+        index = siblings.index(self) + 1
+        return siblings[index] if index < len(siblings) else None
+
+    def iter(self) -> Iterator[EmitNode]:
+        """
+        Iterates over the node and its descendants in document order.
+
+        Returns
+        -------
+        Iterator[EmitNode]
+            Nodes
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node._children))
+
+    def __iter__(self) -> Iterator[EmitNode]:
+        return iter(self._children)
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __getitem__(self, index: int) -> EmitNode:
+        return self._children[index]
+
+    def index(self, child: EmitNode) -> int:
+        return self._children.index(child)
+
+    def _adopt(self, child: EmitNode):
+        if child._parent is not None:
+            child._parent._children.remove(child)
+        child._parent = self
+
+    def append(self, child: EmitNode):
+        self._adopt(child)
+        self._children.append(child)
+
+    def insert(self, index: int, child: EmitNode):
+        self._adopt(child)
+        self._children.insert(index, child)
+
+    def remove(self, child: EmitNode):
+        self._children.remove(child)
+        child._parent = None
+
+    def addprevious(self, node: EmitNode):
+        parent = self._parent
+        parent._adopt(node)
+        parent._children.insert(parent._children.index(self), node)
+
+    def subnode(self, fullname: dict | str) -> EmitNode:
+        """
+        Appends a new child node and returns it, declaring its namespace in
+        the same cases as :code:`lxml` does.
+
+        Parameters
+        ----------
+        fullname : dict | str
+            Tag name or dictionary with keys :code:`"local"` and
+            :code:`"space"`
+
+        Returns
+        -------
+        EmitNode
+            Child node
+        """
+        if isinstance(fullname, dict):
+            space = fullname["space"]
+            node = EmitNode(fullname["local"], self, space, space)
+            if space != self._scope:
+                node.attrib["xmlns"] = space
+        else:
+            node = EmitNode(fullname, self, self._scope)
+        self._children.append(node)
+        return node
+
+    def __deepcopy__(self, memo: dict | None = None) -> EmitNode:
+        node = EmitNode(self.tag, None, self._scope, self._space)
+        node.text = self.text
+        node.attrib = self.attrib.copy()
+        for child in self._children:
+            child = child.__deepcopy__(memo)
+            child._parent = node
+            node._children.append(child)
+        return node
+
+    # As with lxml, a copy of a node includes its descendants
+    __copy__ = __deepcopy__
+
+    def __repr__(self) -> str:
+        return f"<EmitNode {self.tag} at {hex(id(self))}>"
+
+
+def from_element(element: etree.Element, scope: str | None = None) -> EmitNode:
+    """
+    Converts an :code:`lxml` element and its descendants into an
+    :class:`EmitNode` tree.
+
+    Parameters
+    ----------
+    element : etree.Element
+        Element
+    scope : str | None
+        Default namespace in scope for the converted node
+
+    Returns
+    -------
+    EmitNode
+        Converted node
+    """
+    qname = etree.QName(element)
+    space = qname.namespace
+    node = EmitNode(qname.localname, None, space or scope, space)
+    if space is not None and space != scope:
+        node.attrib["xmlns"] = space
+    node.text = element.text
+    node.attrib.update(element.attrib)
+    for child in element:
+        if isinstance(child.tag, str):
+            child = from_element(child, node._scope)
+            child._parent = node
+            node._children.append(child)
+    return node
+
+
+@lru_cache(maxsize=256)
+def compile_steps(
+    selection: str,
+) -> tuple[tuple[str, bool, tuple[str, str | None] | None], ...]:
+    """
+    Parses a selection string into steps :code:`(tag, last, attribute)`
+    following the forms supported by :func:`selector`.
+
+    Parameters
+    ----------
+    selection : str
+        Selection description
+
+    Returns
+    -------
+    tuple[tuple[str, bool, tuple[str, str | None] | None], ...]
+        Tag name (:code:`"*"` for any tag), :code:`True` for
+        :code:`:last-of-type` and attribute name and value to match
+    """
+    steps = []
+    for step in selection.split(" "):
+        last = False
+        if ":" in step:
+            step, order = step.split(":")
+            if order != "last-of-type":
+                raise ValueError(
+                    f"Only 'last-of-type' is implemented currently (found {order})."
+                )
+            last = True
+        attribute = None
+        if "." in step:
+            tag, class_name = step.split(".")
+            if class_name:
+                attribute = ("class", class_name)
+        elif "[" in step and "]" in step:
+            tag, specifier = step.split("[")
+            name, _, value = specifier.rstrip("]").partition("=")
+            attribute = (name, value.strip("'\"") if _ else None)
+        else:
+            tag = step
+        steps.append((tag or "*", last, attribute))
+    return tuple(steps)
+
+
+def matches(
+    node: EmitNode, step: tuple[str, bool, tuple[str, str | None] | None]
+) -> bool:
+    """
+    Returns :code:`True` if :code:`node` matches a step of
+    :func:`compile_steps`.
+
+    Parameters
+    ----------
+    node : EmitNode
+        Node
+    step : tuple[str, bool, tuple[str, str | None] | None]
+        Tag name, :code:`:last-of-type` flag and attribute
+
+    Returns
+    -------
+    bool
+        :code:`True` if the node matches
+    """
+    tag, last, attribute = step
+    if tag != "*" and (node.tag != tag or node._space is not None):
+        return False
+    if last:
+        siblings = node._parent._children
+        for sibling in reversed(siblings):
+            if tag == "*" or (sibling.tag == tag and sibling._space is None):
+                if sibling is not node:
+                    return False
+                break
+    if attribute is not None:
+        name, value = attribute
+        found = node.attrib.get(name)
+        return found is not None if value is None else found == value
+    return True
+
+
+def emit_selector(
+    element: EmitNode, selection: str | None = None
+) -> list[EmitNode] | EmitNode:
+    """
+    Searches :code:`selection` among the descendants of :code:`element` and
+    returns the matched nodes in document order, as :func:`selector` does for
+    :code:`lxml` elements.
+
+    Parameters
+    ----------
+    element : EmitNode
+        Root node on which the search starts
+    selection : str | None
+        Selection description
+
+    Returns
+    -------
+    list[EmitNode] | EmitNode
+        List of found nodes
+    """
+    if selection is None or selection == "":
+        return element
+    first, *steps = compile_steps(selection)
+    descendants = element.iter()
+    next(descendants)
+    found = [node for node in descendants if matches(node, first)]
+    for step in steps:
+        found = [
+            child for node in found for child in node._children if matches(child, step)
+        ]
+    if steps and len(found) > 1:
+        order = {node: k for k, node in enumerate(element.iter())}
+        found.sort(key=order.__getitem__)
+    return found
+
+
+def emit_creator(node: EmitNode, fullname: dict | str) -> EmitNode:
+    return node.subnode(fullname)
+
+
+def check_attr_names(names: Iterable[str]):
+    """
+    Raises an error if one of the attribute names is namespaced, which is not
+    supported by :class:`EmitNode`.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        Attribute names
+    """
+    for name in names:
+        if attr_name(name).startswith("{"):
+            raise ValueError(
+                f"Namespaced attribute {name!r} is not supported in emit mode."
+            )
+
+
+def start_tag(node: EmitNode) -> str:
+    """
+    Returns the start tag of :code:`node` with its escaped attributes and
+    without the closing bracket.
+
+    Parameters
+    ----------
+    node : EmitNode
+        Node
+
+    Returns
+    -------
+    str
+        Start tag
+    """
+    attrib = node.attrib
+    values = "".join(attrib.values())
+    if values.isascii() and ATTRIBUTE_SPECIALS.search(values) is None:
+        attributes = "".join([f' {name}="{value}"' for name, value in attrib.items()])
+    else:
+        attributes = "".join(
+            [f' {name}="{escape_attribute(value)}"' for name, value in attrib.items()]
+        )
+    return f"<{node.tag}{attributes}"
+
+
+def serialize(
+    node: EmitNode,
+    pieces: list[str],
+    pretty_print: bool = False,
+    level: int = 0,
+    flush: Callable[[], None] | None = None,
+):
+    """
+    Appends to :code:`pieces` the XML representation of :code:`node`,
+    identical to what :code:`etree.tostring` produces for the equivalent
+    element.
+
+    Parameters
+    ----------
+    node : EmitNode
+        Node to serialize
+    pieces : list[str]
+        List of strings where the XML representation is added
+    pretty_print : bool
+        :code:`True` to prettify output
+    level : int
+        Indentation level of the node
+    flush : Callable[[], None] | None
+        Function called after each child element when :code:`pretty_print`
+        is :code:`False`
+    """
+    append = pieces.append
+    append(start_tag(node))
+    children = node._children
+    text = node.text
+    if text is None:
+        if not children:
+            append("/>")
+            return
+        append(">")
+    else:
+        append(f">{escape_text(text)}")
+        pretty_print = False
+    if pretty_print:
+        indent = "\n" + "  " * (level + 1)
+        for child in children:
+            append(indent)
+            serialize(child, pieces, True, level + 1)
+        append("\n" + "  " * level)
+    else:
+        for child in children:
+            if child._children or child.text is not None:
+                serialize(child, pieces, flush=flush)
+            else:
+                append(f"{start_tag(child)}/>")
+            if flush is not None:
+                flush()
+    append(f"</{node.tag}>")
+
+
+class EmitSelection(Selection[T]):
+    """
+    Selection returned by :code:`d3.create(name, emit=True)`.
+
+    Nodes are stored as :class:`EmitNode` objects instead of :code:`lxml`
+    elements and the document is serialized directly into SVG text. Selecting
+    (with the forms supported by :func:`selector`), appending, inserting,
+    removing, cloning, stamping, ordering, binding data and setting
+    attributes, styles, classes and text behave as in :class:`Selection`,
+    and the output of :code:`to_string` is the same.
+
+    Namespaced attributes (:code:`xlink:href`, ...) are not supported and
+    raise a :code:`ValueError`. Nodes cannot be moved into an :code:`lxml`
+    document; :code:`stamp` accepts :code:`lxml` templates by converting them.
+    """
+
+    def _selector(
+        self, node: EmitNode, selection: str | None = None
+    ) -> list[EmitNode] | EmitNode:
+        return emit_selector(node, selection)
+
+    def _creator(self, node: EmitNode, fullname: dict | str) -> EmitNode:
+        return emit_creator(node, fullname)
+
+    def attr(
+        self, name: str, value: Accessor[T, Any] | list[Any] | Any | None = None
+    ) -> EmitSelection[T]:
+        check_attr_names([name])
+        return super().attr(name, value)
+
+    def attrs(
+        self, values: dict[str, Accessor[T, Any] | list[Any] | Any]
+    ) -> EmitSelection[T]:
+        check_attr_names(values)
+        return super().attrs(values)
+
+    def attr_columns(self, columns: dict[str, list[Any]]) -> EmitSelection[T]:
+        check_attr_names(columns)
+        return super().attr_columns(columns)
+
+    def stamp(
+        self,
+        template: Selection | etree.Element | EmitNode,
+        bindings: dict[str, dict[str, Accessor[T, Any] | Any]] | None = None,
+        texts: dict[str, Accessor[T, Any] | Any] | None = None,
+    ) -> EmitSelection[T]:
+        if isinstance(template, Selection):
+            template = template.node()
+        if not isinstance(template, EmitNode):
+            template = from_element(template)
+        return super().stamp(template, bindings, texts)
+
+    def to_string(self, pretty_print: bool = True) -> str:
+        if len(self._parents) == 0:
+            return ""
+        pieces = []
+        serialize(self._parents[0], pieces, pretty_print)
+        return "".join(pieces)
+
+    def write(self, file: str | IO[bytes], chunk_size: int = 1024):
+        if chunk_size < 1:
+            raise ValueError(f"'chunk_size' must be positive (found {chunk_size}).")
+        if len(self._parents) == 0:
+            return
+        if isinstance(file, str):
+            with open(file, "wb") as stream:
+                return self.write(stream, chunk_size)
+        pieces = []
+        count = 0
+
+        def flush():
+            nonlocal count
+            count += 1
+            if count % chunk_size == 0:
+                file.write("".join(pieces).encode("utf-8"))
+                pieces.clear()
+
+        serialize(self._parents[0], pieces, flush=flush)
+        file.write("".join(pieces).encode("utf-8"))
+
+
+def create_emit(name: str) -> EmitSelection[Any]:
+    """
+    Returns a single-element :class:`EmitSelection` containing a detached node
+    of the given name.
+
+    Parameters
+    ----------
+    name : str
+        Tag name
+
+    Returns
+    -------
+    EmitSelection[Any]
+        Selection serialized without lxml
+    """
+    fullname = namespace(name)
+    if isinstance(fullname, dict):
+        document = EmitNode(fullname["local"], None, None)
+        document.attrib["xmlns"] = fullname["space"]
+    else:
+        document = EmitNode(fullname, None, None)
+    return EmitSelection([[document]], [document])
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from lxml import etree
+
+from ..types import T
+
+
+class NodeData(dict[etree.Element, T]):
+    """
+    Dictionary from nodes to their data, shared by selections derived from
+    the same document, with helpers to read and write whole groups
+    (:meth:`get_many`, :meth:`set_many`).
+
+    Keys are the elements themselves, which are kept alive until their data
+    are removed with :meth:`release`, as :meth:`Selection.remove
+    <detroit.selection.selection.Selection.remove>` does.
+
+    Parameters
+    ----------
+    data : dict[etree.Element, T] | None
+        Initial association between nodes and data
+    """
+
+    __slots__ = ()
+
+    def get_many(self, nodes: Iterable[etree.Element | None]) -> list[T | None]:
+        """
+        Returns the data of several nodes at once; unknown nodes and
+        :code:`None` give :code:`None`.
+
+        Parameters
+        ----------
+        nodes : Iterable[etree.Element | None]
+            Nodes
+
+        Returns
+        -------
+        list[T | None]
+            Data of nodes
+        """
+        return list(map(self.get, nodes))
+
+    def set_many(self, nodes: Iterable[etree.Element], values: Iterable[T]):
+        """
+        Sets the data of several nodes at once.
+
+        Parameters
+        ----------
+        nodes : Iterable[etree.Element]
+            Nodes
+        values : Iterable[T]
+            Data of nodes, in the same order as :code:`nodes`
+        """
+        self.update(zip(nodes, values))
+
+    def release(self, nodes: Iterable[etree.Element]):
+        """
+        Forgets the data of nodes.
+
+        Parameters
+        ----------
+        nodes : Iterable[etree.Element]
+            Nodes to release
+        """
+        pop = self.pop
+        for node in nodes:
+            pop(node, None)
+
+    def copy(self) -> NodeData[T]:
+        return NodeData(self)
+
+    def __or__(self, other: dict[etree.Element, T]) -> NodeData[T]:
+        data = NodeData(self)
+        data.update(other)
+        return data
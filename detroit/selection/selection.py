@@ -3,21 +3,31 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterator
 from copy import copy, deepcopy
+from functools import lru_cache
 from itertools import zip_longest
-from typing import Any, Generic
+from time import perf_counter
+from typing import IO, Any, Generic
 
 from lxml import etree
 
 from ..array import argpass
 from ..types import Accessor, EtreeFunction, Number, T
-from .attr import attr_constant, attr_function
-from .bind import bind_index, bind_key
+from .attr import (
+    attr_constant,
+    attr_function,
+    attr_name,
+    attrs_function,
+    tostring,
+)
+from .bind import BindStats, bind_index, bind_key
 from .classed import class_array, classed_constant, classed_function
 from .constant import constant
 from .enter import EnterNode
 from .matcher import matcher
 from .namespace import namespace
-from .style import style_constant, style_function, style_value
+from .node_data import NodeData
+from .serialize import write_tree
+from .style import release_styles, style_constant, style_function, style_value
 from .text import text_constant, text_function
 
 
@@ -109,12 +119,33 @@ def selector(
     """
     if selection is None or selection == "":
         return element
+    return compile_selector(selection)(element)
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selection: str) -> etree.XPath:
+    """
+    Compiles a selection string into a reusable XPath object which matches
+    every descendant of the context node. Compiled selectors are kept in a
+    bounded LRU cache; use :code:`compile_selector.cache_info()` to inspect
+    hits and misses and :code:`compile_selector.cache_clear()` to reset it.
+
+    Parameters
+    ----------
+    selection : str
+        Selection description
+
+    Returns
+    -------
+    etree.XPath
+        Compiled XPath
+    """
     pxpath = (
         "/".join(map(xpath, selection.split(" ")))
         if " " in selection
         else xpath(selection)
     )
-    return element.xpath(f"./*//{pxpath}") + element.xpath(f"./{pxpath}")
+    return etree.XPath(f".//{pxpath}")
 
 
 def creator(node: etree.Element, fullname: dict | None = None) -> etree.SubElement:
@@ -141,6 +172,41 @@ def creator(node: etree.Element, fullname: dict | None = None) -> etree.SubEleme
     )
 
 
+def order_group(group: list[etree.Element | EnterNode | None]):
+    """
+    Moves nodes of :code:`group` such that their document order matches their
+    order in the group. Positions of the parent's children are computed once
+    and only nodes found after their next node in the group are moved.
+
+    Parameters
+    ----------
+    group : list[etree.Element | EnterNode | None]
+        Group of nodes sharing the same parent
+    """
+    positions = None
+    next_node = None
+    for node in reversed(group):
+        if node is None or isinstance(node, EnterNode):
+            continue
+        if next_node is not None:
+            if positions is None:
+                parent = next_node.getparent()
+                if parent is None:
+                    return
+                positions = {child: k for k, child in enumerate(parent)}
+            position = positions.get(node)
+            next_position = positions.get(next_node)
+            if (
+                position is not None
+                and next_position is not None
+                and position > next_position
+            ):
+                # Once moved, the node is compared to others as its next node
+                next_node.addprevious(node)
+                positions[node] = next_position
+        next_node = node
+
+
 class Selection(Generic[T]):
     """
     A selection is a set of elements from the DOM. Typically these elements are
@@ -170,8 +236,11 @@ class Selection(Generic[T]):
         DOM element in the selection.
     exit : list[etree.Element] | None
         List of existing DOM elements in the selection for which no new datum was found.
-    data : dict[etree.Element, T] | None
+    data : NodeData[T] | dict[etree.Element, T] | None
         Association between nodes and its data
+    styles : dict[etree.Element, tuple[str, dict[str, str]]] | None
+        Last written style strings of nodes and their parsed style
+        attributes
 
     Examples
     --------
@@ -210,13 +279,26 @@ class Selection(Generic[T]):
         parents: list[etree.Element],
         enter: list[EnterNode[T]] | None = None,
         exit: list[etree.Element] | None = None,
-        data: dict[etree.Element, T] | None = None,
+        data: NodeData[T] | dict[etree.Element, T] | None = None,
+        styles: dict[etree.Element, tuple[str, dict[str, str]]] | None = None,
     ):
         self._groups = groups
         self._parents = parents
         self._enter = enter
         self._exit = exit
-        self._data = {} if data is None else data
+        if not isinstance(data, NodeData):
+            data = NodeData() if data is None else NodeData(data)
+        self._data = data
+        self._styles = {} if styles is None else styles
+        self._bind_stats = None
+
+    def _selector(
+        self, node: etree.Element, selection: str | None = None
+    ) -> list[etree.Element]:
+        return selector(node, selection)
+
+    def _creator(self, node: etree.Element, fullname: dict | str) -> etree.Element:
+        return creator(node, fullname)
 
     def select(self, selection: str | None = None) -> Selection[T]:
         """
@@ -293,7 +375,7 @@ class Selection(Generic[T]):
         for node in filter(lambda n: n is not None, nodes):
             if isinstance(node, EnterNode):
                 node = node._parent
-            subgroup = selector(node, selection)[:1]
+            subgroup = self._selector(node, selection)[:1]
             if len(subgroup) == 0:
                 groups[node]
                 continue
@@ -304,7 +386,7 @@ class Selection(Generic[T]):
         subgroups = list(groups.values())
         parents = list(groups)
 
-        return Selection(subgroups, parents, data=self._data)
+        return type(self)(subgroups, parents, data=self._data, styles=self._styles)
 
     def select_all(self, selection: str | None = None) -> Selection[T]:
         """
@@ -388,7 +470,7 @@ class Selection(Generic[T]):
         for node in filter(lambda n: n is not None, nodes):
             if isinstance(node, EnterNode):
                 node = node._parent
-            subgroup = selector(node, selection)
+            subgroup = self._selector(node, selection)
             if len(subgroup) == 0:
                 groups[node]
                 continue
@@ -399,7 +481,7 @@ class Selection(Generic[T]):
         subgroups = list(groups.values())
         parents = list(groups)
 
-        return Selection(subgroups, parents, data=self._data)
+        return type(self)(subgroups, parents, data=self._data, styles=self._styles)
 
     def enter(self) -> Selection[T]:
         """
@@ -423,10 +505,11 @@ class Selection(Generic[T]):
             parents=[svg],
         )
         """
-        return Selection(
+        return type(self)(
             self._enter or [[None] * len(group) for group in self._groups],
             self._parents,
             data=self._data,
+            styles=self._styles,
         )
 
     def exit(self) -> Selection[T]:
@@ -452,10 +535,11 @@ class Selection(Generic[T]):
             parents=[svg],
         )
         """
-        return Selection(
+        return type(self)(
             self._exit or [[None] * len(group) for group in self._groups],
             self._parents,
             data=self._data,
+            styles=self._styles,
         )
 
     def merge(self, context: Selection) -> Selection[T]:
@@ -526,7 +610,12 @@ class Selection(Generic[T]):
         for j in range(len(merges), len(self._groups)):
             merges.append(self._groups[j])
 
-        return Selection(merges, self._parents, data=self._data | selection._data)
+        return type(self)(
+            merges,
+            self._parents,
+            data=self._data | selection._data,
+            styles=self._styles,
+        )
 
     def filter(self, match: Accessor[T, bool] | int | float | str) -> Selection[T]:
         """
@@ -585,7 +674,9 @@ class Selection(Generic[T]):
                 if matches(self._data.get(node), i, group):
                     subgroup.append(node)
             subgroups.append(subgroup)
-        return Selection(subgroups, self._parents, data=self._data)
+        return type(self)(
+            subgroups, self._parents, data=self._data, styles=self._styles
+        )
 
     def append(self, name: str) -> Selection[T]:
         """
@@ -649,23 +740,176 @@ class Selection(Generic[T]):
         """
         fullname = namespace(name)
         groups = defaultdict(list)
-        nodes = (node for group in self._groups for node in group)
-        for node in filter(lambda n: n is not None, nodes):
-            if isinstance(node, EnterNode):
-                enter_node = node
-                node = enter_node._parent
-                subnode = creator(node, fullname)
-                node.append(subnode)
-                self._data[subnode] = enter_node.__data__
-                groups[node].append(subnode)
-            else:
-                subnode = creator(node, fullname)
-                node.append(subnode)
+        subnodes = []
+        data = []
+        for j, group in enumerate(self._groups):
+            # Enter groups keep their indices to be merged with update groups
+            aligned = any(isinstance(node, EnterNode) for node in group)
+            for node in group:
+                if node is None:
+                    if aligned:
+                        groups[self._parents[j]].append(None)
+                    continue
+                if isinstance(node, EnterNode):
+                    data.append(node.__data__)
+                    next_node = node._next
+                    node = node._parent
+                    subnode = self._creator(node, fullname)
+                    if next_node is not None and next_node.getparent() is node:
+                        next_node.addprevious(subnode)
+                else:
+                    data.append(self._data.get(node))
+                    subnode = self._creator(node, fullname)
                 groups[node].append(subnode)
-                self._data[subnode] = self._data.get(node)
+                subnodes.append(subnode)
+        self._data.set_many(subnodes, data)
         subgroups = list(groups.values())
         parents = list(groups)
-        return Selection(subgroups, parents, data=self._data)
+        return type(self)(subgroups, parents, data=self._data, styles=self._styles)
+
+    def stamp(
+        self,
+        template: Selection | etree.Element,
+        bindings: dict[str, dict[str, Accessor[T, Any] | Any]] | None = None,
+        texts: dict[str, Accessor[T, Any] | Any] | None = None,
+    ) -> Selection[T]:
+        """
+        Appends a copy of :code:`template` to each selected element, or
+        inserts it like :code:`Selection.append` for enter selections, and
+        fills the copies with values bound to their datum.
+
+        The template subtree is built once and copied per datum by
+        :code:`lxml`, which is much faster than chaining :code:`append` and
+        :code:`attr` calls to build the same structure for each datum.
+        Elements targeted by :code:`bindings` and :code:`texts` are found
+        once in the template.
+
+        Parameters
+        ----------
+        template : Selection | etree.Element
+            Template subtree, usually built with :code:`d3.create`
+        bindings : dict[str, dict[str, Accessor[T, Any] | Any]] | None
+            Selection strings of elements in the template (:code:`""` for its
+            root) associated to attributes to set, as in
+            :code:`Selection.attrs`
+        texts : dict[str, Accessor[T, Any] | Any] | None
+            Selection strings of elements in the template associated to their
+            text content, as in :code:`Selection.text`
+
+        Returns
+        -------
+        Selection[T]
+            Selection of copied templates. The datum is bound to the copied
+            root and to the elements targeted by :code:`bindings` and
+            :code:`texts`.
+
+        Examples
+        --------
+
+        >>> row = d3.create("g")
+        >>> row.append("rect").attr("height", 10)
+        Selection(
+            groups=[[rect]],
+            parents=[g],
+        )
+        >>> row.append("text").attr("x", -5)
+        Selection(
+            groups=[[text]],
+            parents=[g],
+        )
+        >>> svg = d3.create("svg")
+        >>> (
+        ...     svg.select_all("g")
+        ...     .data([("a", 20), ("b", 30)])
+        ...     .enter()
+        ...     .stamp(
+        ...         row,
+        ...         {
+        ...             "": {"transform": lambda d, i: f"translate(0,{i * 12})"},
+        ...             "rect": {"width": lambda d: d[1]},
+        ...         },
+        ...         {"text": lambda d: d[0]},
+        ...     )
+        ... )
+        Selection(
+            groups=[[g, g]],
+            parents=[svg],
+        )
+        >>> print(svg.to_string())
+        <svg xmlns="http://www.w3.org/2000/svg">
+          <g transform="translate(0,0)">
+            <rect height="10" width="20"/>
+            <text x="-5">a</text>
+          </g>
+          <g transform="translate(0,12)">
+            <rect height="10" width="30"/>
+            <text x="-5">b</text>
+          </g>
+        </svg>
+        """
+        if isinstance(template, Selection):
+            template = template.node()
+
+        def paths(selection: str) -> list[list[int]]:
+            # Child indices leading from the template root to matched elements
+            paths = []
+            for element in (
+                self._selector(template, selection) if selection else [template]
+            ):
+                path = []
+                while element is not template:
+                    parent = element.getparent()
+                    path.append(parent.index(element))
+                    element = parent
+                paths.append(path[::-1])
+            return paths
+
+        callbacks = [
+            (path, attrs_function(values))
+            for selection, values in (bindings or {}).items()
+            for path in paths(selection)
+        ] + [
+            (path, text_function(value) if callable(value) else text_constant(value))
+            for selection, value in (texts or {}).items()
+            for path in paths(selection)
+        ]
+
+        groups = defaultdict(list)
+        nodes = []
+        data = []
+        for j, group in enumerate(self._groups):
+            aligned = any(isinstance(node, EnterNode) for node in group)
+            for i, node in enumerate(group):
+                if node is None:
+                    if aligned:
+                        groups[self._parents[j]].append(None)
+                    continue
+                next_node = None
+                if isinstance(node, EnterNode):
+                    datum = node.__data__
+                    next_node = node._next
+                    node = node._parent
+                else:
+                    datum = self._data.get(node)
+                subnode = deepcopy(template)
+                if next_node is not None and next_node.getparent() is node:
+                    next_node.addprevious(subnode)
+                else:
+                    node.append(subnode)
+                for path, callback in callbacks:
+                    element = subnode
+                    for index in path:
+                        element = element[index]
+                    callback(element, datum, i, group)
+                    nodes.append(element)
+                    data.append(datum)
+                groups[node].append(subnode)
+                nodes.append(subnode)
+                data.append(datum)
+        self._data.set_many(nodes, data)
+        return type(self)(
+            list(groups.values()), list(groups), data=self._data, styles=self._styles
+        )
 
     def each(self, callback: EtreeFunction[T, None]) -> Selection[T]:
         """
@@ -719,13 +963,31 @@ class Selection(Generic[T]):
             parents=[svg],
         )
         """
-        callback = argpass(callback)
+        return self._apply(argpass(callback))
+
+    def _apply(self, callback: EtreeFunction[T, None]) -> Selection[T]:
+        """
+        Invokes :code:`callback` for each selected element with all four
+        arguments, without wrapping it with :code:`argpass`. It is used
+        internally by methods whose callbacks already take all arguments.
+
+        Parameters
+        ----------
+        callback : EtreeFunction[T, None]
+            Function taking the node, its data, its index and its group
+
+        Returns
+        -------
+        Selection[T]
+            Itself
+        """
         for group in self._groups:
-            for i, node in enumerate(group):
+            nodes = [
+                node._parent if isinstance(node, EnterNode) else node for node in group
+            ]
+            for i, (node, datum) in enumerate(zip(nodes, self._data.get_many(nodes))):
                 if node is not None:
-                    if isinstance(node, EnterNode):
-                        node = node._parent
-                    callback(node, self._data.get(node), i, group)
+                    callback(node, datum, i, group)
         return self
 
     def attr(
@@ -768,18 +1030,103 @@ class Selection(Generic[T]):
           <g class="labels" transform="translate(20, 10)"/>
         </svg>
         """
-        fullname = namespace(name)
-        name = (
-            f"{{{fullname['space']}}}{fullname['local']}"
-            if isinstance(fullname, dict)
-            else fullname
-        )
+        name = attr_name(name)
         if value is None:
             return self.node().get(name)
-        elif callable(value):
-            self.each(attr_function(name, value))
+        if callable(value):
+            self._apply(attr_function(name, value))
         else:
-            self.each(attr_constant(name, value))
+            self._apply(attr_constant(name, value))
+        return self
+
+    def attrs(
+        self, values: dict[str, Accessor[T, Any] | list[Any] | Any]
+    ) -> Selection[T]:
+        """
+        Sets several attributes on the selected elements in a single traversal
+        and returns this selection. It is equivalent to chaining
+        :code:`Selection.attr` for each item of :code:`values`.
+
+        Parameters
+        ----------
+        values : dict[str, Accessor[T, Any] | list[Any] | Any]
+            Attribute names associated to value functions or constant values.
+            The final values are converted to strings.
+
+        Returns
+        -------
+        Selection[T]
+            Itself
+
+        Examples
+        --------
+
+        >>> import detroit as d3
+        >>> svg = d3.create("svg")
+        >>> print(
+        ...     svg.select_all("rect")
+        ...     .data([1, 2])
+        ...     .enter()
+        ...     .append("rect")
+        ...     .attrs({"x": lambda d: d * 10, "width": 5, "fill": "red"})
+        ...     .to_string()
+        ... )
+        <svg xmlns="http://www.w3.org/2000/svg">
+          <rect x="10" width="5" fill="red"/>
+          <rect x="20" width="5" fill="red"/>
+        </svg>
+        """
+        return self._apply(attrs_function(values))
+
+    def attr_columns(self, columns: dict[str, list[Any]]) -> Selection[T]:
+        """
+        Sets several attributes on the selected elements from precomputed
+        columns of values and returns this selection. Each column must have
+        one value per selected element, in the order given by
+        :code:`Selection.nodes`. No accessor is called, which makes this
+        method suited for large selections whose values are already computed.
+
+        Parameters
+        ----------
+        columns : dict[str, list[Any]]
+            Attribute names associated to sequences of values. The values are
+            converted to strings.
+
+        Returns
+        -------
+        Selection[T]
+            Itself
+
+        Examples
+        --------
+
+        >>> import detroit as d3
+        >>> svg = d3.create("svg")
+        >>> print(
+        ...     svg.select_all("rect")
+        ...     .data([1, 2])
+        ...     .enter()
+        ...     .append("rect")
+        ...     .attr_columns({"x": [0, 10], "y": [5, 15]})
+        ...     .to_string()
+        ... )
+        <svg xmlns="http://www.w3.org/2000/svg">
+          <rect x="0" y="5"/>
+          <rect x="10" y="15"/>
+        </svg>
+        """
+        nodes = [node._parent if isinstance(node, EnterNode) else node for node in self]
+        names = [attr_name(name) for name in columns]
+        values = list(columns.values())
+        for name, column in zip(names, values):
+            if len(column) != len(nodes):
+                raise ValueError(
+                    f"Column {name!r} has {len(column)} values but the selection "
+                    f"has {len(nodes)} nodes."
+                )
+        for node, row in zip(nodes, zip(*values)):
+            for name, value in zip(names, row):
+                node.set(name, tostring(value))
         return self
 
     def property(
@@ -859,9 +1206,9 @@ class Selection(Generic[T]):
         if value is None:
             return style_value(self.node().get("style"), name)
         elif callable(value):
-            self.each(style_function(name, value))
+            self._apply(style_function(name, value, self._styles))
         else:
-            self.each(style_constant(name, value))
+            self._apply(style_constant(name, value, self._styles))
         return self
 
     def text(self, value: Accessor[T, Any] | Any | None = None) -> Selection[T]:
@@ -914,9 +1261,9 @@ class Selection(Generic[T]):
         if value is None:
             return self.node().text
         elif callable(value):
-            self.each(text_function(value))
+            self._apply(text_function(value))
         else:
-            self.each(text_constant(value))
+            self._apply(text_constant(value))
         return self
 
     def html(self, value: Accessor[T, Any] | Any | None = None) -> Selection[T]:
@@ -1015,9 +1362,9 @@ class Selection(Generic[T]):
                 return len(set(names) & set(classes)) == len(names)
             return False
         elif callable(value):
-            self.each(classed_function(names, value))
+            self._apply(classed_function(names, value))
         else:
-            self.each(classed_constant(names, value))
+            self._apply(classed_constant(names, value))
         return self
 
     def datum(self, value: T) -> Selection[T]:
@@ -1144,6 +1491,7 @@ class Selection(Generic[T]):
         update = [None] * len(groups)
         enter = [None] * len(groups)
         exit = [None] * len(groups)
+        stats = BindStats()
         for j in range(len(groups)):
             parent = parents[j]
             group = groups[j]
@@ -1161,20 +1509,52 @@ class Selection(Generic[T]):
                 exit_group,
                 data,
                 key,
+                stats,
             )
 
-            i1 = 0
-            for i0 in range(len(data)):
-                if previous := enter_group[i0]:
-                    if i0 >= i1:
-                        i1 = i0 + 1
-                    while not (
-                        i1 < len(update_group) and update_group[i1] is not None
-                    ) and i1 < len(data):
-                        i1 += 1
-                    previous._next = update_group[i1] if i1 < len(data) else None
+            # Each enter node points to the first following update node
+            start = perf_counter()
+            next_node = None
+            for i0 in range(len(data) - 1, -1, -1):
+                if (node := update_group[i0]) is not None:
+                    next_node = node
+                    stats.update += 1
+                else:
+                    enter_group[i0]._next = next_node
+                    stats.enter += 1
+            stats.exit += len(exit_group) - exit_group.count(None)
+            stats.join_time += perf_counter() - start
+
+        selection = type(self)(update, parents, enter, exit, self._data, self._styles)
+        selection._bind_stats = stats
+        return selection
+
+    def bind_stats(self) -> BindStats | None:
+        """
+        Returns statistics of the data join made by :code:`Selection.data`
+        which produced this selection: number of enter, update and exit
+        elements and time spent computing keys and matching nodes with data.
+
+        Returns
+        -------
+        BindStats | None
+            Statistics or :code:`None` if the selection was not returned by
+            :code:`Selection.data`
 
-        return Selection(update, parents, enter, exit, self._data)
+        Examples
+        --------
+
+        >>> svg = d3.create("svg")
+        >>> svg.select_all("g").data([1, 2]).enter().append("g")
+        Selection(
+            groups=[[g, g]],
+            parents=[svg],
+        )
+        >>> stats = svg.select_all("g").data([2, 3], lambda d: d).bind_stats()
+        >>> stats.enter, stats.update, stats.exit
+        (1, 1, 1)
+        """
+        return self._bind_stats
 
     def order(self) -> Selection[T]:
         """
@@ -1187,15 +1567,7 @@ class Selection(Generic[T]):
             Itself
         """
         for group in self._groups:
-            next_node = None
-            for node in reversed(group):
-                if node is not None:
-                    if next_node is not None and (node.getprevious() == next_node):
-                        parent = next_node.getparent()
-                        index = parent.index(next_node)
-                        parent.pop(index)
-                        parent.insert(index, node)
-                    next_node = node
+            order_group(group)
         return self
 
     def join(
@@ -1295,12 +1667,12 @@ class Selection(Generic[T]):
         ...     .attr("stroke", "black")
         ... )
         Selection(
-            groups=[[circle, circle, None]],
+            groups=[[circle, circle, circle]],
             parents=[svg],
         )
         >>> print(svg.to_string())
         <svg xmlns="http://www.w3.org/2000/svg">
-          <circle fill="blue"/>
+          <circle fill="blue" stroke="black"/>
           <circle fill="green" stroke="black"/>
           <circle fill="green" stroke="black"/>
         </svg>
@@ -1445,7 +1817,7 @@ class Selection(Generic[T]):
                 node = group[0]
                 parent = selection._parents[i]
                 index = parent.index(node)
-                created = creator(parent, fullname)
+                created = self._creator(parent, fullname)
                 parent.insert(index, created)
                 self._data[created] = self._data.get(node)
                 subgroup = [created]
@@ -1453,7 +1825,9 @@ class Selection(Generic[T]):
                 subgroup = []
             subgroups.append(subgroup)
 
-        return Selection(subgroups, selection._parents, data=self._data)
+        return type(self)(
+            subgroups, selection._parents, data=self._data, styles=self._styles
+        )
 
     def remove(self) -> Selection[T]:
         """
@@ -1517,9 +1891,13 @@ class Selection(Generic[T]):
                     if parent is not None:
                         parent.remove(node)
                         subgroup.pop()
-                        self._data.pop(node, None)
+                        removed = list(node.iter())
+                        self._data.release(removed)
+                        release_styles(self._styles, removed)
             subgroups.append(subgroup)
-        return Selection(subgroups, self._parents, data=self._data)
+        return type(self)(
+            subgroups, self._parents, data=self._data, styles=self._styles
+        )
 
     def call(self, func: Callable[[Selection], Any], *args: Any) -> Selection[T]:
         """
@@ -1636,7 +2014,9 @@ class Selection(Generic[T]):
                 if node in self._data:
                     self._data[cloned_node] = copy_func(self._data[node])
 
-        return Selection(self._groups, self._parents, data=self._data)
+        return type(self)(
+            self._groups, self._parents, data=self._data, styles=self._styles
+        )
 
     def node(self) -> etree.Element:
         """
@@ -1775,6 +2155,41 @@ class Selection(Generic[T]):
             .removesuffix("\n")
         )
 
+    def write(self, file: str | IO[bytes], chunk_size: int = 1024):
+        """
+        Writes the SVG content into a file or a binary stream without building
+        the whole document as a string. The output is the same as
+        :code:`Selection.to_string(False)` and is flushed every
+        :code:`chunk_size` elements, which keeps memory usage low for very
+        large selections.
+
+        Parameters
+        ----------
+        file : str | IO[bytes]
+            File path or binary stream (file, :code:`io.BytesIO`, socket file
+            from :code:`socket.makefile("wb")`, ...)
+        chunk_size : int
+            Number of elements written between two flushes
+
+        Examples
+        --------
+
+        >>> import io
+        >>> svg = d3.create("svg")
+        >>> svg.append("g").append("rect").attr("width", 10)
+        Selection(
+            groups=[[rect]],
+            parents=[g],
+        )
+        >>> stream = io.BytesIO()
+        >>> svg.write(stream)
+        >>> stream.getvalue()
+        b'<svg xmlns="http://www.w3.org/2000/svg"><g><rect width="10"/></g></svg>'
+        """
+        if len(self._parents) == 0:
+            return
+        write_tree(self._parents[0], file, chunk_size)
+
     def to_repr(
         self, show_enter: bool = True, show_exit: bool = True, show_data: bool = True
     ) -> str:
@@ -0,0 +1,50 @@
+from typing import IO
+
+from lxml import etree
+
+
+def write_tree(element: etree.Element, file: str | IO[bytes], chunk_size: int = 1024):
+    """
+    Serializes :code:`element` and its descendants into :code:`file`
+    incrementally. Elements are written one by one through
+    :code:`lxml.etree.xmlfile` and the output is flushed every
+    :code:`chunk_size` elements, so the whole document is never held in memory
+    as bytes or as a string.
+
+    Subtrees which have namespaces in scope are written at once by lxml to keep
+    namespace declarations identical to :code:`etree.tostring`. As with
+    :code:`etree.tostring`, the output is ASCII and non-ASCII characters are
+    written as character references.
+
+    Parameters
+    ----------
+    element : etree.Element
+        Root element to serialize
+    file : str | IO[bytes]
+        File path or binary stream with a :code:`write` method
+    chunk_size : int
+        Number of elements written between two flushes
+    """
+    if chunk_size < 1:
+        raise ValueError(f"'chunk_size' must be positive (found {chunk_size}).")
+    count = 0
+
+    with etree.xmlfile(file, encoding="ascii") as xf:
+
+        def write(element: etree.Element):
+            nonlocal count
+            if len(element) == 0 or element.nsmap:
+                xf.write(element, with_tail=False)
+            else:
+                with xf.element(element.tag, element.attrib):
+                    if element.text:
+                        xf.write(element.text)
+                    for child in element:
+                        write(child)
+            count += 1
+            if count % chunk_size == 0:
+                xf.flush()
+            if element.tail:
+                xf.write(element.tail)
+
+        write(element)
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from lxml import etree
 
 from ..array import argpass
@@ -23,7 +25,7 @@ def str_to_attrs(style: str) -> dict[str, str]:
     style = style[:-1] if style.endswith(";") else style
     return {
         property: value
-        for property, value in (desc.split(":") for desc in style.split(";"))
+        for property, value in (desc.split(":", 1) for desc in style.split(";"))
     }
 
 
@@ -45,10 +47,81 @@ def attrs_to_str(attrs: dict[str, str]) -> str:
     return f"{style};"
 
 
-def style_constant(name: str, value: str) -> EtreeFunction[T, None]:
+def set_style(
+    styles: dict[etree.Element, tuple[str, dict[str, str]]],
+    node: etree.Element,
+    name: str,
+    value: str,
+):
+    """
+    Sets a style property of a node and writes its :code:`style` attribute.
+
+    The parsed style attributes of the node are kept in :code:`styles` along
+    with the string they were serialized into. They are reused as long as the
+    :code:`style` attribute of the node still holds this string, so that
+    chained writes do not parse the attribute again; otherwise, the attribute
+    was modified elsewhere and it is parsed again.
+
+    A new property is appended to the string. Changing the value of an
+    existing property rebuilds the whole string, which costs one pass over
+    the properties of the node; setting the same value again writes nothing.
+
+    Parameters
+    ----------
+    styles : dict[etree.Element, tuple[str, dict[str, str]]]
+        Last written style strings and their parsed style attributes
+    node : etree.Element
+        Node
+    name : str
+        Style name
+    value : str
+        Style value
+    """
+    style = node.get("style")
+    cached = styles.get(node)
+    if cached is not None and cached[0] == style:
+        attrs = cached[1]
+        if attrs.get(name) == value:
+            return
+    else:
+        attrs = str_to_attrs(style)
+    if name in attrs or (style and not style.endswith(";")):
+        attrs[name] = value
+        style = attrs_to_str(attrs)
+    else:
+        attrs[name] = value
+        style = f"{style or ''}{name}:{value};"
+    node.set("style", style)
+    styles[node] = (style, attrs)
+
+
+def release_styles(
+    styles: dict[etree.Element, tuple[str, dict[str, str]]],
+    nodes: Iterable[etree.Element],
+):
+    """
+    Forgets the parsed styles of nodes.
+
+    Parameters
+    ----------
+    styles : dict[etree.Element, tuple[str, dict[str, str]]]
+        Last written style strings and their parsed style attributes
+    nodes : Iterable[etree.Element]
+        Nodes to release
+    """
+    pop = styles.pop
+    for node in nodes:
+        pop(node, None)
+
+
+def style_constant(
+    name: str,
+    value: str,
+    styles: dict[etree.Element, tuple[str, dict[str, str]]],
+) -> EtreeFunction[T, None]:
     """
     Returns a function which adds a style attribute to nodes given a constant
-    value.
+    value. Parsed styles are cached in :code:`styles` (see :func:`set_style`).
 
     Parameters
     ----------
@@ -56,30 +129,31 @@ def style_constant(name: str, value: str) -> EtreeFunction[T, None]:
         Style name to add on nodes
     value : str
         Value of the style
+    styles : dict[etree.Element, tuple[str, dict[str, str]]]
+        Last written style strings and their parsed style attributes
 
     Returns
     -------
     EtreeFunction[T, None]
         Function which adds a style attribute to nodes
     """
+    value = str(value)
 
     def callback(node: etree.Element, data: T, i: int, group: list[etree.Element]):
-        style = node.get("style", "")
-        attrs = str_to_attrs(style)
-        if name in attrs:
-            attrs[name] = str(value)
-            style = attrs_to_str(attrs)
-        else:
-            style = f"{style}{name}:{value};"
-        node.set("style", style)
+        set_style(styles, node, name, value)
 
     return callback
 
 
-def style_function(name: str, value: Accessor[T, str]) -> EtreeFunction[T, None]:
+def style_function(
+    name: str,
+    value: Accessor[T, str],
+    styles: dict[etree.Element, tuple[str, dict[str, str]]],
+) -> EtreeFunction[T, None]:
     """
     Returns a function which adds a style attribute to nodes based on an
-    accessor function.
+    accessor function. Parsed styles are cached in :code:`styles` (see
+    :func:`set_style`).
 
     Parameters
     ----------
@@ -87,6 +161,8 @@ def style_function(name: str, value: Accessor[T, str]) -> EtreeFunction[T, None]
         Style name to add on nodes
     value : Accessor[T, str]
         Accessor function
+    styles : dict[etree.Element, tuple[str, dict[str, str]]]
+        Last written style strings and their parsed style attributes
 
     Returns
     -------
@@ -96,15 +172,7 @@ def style_function(name: str, value: Accessor[T, str]) -> EtreeFunction[T, None]
     value = argpass(value)
 
     def callback(node: etree.Element, data: T, i: int, group: list[etree.Element]):
-        style = node.get("style", "")
-        new_value = value(data, i, group)
-        attrs = str_to_attrs(style)
-        if name in attrs:
-            attrs[name] = str(new_value)
-            style = attrs_to_str(attrs)
-        else:
-            style = f"{style}{name}:{new_value};"
-        node.set("style", style)
+        set_style(styles, node, name, str(value(data, i, group)))
 
     return callback
 
@@ -129,6 +197,6 @@ def style_value(style: str, name: str) -> str:
         style = style[:-1]
     attrs = {
         property: value
-        for property, value in (desc.split(":") for desc in style.split(";"))
+        for property, value in (desc.split(":", 1) for desc in style.split(";"))
     }
     return attrs.get(name)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from math import acos, asin, atan2, cos, nan, pi, sin, sqrt
+from typing import Any
 
+from ..path import Path
 from ..selection.selection import Selection
 from .constant import constant
 from .path import WithPath
@@ -42,44 +44,69 @@ def intersect(x0, y0, x1, y1, x2, y2, x3, y3):
     return x0 + t * x10, y0 + t * y10
 
 
-class CornerTangents:
-    def __init__(self, x0, y0, x1, y1, r1, rc, cw):
-        x01 = x0 - x1
-        y01 = y0 - y1
-        lo = (rc if cw else -rc) / sqrt(x01 * x01 + y01 * y01)
-        ox = lo * y01
-        oy = -lo * x01
-        x11 = x0 + ox
-        y11 = y0 + oy
-        x10 = x1 + ox
-        y10 = y1 + oy
-        x00 = (x11 + x10) / 2
-        y00 = (y11 + y10) / 2
-        dx = x10 - x11
-        dy = y10 - y11
-        d2 = dx * dx + dy * dy
-        r = r1 - rc
-        D = x11 * y10 - x10 * y11
-        d = (-1 if dy < 0 else 1) * sqrt(max(0, r * r * d2 - D * D))
-        cx0 = (D * dy - dx * d) / d2
-        cy0 = (-D * dx - dy * d) / d2
-        cx1 = (D * dy + dx * d) / d2
-        cy1 = (-D * dx + dy * d) / d2
-        dx0 = cx0 - x00
-        dy0 = cy0 - y00
-        dx1 = cx1 - x00
-        dy1 = cy1 - y00
-
-        if dx0 * dx0 + dy0 * dy0 > dx1 * dx1 + dy1 * dy1:
-            cx0 = cx1
-            cy0 = cy1
-
-        self.cx = cx0
-        self.cy = cy0
-        self.x01 = -ox
-        self.y01 = -oy
-        self.x11 = cx0 * (r1 / r - 1)
-        self.y11 = cy0 * (r1 / r - 1)
+def corner_tangents(x0, y0, x1, y1, r1, rc, cw):
+    x01 = x0 - x1
+    y01 = y0 - y1
+    lo = (rc if cw else -rc) / sqrt(x01 * x01 + y01 * y01)
+    ox = lo * y01
+    oy = -lo * x01
+    x11 = x0 + ox
+    y11 = y0 + oy
+    x10 = x1 + ox
+    y10 = y1 + oy
+    x00 = (x11 + x10) / 2
+    y00 = (y11 + y10) / 2
+    dx = x10 - x11
+    dy = y10 - y11
+    d2 = dx * dx + dy * dy
+    r = r1 - rc
+    D = x11 * y10 - x10 * y11
+    d = (-1 if dy < 0 else 1) * sqrt(max(0, r * r * d2 - D * D))
+    cx0 = (D * dy - dx * d) / d2
+    cy0 = (-D * dx - dy * d) / d2
+    cx1 = (D * dy + dx * d) / d2
+    cy1 = (-D * dx + dy * d) / d2
+    dx0 = cx0 - x00
+    dy0 = cy0 - y00
+    dx1 = cx1 - x00
+    dy1 = cy1 - y00
+
+    if dx0 * dx0 + dy0 * dy0 > dx1 * dx1 + dy1 * dy1:
+        cx0 = cx1
+        cy0 = cy1
+
+    # Center of the corner circle, then offsets from the center to its
+    # tangent points with the side and with the circle of radius r1.
+    return cx0, cy0, -ox, -oy, cx0 * (r1 / r - 1), cy0 * (r1 / r - 1)
+
+
+def pad_offsets(r0, r1, ap, rp):
+    # Angular offsets of the inner and outer boundaries of a padded arc; they
+    # only depend on radii and pad, which are often shared by all the arcs of
+    # a pie.
+    tmp = rp / r0 * sin(ap) if r0 != 0 else nan
+    p0 = asin(tmp) if 0 <= tmp <= 1 else nan
+    p1 = asin(rp / r1 * sin(ap))
+    return p0, p1
+
+
+def corner_radii(x01, y01, x00, y00, x11, y11, x10, y10, r0, r1, rc):
+    # Corner radii of an arc smaller than a half turn, reduced to fit in it.
+    if oc := intersect(x01, y01, x00, y00, x11, y11, x10, y10):
+        ax = x01 - oc[0]
+        ay = y01 - oc[1]
+        bx = x11 - oc[0]
+        by = y11 - oc[1]
+        kc = 1 / sin(
+            acos(
+                (ax * bx + ay * by)
+                / (sqrt(ax * ax + ay * ay) * sqrt(bx * bx + by * by))
+            )
+            / 2
+        )
+        lc = sqrt(oc[0] * oc[0] + oc[1] * oc[1])
+        return min(rc, (r0 - lc) / (kc - 1)), min(rc, (r1 - lc) / (kc + 1))
+    return 0, 0
 
 
 class Arc(WithPath):
@@ -136,6 +163,57 @@ class Arc(WithPath):
         ...     .set_start_angle(0)
         ...     .set_end_angle(pi / 2)()
         """
+        if self._context is None:
+            buffer = self._path()
+            self._draw(buffer, args)
+            return self._release(buffer) or None
+        self._draw(self._context, args)
+
+    def render_many(self, arcs: Iterable[Any]) -> list[str] | None:
+        """
+        Generates one arc per element of :code:`arcs`, such as the arcs
+        returned by :func:`d3.pie <detroit.pie>`. Each element is passed as
+        single argument to the accessor functions.
+
+        Pad offsets, which only depend on radii and pad angle, are computed
+        once for all arcs sharing the same radii and pad angle. Corner radii
+        are also computed once per angular width of arcs. All arcs are drawn
+        in the same path, formatted at once.
+
+        Parameters
+        ----------
+        arcs : Iterable[Any]
+            Arcs to generate
+
+        Returns
+        -------
+        list[str] | None
+            Generated arcs if the arc is not associated to a context
+
+        Examples
+        --------
+
+        >>> arcs = d3.pie()([1, 1, 2])
+        >>> d3.arc().set_inner_radius(50).set_outer_radius(100).render_many(arcs)
+        ['M0,-100A100,100,0,0,1,100,0L50,0A50,50,0,0,0,0,-50Z',
+         'M100,0A100,100,0,0,1,0,100L0,50A50,50,0,0,0,50,0Z',
+         'M0,100A100,100,0,0,1,0,-100L0,-50A50,50,0,0,0,0,50Z']
+        """
+        shared = {}
+        if self._context is not None:
+            for d in arcs:
+                self._draw(self._context, (d,), shared)
+            return None
+        # Arcs are drawn in a single path which is formatted at once; each
+        # arc starts with a move and ends with the only close of its path.
+        buffer = self._path()
+        for d in arcs:
+            self._draw(buffer, (d,), shared)
+        return [path + "Z" for path in self._release(buffer).split("Z")[:-1]]
+
+    def _draw(self, context: Path, args: tuple, shared: dict | None = None):
+        # When `shared` is a dictionary, pad offsets and corner radii are
+        # stored in it and reused by the next arcs having the same geometry.
         r0 = self._inner_radius(*args)
         r1 = self._outer_radius(*args)
         a0 = self._start_angle(*args) - pi * 0.5
@@ -143,23 +221,19 @@ class Arc(WithPath):
         da = abs(a1 - a0)
         cw = a1 > a0
 
-        buffer = None
-        if self._context is None:
-            self._context = buffer = self._path()
-
         if r1 < r0:
             r = r1
             r1 = r0
             r0 = r
 
         if r1 <= EPSILON:
-            self._context.move_to(0, 0)
+            context.move_to(0, 0)
         elif da > 2 * pi - EPSILON:
-            self._context.move_to(r1 * cos(a0), r1 * sin(a0))
-            self._context.arc(0, 0, r1, a0, a1, not cw)
+            context.move_to(r1 * cos(a0), r1 * sin(a0))
+            context.arc(0, 0, r1, a0, a1, not cw)
             if r0 > EPSILON:
-                self._context.move_to(r0 * cos(a1), r0 * sin(a1))
-                self._context.arc(0, 0, r0, a1, a0, cw)
+                context.move_to(r0 * cos(a1), r0 * sin(a1))
+                context.arc(0, 0, r0, a1, a0, cw)
         else:
             a01 = a0
             a11 = a1
@@ -179,10 +253,19 @@ class Arc(WithPath):
             rc0 = rc
             rc1 = rc
 
-            if rp > EPSILON:
-                tmp = rp / r0 * sin(ap) if r0 != 0 else nan
-                p0 = asin(tmp) if 0 <= tmp <= 1 else nan
-                p1 = asin(rp / r1 * sin(ap))
+            radii = None
+            if shared is None:
+                pads = pad_offsets(r0, r1, ap, rp) if rp > EPSILON else None
+            else:
+                key = (r0, r1, ap, rp, rc)
+                geometry = shared.get(key)
+                if geometry is None:
+                    pads = pad_offsets(r0, r1, ap, rp) if rp > EPSILON else None
+                    geometry = shared[key] = (pads, {})
+                pads, radii = geometry
+
+            if pads is not None:
+                p0, p1 = pads
 
                 da0 -= p0 * 2
                 if da0 > EPSILON:
@@ -214,118 +297,114 @@ class Arc(WithPath):
                 y00 = r0 * sin(a00)
 
                 if da < pi:
-                    if oc := intersect(x01, y01, x00, y00, x11, y11, x10, y10):
-                        ax = x01 - oc[0]
-                        ay = y01 - oc[1]
-                        bx = x11 - oc[0]
-                        by = y11 - oc[1]
-                        kc = 1 / sin(
-                            acos(
-                                (ax * bx + ay * by)
-                                / (sqrt(ax * ax + ay * ay) * sqrt(bx * bx + by * by))
-                            )
-                            / 2
+                    corners = None if radii is None else radii.get(da)
+                    if corners is None:
+                        corners = corner_radii(
+                            x01, y01, x00, y00, x11, y11, x10, y10, r0, r1, rc
                         )
-                        lc = sqrt(oc[0] * oc[0] + oc[1] * oc[1])
-                        rc0 = min(rc, (r0 - lc) / (kc - 1))
-                        rc1 = min(rc, (r1 - lc) / (kc + 1))
-                    else:
-                        rc0 = rc1 = 0
+                        if radii is not None:
+                            radii[da] = corners
+                    rc0, rc1 = corners
 
             if da1 <= EPSILON:
-                self._context.move_to(x01, y01)
+                context.move_to(x01, y01)
             elif rc1 > EPSILON:
-                t0 = CornerTangents(x00, y00, x01, y01, r1, rc1, cw)
-                t1 = CornerTangents(x11, y11, x10, y10, r1, rc1, cw)
-                self._context.move_to(t0.cx + t0.x01, t0.cy + t0.y01)
+                cx0, cy0, x001, y001, x011, y011 = corner_tangents(
+                    x00, y00, x01, y01, r1, rc1, cw
+                )
+                cx1, cy1, x101, y101, x111, y111 = corner_tangents(
+                    x11, y11, x10, y10, r1, rc1, cw
+                )
+                context.move_to(cx0 + x001, cy0 + y001)
 
                 if rc1 < rc:
-                    self._context.arc(
-                        t0.cx,
-                        t0.cy,
+                    context.arc(
+                        cx0,
+                        cy0,
                         rc1,
-                        atan2(t0.y01, t0.x01),
-                        atan2(t1.y01, t1.x01),
+                        atan2(y001, x001),
+                        atan2(y101, x101),
                         not cw,
                     )
                 else:
-                    self._context.arc(
-                        t0.cx,
-                        t0.cy,
+                    context.arc(
+                        cx0,
+                        cy0,
                         rc1,
-                        atan2(t0.y01, t0.x01),
-                        atan2(t0.y11, t0.x11),
+                        atan2(y001, x001),
+                        atan2(y011, x011),
                         not cw,
                     )
-                    self._context.arc(
+                    context.arc(
                         0,
                         0,
                         r1,
-                        atan2(t0.cy + t0.y11, t0.cx + t0.x11),
-                        atan2(t1.cy + t1.y11, t1.cx + t1.x11),
+                        atan2(cy0 + y011, cx0 + x011),
+                        atan2(cy1 + y111, cx1 + x111),
                         not cw,
                     )
-                    self._context.arc(
-                        t1.cx,
-                        t1.cy,
+                    context.arc(
+                        cx1,
+                        cy1,
                         rc1,
-                        atan2(t1.y11, t1.x11),
-                        atan2(t1.y01, t1.x01),
+                        atan2(y111, x111),
+                        atan2(y101, x101),
                         not cw,
                     )
             else:
-                self._context.move_to(x01, y01)
-                self._context.arc(0, 0, r1, a01, a11, not cw)
+                context.move_to(x01, y01)
+                context.arc(0, 0, r1, a01, a11, not cw)
 
             if r0 <= EPSILON or da0 <= EPSILON:
-                self._context.line_to(x10, y10)
+                context.line_to(x10, y10)
             elif rc0 > EPSILON:
-                t0 = CornerTangents(x10, y10, x11, y11, r0, -rc0, cw)
-                t1 = CornerTangents(x01, y01, x00, y00, r0, -rc0, cw)
+                cx0, cy0, x001, y001, x011, y011 = corner_tangents(
+                    x10, y10, x11, y11, r0, -rc0, cw
+                )
+                cx1, cy1, x101, y101, x111, y111 = corner_tangents(
+                    x01, y01, x00, y00, r0, -rc0, cw
+                )
 
-                self._context.line_to(t0.cx + t0.x01, t0.cy + t0.y01)
+                context.line_to(cx0 + x001, cy0 + y001)
 
                 if rc0 < rc:
-                    self._context.arc(
-                        t0.cx,
-                        t0.cy,
+                    context.arc(
+                        cx0,
+                        cy0,
                         rc0,
-                        atan2(t0.y01, t0.x01),
-                        atan2(t1.y01, t1.x01),
+                        atan2(y001, x001),
+                        atan2(y101, x101),
                         not cw,
                     )
                 else:
-                    self._context.arc(
-                        t0.cx,
-                        t0.cy,
+                    context.arc(
+                        cx0,
+                        cy0,
                         rc0,
-                        atan2(t0.y01, t0.x01),
-                        atan2(t0.y11, t0.x11),
+                        atan2(y001, x001),
+                        atan2(y011, x011),
                         not cw,
                     )
-                    self._context.arc(
+                    context.arc(
                         0,
                         0,
                         r0,
-                        atan2(t0.cy + t0.y11, t0.cx + t0.x11),
-                        atan2(t1.cy + t1.y11, t1.cx + t1.x11),
+                        atan2(cy0 + y011, cx0 + x011),
+                        atan2(cy1 + y111, cx1 + x111),
                         cw,
                     )
-                    self._context.arc(
-                        t1.cx,
-                        t1.cy,
+                    context.arc(
+                        cx1,
+                        cy1,
                         rc0,
-                        atan2(t1.y11, t1.x11),
-                        atan2(t1.y01, t1.x01),
+                        atan2(y111, x111),
+                        atan2(y101, x101),
                         not cw,
                     )
             else:
-                self._context.arc(0, 0, r0, a10, a00, cw)
+                context.arc(0, 0, r0, a10, a00, cw)
 
-        self._context.close_path()
-        if buffer is not None:
-            self._context = None
-            return str(buffer) or None
+        context.close_path()
 
     def centroid(self, *args) -> tuple[float, float]:
         """
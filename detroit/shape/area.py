@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from typing import Generic
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Generic
 
 from ..array import argpass
 from ..path import Path
+from ..path.path import as_array
 from ..types import Accessor, Number, T
 from .constant import constant
 from .curves import Curve, curve_linear
-from .line import Line
+from .line import ALWAYS_DEFINED, Line, column, defined_runs, mask_runs
 from .path import WithPath
 from .point import x as point_x
 from .point import y as point_y
+from .simplify import reduce_points, simplification
 
 
 class Area(Generic[T], WithPath):
@@ -47,10 +50,13 @@ class Area(Generic[T], WithPath):
     ):
         super().__init__()
         self._x1 = None
-        self._defined = constant(True)
+        self._defined = ALWAYS_DEFINED
         self._context = None
         self._curve = curve_linear
         self._output = None
+        self._tolerance = None
+        self._simplify = "douglas_peucker"
+        self._downsample = None
 
         if x0 is None:
             self._x0 = point_x
@@ -103,14 +109,24 @@ class Area(Generic[T], WithPath):
             return None
         defined0 = False
 
-        x0z = [0] * n
-        y0z = [0] * n
-
         buffer = None
         if self._context is None:
             buffer = self._path()
             self._output = self._curve(buffer)
 
+        context = buffer or self._context
+        linear = self._curve is curve_linear and isinstance(context, Path)
+        if linear or self._downsample is not None or self._tolerance is not None:
+            if self._defined is ALWAYS_DEFINED:
+                runs = [(0, n)]
+            else:
+                runs = defined_runs(self._defined, data)
+            segments = (self._columns(data, start, stop) for start, stop in runs)
+            return self._render(segments, buffer)
+
+        x0z = [0] * n
+        y0z = [0] * n
+
         j = 0
         for i in range(n + 1):
             d = data[i] if i < n else None
@@ -138,7 +154,123 @@ class Area(Generic[T], WithPath):
 
         if buffer:
             self._output = None
-            return str(buffer) or None
+            return self._release(buffer) or None
+
+    def _columns(
+        self, data: list[T], start: int, stop: int
+    ) -> tuple[list[float], list[float], list[float], list[float]]:
+        x0s = column(self._x0, data, start, stop)
+        y0s = column(self._y0, data, start, stop)
+        x1s = x0s if self._x1 is None else column(self._x1, data, start, stop)
+        y1s = y0s if self._y1 is None else column(self._y1, data, start, stop)
+        return x0s, y0s, x1s, y1s
+
+    def from_columns(
+        self,
+        x0s: Sequence[float],
+        y0s: Sequence[float] | float,
+        y1s: Sequence[float] | None = None,
+        x1s: Sequence[float] | None = None,
+        defined: Sequence[Any] | None = None,
+    ) -> str | None:
+        """
+        Generates an area from columns of positions instead of a list of data.
+        The accessors are not used: coordinates are read directly from the
+        columns, which is much faster for large datasets. As with accessors,
+        the topline is defined by :code:`x1s` (or :code:`x0s`) and :code:`y1s`
+        (or :code:`y0s`) and the baseline by :code:`x0s` and :code:`y0s`.
+
+        Parameters
+        ----------
+        x0s : Sequence[float]
+            x0 positions as a list, an :code:`array` or any object supporting
+            the buffer protocol
+        y0s : Sequence[float] | float
+            y0 positions or constant y0 position
+        y1s : Sequence[float] | None
+            y1 positions
+        x1s : Sequence[float] | None
+            x1 positions
+        defined : Sequence[Any] | None
+            Values telling if each point is defined, all points are defined
+            when :code:`None`
+
+        Returns
+        -------
+        str | None
+            Generated area if the area is not associated to a context
+
+        Examples
+        --------
+
+        >>> d3.area().from_columns([0, 1, 2], 0, [5, 3, 4])
+        'M0,5L1,3L2,4L2,0L1,0L0,0Z'
+        """
+        x0s = as_array(x0s)
+        n = len(x0s)
+        if isinstance(y0s, (int, float)):
+            y0s = array("d", [y0s]) * n
+        columns = [x0s, as_array(y0s)]
+        columns.append(x0s if x1s is None else as_array(x1s))
+        columns.append(columns[1] if y1s is None else as_array(y1s))
+        if any(len(values) != n for values in columns) or (
+            defined is not None and len(defined) != n
+        ):
+            raise ValueError("Columns must have the same length.")
+        if n == 0:
+            return None
+
+        buffer = None
+        if self._context is None:
+            buffer = self._path()
+            self._output = self._curve(buffer)
+
+        runs = [(0, n)] if defined is None else mask_runs(defined)
+        segments = (
+            tuple(values[start:stop] for values in columns) for start, stop in runs
+        )
+        return self._render(segments, buffer)
+
+    def _render(
+        self,
+        segments: Iterable[
+            tuple[Sequence[float], Sequence[float], Sequence[float], Sequence[float]]
+        ],
+        buffer: Path | None,
+    ) -> str | None:
+        context = buffer or self._context
+        linear = self._curve is curve_linear and isinstance(context, Path)
+        reduced = self._downsample is not None or self._tolerance is not None
+        output = self._output
+        for x0s, y0s, x1s, y1s in segments:
+            if reduced:
+                top = reduce_points(
+                    x1s, y1s, self._downsample, self._tolerance, self._simplify
+                )
+                bottom = reduce_points(
+                    x0s, y0s, self._downsample, self._tolerance, self._simplify
+                )
+                x1s, y1s = [x1s[k] for k in top], [y1s[k] for k in top]
+                x0s, y0s = [x0s[k] for k in bottom], [y0s[k] for k in bottom]
+            if linear:
+                # curve_linear draws the topline then the reversed baseline
+                # and closes the area
+                context.polygon(x1s + x0s[::-1], y1s + y0s[::-1])
+                continue
+            output.area_start()
+            output.line_start()
+            for x, y in zip(x1s, y1s):
+                output.point(x, y)
+            output.line_end()
+            output.line_start()
+            for x, y in zip(reversed(x0s), reversed(y0s)):
+                output.point(x, y)
+            output.line_end()
+            output.area_end()
+        if buffer:
+            self._output = None
+            return self._release(buffer) or None
+        return None
 
     def area_line(self) -> Line:
         """
@@ -149,12 +281,17 @@ class Area(Generic[T], WithPath):
         Line
             Line generator based on the area parameters
         """
-        return (
+        line = (
             Line()
             .set_defined(self._defined)
             .set_curve(self._curve)
             .set_context(self._context)
+            .set_simplify(self._tolerance, self._simplify)
         )
+        if self._downsample is not None:
+            x0, x1, pixels = self._downsample
+            line.set_downsample([x0, x1], pixels)
+        return line
 
     def line_x0(self) -> Line:
         """
@@ -371,8 +508,80 @@ class Area(Generic[T], WithPath):
         """
         if callable(defined):
             self._defined = defined
+        elif defined:
+            self._defined = ALWAYS_DEFINED
         else:
-            self._defined = constant(bool(defined))
+            self._defined = constant(False)
+        return self
+
+    def set_simplify(
+        self, tolerance: float | None = None, method: str = "douglas_peucker"
+    ) -> Area:
+        """
+        Sets the tolerance of the simplification applied to the topline and
+        to the baseline of each area segment before their points are passed to
+        the curve. Simplification is disabled when :code:`tolerance` is
+        :code:`None` (the default). See :meth:`Line.set_simplify
+        <detroit.shape.line.Line.set_simplify>` for the available methods.
+
+        Parameters
+        ----------
+        tolerance : float | None
+            Tolerance of simplification, in the units of the values returned
+            by the accessors
+        method : str
+            :code:`"douglas_peucker"` or :code:`"visvalingam"`
+
+        Returns
+        -------
+        Area
+            Itself
+        """
+        if tolerance is not None and tolerance < 0:
+            raise ValueError(f"Invalid tolerance: {tolerance}")
+        simplification(method)  # raises an error for unknown methods
+        self._simplify = method
+        self._tolerance = tolerance
+        return self
+
+    def set_downsample(
+        self, x_range: list[float] | None = None, pixels: int | None = None
+    ) -> Area:
+        """
+        Enables M4 downsampling of each area segment before the points of its
+        topline and baseline are passed to the curve: the x range is divided
+        into :code:`pixels` columns and, for each column, only its first, last,
+        lowest and highest points are kept. The rendered area is the same at
+        this resolution while the number of points is at most four per column.
+        Downsampling is disabled when :code:`x_range` is :code:`None` (the
+        default).
+
+        Downsampling is done before simplification (see :meth:`set_simplify`)
+        and only applies to segments whose x values are monotonic; other
+        segments are rendered with all their points.
+
+        Parameters
+        ----------
+        x_range : list[float] | None
+            Range of x values, usually the range of the x scale
+        pixels : int | None
+            Positive number of columns, by default the width of
+            :code:`x_range`
+
+        Returns
+        -------
+        Area
+            Itself
+        """
+        if x_range is None:
+            self._downsample = None
+            return self
+        x0, x1 = x_range
+        if pixels is None:
+            pixels = max(round(abs(x1 - x0)), 1)
+        if not isinstance(pixels, int) or pixels < 1:
+            raise ValueError(f"Invalid number of pixels: {pixels!r}")
+        self._downsample = (x0, x1, pixels)
         return self
 
     def set_curve(self, curve: Callable[[Path], Curve] | None = None) -> Area:
@@ -437,6 +646,12 @@ class Area(Generic[T], WithPath):
     def get_defined(self) -> Accessor[T, float]:
         return self._defined
 
+    def get_simplify(self) -> tuple[float | None, str]:
+        return self._tolerance, self._simplify
+
+    def get_downsample(self) -> tuple[float, float, int] | None:
+        return self._downsample
+
     def get_curve(self) -> Callable[[Path], Curve]:
         return self._curve
 
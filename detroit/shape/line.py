@@ -1,16 +1,95 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable
-from typing import Generic
+from collections.abc import Callable, Iterable, Sequence
+from itertools import groupby, islice
+from typing import Any, Generic
 
 from ..array import argpass
 from ..path import Path
+from ..path.path import as_array
 from ..types import Accessor, Number, T
 from .constant import constant
 from .curves import Curve, curve_linear
 from .path import WithPath
 from .point import x as point_x
 from .point import y as point_y
+from .simplify import reduce_points, simplification
+
+# Default defined accessor, which lets line generators skip its evaluation
+ALWAYS_DEFINED = constant(True)
+
+
+def mask_runs(mask: Iterable[Any]) -> list[tuple[int, int]]:
+    """
+    Returns the bounds :code:`(start, stop)` of consecutive truthy values of
+    :code:`mask`.
+
+    Parameters
+    ----------
+    mask : Iterable[Any]
+        Values telling if each element is defined
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Bounds of runs of truthy values
+    """
+    runs = []
+    start = 0
+    for value, group in groupby(map(bool, mask)):
+        stop = start + len(list(group))
+        if value:
+            runs.append((start, stop))
+        start = stop
+    return runs
+
+
+def defined_runs(
+    defined: Callable[[T, int, list[T]], bool], data: list[T]
+) -> list[tuple[int, int]]:
+    """
+    Returns the bounds :code:`(start, stop)` of consecutive defined elements
+    of :code:`data`.
+
+    Parameters
+    ----------
+    defined : Callable[[T, int, list[T]], bool]
+        Defined accessor
+    data : list[T]
+        Data values
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Bounds of runs of defined elements
+    """
+    return mask_runs(defined(d, i, data) for i, d in enumerate(data))
+
+
+def column(accessor: argpass, data: list[T], start: int, stop: int) -> list[float]:
+    """
+    Returns the values of :code:`accessor` for the elements of :code:`data`
+    between :code:`start` and :code:`stop`.
+
+    Parameters
+    ----------
+    accessor : argpass
+        Accessor called with the element, its index and :code:`data`
+    data : list[T]
+        Data values
+    start : int
+        Index of the first element
+    stop : int
+        Index after the last element
+
+    Returns
+    -------
+    list[float]
+        Values of the accessor
+    """
+    if accessor._nargs == 1:
+        return list(map(accessor._func, islice(data, start, stop)))
+    return [accessor(data[i], i, data) for i in range(start, stop)]
 
 
 class Line(Generic[T], WithPath):
@@ -36,10 +115,13 @@ class Line(Generic[T], WithPath):
         self, x: Accessor[T, float] | None = None, y: Accessor[T, float] | None = None
     ):
         super().__init__()
-        self._defined = constant(True)
+        self._defined = ALWAYS_DEFINED
         self._context = None
         self._curve = curve_linear
         self._output = None
+        self._tolerance = None
+        self._simplify = "douglas_peucker"
+        self._downsample = None
 
         if x is None:
             self._x = point_x
@@ -88,6 +170,19 @@ class Line(Generic[T], WithPath):
             buffer = self._path()
             self._output = self._curve(buffer)
 
+        context = buffer or self._context
+        linear = self._curve is curve_linear and isinstance(context, Path)
+        if linear or self._downsample is not None or self._tolerance is not None:
+            if self._defined is ALWAYS_DEFINED:
+                runs = [(0, n)]
+            else:
+                runs = defined_runs(self._defined, data)
+            segments = (
+                (column(self._x, data, start, stop), column(self._y, data, start, stop))
+                for start, stop in runs
+            )
+            return self._render(segments, buffer)
+
         for i in range(n + 1):
             d = data[i] if i < n else None
             if not (i < n and self._defined(d, i, data) == defined0):
@@ -101,7 +196,90 @@ class Line(Generic[T], WithPath):
 
         if buffer:
             self._output = None
-            return str(buffer) or None
+            return self._release(buffer) or None
+
+    def from_columns(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        defined: Sequence[Any] | None = None,
+    ) -> str | None:
+        """
+        Generates a line from columns of positions instead of a list of data.
+        The x, y and defined accessors are not used: coordinates are read
+        directly from the columns, which is much faster for large datasets.
+
+        Parameters
+        ----------
+        xs : Sequence[float]
+            x positions as a list, an :code:`array` or any object supporting
+            the buffer protocol
+        ys : Sequence[float]
+            y positions, with the same length as :code:`xs`
+        defined : Sequence[Any] | None
+            Values telling if each point is defined, all points are defined
+            when :code:`None`
+
+        Returns
+        -------
+        str | None
+            Generated line if the line is not associated to a context
+
+        Examples
+        --------
+
+        >>> from array import array
+        >>> xs = array("d", [0, 1, 2, 3])
+        >>> ys = array("d", [5, 3, 4, 1])
+        >>> d3.line().from_columns(xs, ys)
+        'M0,5L1,3L2,4L3,1'
+        >>> d3.line().from_columns(xs, ys, defined=[True, True, False, True])
+        'M0,5L1,3M3,1Z'
+        """
+        xs = as_array(xs)
+        ys = as_array(ys)
+        n = len(xs)
+        if len(ys) != n or (defined is not None and len(defined) != n):
+            raise ValueError("Columns must have the same length.")
+        if n == 0:
+            return None
+
+        buffer = None
+        if self._context is None:
+            buffer = self._path()
+            self._output = self._curve(buffer)
+
+        runs = [(0, n)] if defined is None else mask_runs(defined)
+        segments = ((xs[start:stop], ys[start:stop]) for start, stop in runs)
+        return self._render(segments, buffer)
+
+    def _render(
+        self,
+        segments: Iterable[tuple[Sequence[float], Sequence[float]]],
+        buffer: Path | None,
+    ) -> str | None:
+        context = buffer or self._context
+        linear = self._curve is curve_linear and isinstance(context, Path)
+        reduced = self._downsample is not None or self._tolerance is not None
+        for xs, ys in segments:
+            if reduced:
+                indices = reduce_points(
+                    xs, ys, self._downsample, self._tolerance, self._simplify
+                )
+                xs = [xs[k] for k in indices]
+                ys = [ys[k] for k in indices]
+            if linear:
+                # A single point is closed as curve_linear does
+                context.polyline(xs, ys, closed=len(xs) == 1)
+            else:
+                self._output.line_start()
+                for x, y in zip(xs, ys):
+                    self._output.point(x, y)
+                self._output.line_end()
+        if buffer:
+            self._output = None
+            return self._release(buffer) or None
+        return None
 
     def x(self, x: Accessor[T, float] | Number) -> Line:
         """
@@ -173,8 +351,103 @@ class Line(Generic[T], WithPath):
             self._defined = defined
         elif callable(defined):
             self._defined = defined
+        elif defined:
+            self._defined = ALWAYS_DEFINED
         else:
-            self._defined = constant(bool(defined))
+            self._defined = constant(False)
+        return self
+
+    def set_simplify(
+        self, tolerance: float | None = None, method: str = "douglas_peucker"
+    ) -> Line:
+        """
+        Sets the tolerance of the simplification applied to each line segment
+        before its points are passed to the curve. Simplification is disabled
+        when :code:`tolerance` is :code:`None` (the default).
+
+        The tolerance is expressed in the units of the values returned by the
+        x and y accessors, usually pixels. A tolerance of half a pixel removes
+        most points of dense lines without visible changes.
+
+        Points closer than :code:`tolerance` to their previous point are
+        removed first, then the remaining points are simplified with the
+        given method:
+
+        * :code:`"douglas_peucker"` removes points which are closer than
+          :code:`tolerance` to the simplified line.
+        * :code:`"visvalingam"` removes points whose triangle formed with their
+          neighbors has an area smaller than :code:`tolerance ** 2`.
+
+        Parameters
+        ----------
+        tolerance : float | None
+            Tolerance of simplification
+        method : str
+            :code:`"douglas_peucker"` or :code:`"visvalingam"`
+
+        Returns
+        -------
+        Line
+            Itself
+
+        Examples
+        --------
+
+        >>> points = [[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6], [5, 7]]
+        >>> d3.line().set_simplify(0.5)(points)
+        'M0,0L2,-0.100L3,5L5,7'
+        """
+        if tolerance is not None and tolerance < 0:
+            raise ValueError(f"Invalid tolerance: {tolerance}")
+        simplification(method)  # raises an error for unknown methods
+        self._simplify = method
+        self._tolerance = tolerance
+        return self
+
+    def set_downsample(
+        self, x_range: list[float] | None = None, pixels: int | None = None
+    ) -> Line:
+        """
+        Enables M4 downsampling of each line segment before its points are
+        passed to the curve: the x range is divided into :code:`pixels` columns
+        and, for each column, only its first, last, lowest and highest points
+        are kept. The rendered line is the same at this resolution while the
+        number of points is at most four per column. Downsampling is disabled
+        when :code:`x_range` is :code:`None` (the default).
+
+        Downsampling is done before simplification (see :meth:`set_simplify`)
+        and only applies to segments whose x values are monotonic; other
+        segments are rendered with all their points.
+
+        Parameters
+        ----------
+        x_range : list[float] | None
+            Range of x values, usually the range of the x scale
+        pixels : int | None
+            Positive number of columns, by default the width of
+            :code:`x_range`
+
+        Returns
+        -------
+        Line
+            Itself
+
+        Examples
+        --------
+
+        >>> points = [[0, 5], [0.2, 1], [0.4, 9], [0.6, 4], [0.8, 6], [1.5, 2]]
+        >>> d3.line().set_downsample([0, 2])(points)
+        'M0,5L0.200,1L0.400,9L0.800,6L1.500,2'
+        """
+        if x_range is None:
+            self._downsample = None
+            return self
+        x0, x1 = x_range
+        if pixels is None:
+            pixels = max(round(abs(x1 - x0)), 1)
+        if not isinstance(pixels, int) or pixels < 1:
+            raise ValueError(f"Invalid number of pixels: {pixels!r}")
+        self._downsample = (x0, x1, pixels)
         return self
 
     def set_curve(self, curve: Callable[[Path], Curve] | None = None) -> Line:
@@ -227,6 +500,12 @@ class Line(Generic[T], WithPath):
     def get_defined(self) -> Accessor[T, bool]:
         return self._defined
 
+    def get_simplify(self) -> tuple[float | None, str]:
+        return self._tolerance, self._simplify
+
+    def get_downsample(self) -> tuple[float, float, int] | None:
+        return self._downsample
+
     def get_curve(self) -> Callable[[Path], Curve]:
         return self._curve
 
@@ -77,7 +77,7 @@ class Link(Generic[T], WithPath):
         self._output.line_end()
         if buffer:
             self._output = None
-            return str(buffer) or None
+            return self._release(buffer) or None
 
     def set_source(self, source: Accessor[T, float]) -> Link:
         """
@@ -18,6 +18,25 @@ def offset_diverging(series: list[Series[T]], order: list[int]):
     if n == 0:
         return
     m = len(series[order[0]])
+    if all(isinstance(s, Series) for s in series):
+        # Columns of series are read and written directly
+        columns = [(series[i].y0s, series[i].y1s) for i in order]
+        for j in range(m):
+            yp = yn = 0.0
+            for y0s, y1s in columns:
+                dy = y1s[j] - y0s[j]
+                if dy > 0:
+                    y0s[j] = yp
+                    yp += dy
+                    y1s[j] = yp
+                elif dy < 0:
+                    y1s[j] = yn
+                    yn += dy
+                    y0s[j] = yn
+                else:
+                    y0s[j] = 0
+                    y1s[j] = dy
+        return
     for j in range(m):
         yp = yn = 0.0
         for i in range(n):
@@ -21,6 +21,19 @@ def offset_expand(series: list[Series[T]], order: list[int]):
     if n == 0:
         return
     m = len(series[0])
+    if all(isinstance(s, Series) for s in series):
+        # Columns of series are read and written directly
+        columns = [s.y1s for s in series]
+        for j in range(m):
+            y = 0
+            for y1s in columns:
+                x = y1s[j]
+                y += 0.0 if isnan(x) else x
+            if y:
+                for y1s in columns:
+                    y1s[j] /= y
+        offset_none(series, order)
+        return
     for j in range(m):
         y = 0
         for i in range(n):
@@ -20,6 +20,19 @@ def offset_none(series: list[Series[T]], order: list[int]):
         return
     s1: Series[T] = series[order[0]]
     m = len(s1)
+    if all(isinstance(s, Series) for s in series):
+        # Columns of series are read and written directly
+        for i in range(1, n):
+            y0s = s1.y0s
+            y1s = s1.y1s
+            s1 = series[order[i]]
+            z0s = s1.y0s
+            z1s = s1.y1s
+            for j in range(m):
+                y = y1s[j]
+                z0s[j] = y0s[j] if isnan(y) else y
+                z1s[j] += z0s[j]
+        return
     for i in range(1, n):
         s0: Series[T] = s1
         s1: Series[T] = series[order[i]]
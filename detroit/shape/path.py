@@ -2,10 +2,14 @@ import math
 
 from ..path import Path
 
+# Maximum number of paths kept for reuse by a generator
+POOL_SIZE = 4
+
 
 class WithPath:
     def __init__(self):
         self._digits = 3
+        self._pool = []
 
     def digits(self, digits=None):
         if digits is None:
@@ -17,4 +21,25 @@ class WithPath:
         return self
 
     def _path(self):
+        # Paths given back by `_release` are emptied and reused; a new path is
+        # created when none is available, such as in nested or concurrent
+        # calls of the generator, so that a path is never shared by two calls.
+        digits = self._digits or 3
+        pool = self._pool
+        while pool:
+            try:
+                buffer = pool.pop()
+            except IndexError:
+                break
+            if buffer.digit == digits:
+                buffer.clear()
+                return buffer
         return Path(self._digits)
+
+    def _release(self, buffer):
+        # Returns the content of a path obtained from `_path` and gives the
+        # path back to the pool; it must not be used afterwards.
+        text = str(buffer)
+        if len(self._pool) < POOL_SIZE:
+            self._pool.append(buffer)
+        return text
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from array import array
 from collections.abc import Iterator
 from typing import Any, Generic
 
@@ -22,19 +23,19 @@ class Serie(Generic[T]):
         self._values = values
         self.data = data
 
-    def __getitem__(self, index: int) -> float:
+    def __getitem__(self, index: int | slice) -> float | list[float]:
         """
         Returns the value of a specific index
 
         Parameters
         ----------
-        index : int
+        index : int | slice
             Index value
 
         Returns
         -------
-        float
-            Value
+        float | list[float]
+            Value or list of values when :code:`index` is a slice
         """
         return self._values[index]
 
@@ -95,9 +96,59 @@ class Serie(Generic[T]):
         return str(self)
 
 
+class SerieView(Serie[T]):
+    """
+    Point of a :code:`Series` reading and writing its values directly in the
+    columns of the series.
+
+    Parameters
+    ----------
+    series : Series[T]
+        Series containing the point
+    index : int
+        Index of the point in the series
+    """
+
+    def __init__(self, series: Series[T], index: int):
+        self._series = series
+        self._index = index
+
+    @property
+    def _values(self) -> list[float]:
+        return [self._series.y0s[self._index], self._series.y1s[self._index]]
+
+    @property
+    def data(self) -> T:
+        return self._series.data[self._index]
+
+    @data.setter
+    def data(self, data: T):
+        self._series.data[self._index] = data
+
+    def __getitem__(self, index: int | slice) -> float | list[float]:
+        if isinstance(index, slice):
+            return self._values[index]
+        return self._series._columns[index][self._index]
+
+    def __setitem__(self, index: int, value: float):
+        self._series._columns[index][self._index] = value
+
+    def __len__(self) -> int:
+        return 2
+
+
 class Series(Generic[T]):
     """
-    List of :code:`Serie` associated to a :code:`key` and an :code:`index`
+    List of :code:`Serie` associated to a :code:`key` and an :code:`index`.
+
+    Lower and upper values of points are stored in two :code:`array("d")`
+    columns, :code:`y0s` and :code:`y1s`, and their data in the list
+    :code:`data`. Points returned by indexing or iteration are views on these
+    columns. The columns can be passed directly to
+    :meth:`Area.from_columns <detroit.shape.area.Area.from_columns>`.
+
+    Since columns are arrays of floats, integer values are returned as
+    floats (:code:`1.0` instead of :code:`1`).
 
     Parameters
     ----------
@@ -106,25 +157,37 @@ class Series(Generic[T]):
     """
 
     def __init__(self, series: list[Serie[T]] | None = None):
-        self._series = series or []
+        self.y0s = array("d")
+        self.y1s = array("d")
+        self.data = []
+        self._columns = (self.y0s, self.y1s)
+        for serie in series or []:
+            self.append(serie)
         self.key = None
         self.index = None
 
-    def __getitem__(self, index: int) -> Serie[T]:
+    def __getitem__(self, index: int | slice) -> Serie[T] | list[Serie[T]]:
         """
         Gets a serie given an index
 
         Parameters
         ----------
-        index : int
+        index : int | slice
             Index value
 
         Returns
         -------
-        Serie[T]
-            Serie value
+        Serie[T] | list[Serie[T]]
+            Serie value or list of series when :code:`index` is a slice
         """
-        return self._series[index]
+        n = len(self.data)
+        if isinstance(index, slice):
+            return [SerieView(self, i) for i in range(n)[index]]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("Series index out of range")
+        return SerieView(self, index)
 
     def __setitem__(self, index: int, serie: Serie[T]):
         """
@@ -137,7 +200,9 @@ class Series(Generic[T]):
         serie : Serie[T]
             Serie value
         """
-        self._series[index] = serie
+        self.y0s[index] = serie[0]
+        self.y1s[index] = serie[1]
+        self.data[index] = serie.data
 
     def __len__(self) -> int:
         """
@@ -148,7 +213,7 @@ class Series(Generic[T]):
         int
             Length
         """
-        return len(self._series)
+        return len(self.data)
 
     def __eq__(self, series: Series | Any) -> bool:
         """
@@ -167,7 +232,9 @@ class Series(Generic[T]):
         if not isinstance(series, Series):
             return False
         return (
-            self._series == series._series
+            self.y0s == series.y0s
+            and self.y1s == series.y1s
+            and self.data == series.data
             and self.key == series.key
             and self.index == series.index
         )
@@ -181,7 +248,7 @@ class Series(Generic[T]):
         Iterator[Serie[T]]
             Iterator
         """
-        return iter(self._series)
+        return (SerieView(self, index) for index in range(len(self.data)))
 
     def append(self, serie: Serie[T]):
         """
@@ -192,7 +259,22 @@ class Series(Generic[T]):
         serie : Serie[T]
             Serie value
         """
-        self._series.append(serie)
+        self.y0s.append(serie[0])
+        self.y1s.append(serie[1])
+        self.data.append(serie.data)
+
+    def extend(self, series: Series[T]):
+        """
+        Appends the points of another series to the current series.
+
+        Parameters
+        ----------
+        series : Series[T]
+            Other series
+        """
+        self.y0s.extend(series.y0s)
+        self.y1s.extend(series.y1s)
+        self.data.extend(series.data)
 
     def __str__(self) -> str:
         """
@@ -203,7 +285,7 @@ class Series(Generic[T]):
         str
            String representing the current class
         """
-        return f"Series({self._series}, key={self.key}, index={self.index})"
+        return f"Series({list(self)}, key={self.key}, index={self.index})"
 
     def __repr__(self):
         return str(self)
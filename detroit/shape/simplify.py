@@ -0,0 +1,371 @@
+import heapq
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from itertools import islice
+from math import inf
+from operator import ge, le
+
+
+def simplify_radial(
+    xs: Sequence[float], ys: Sequence[float], tolerance: float
+) -> list[int]:
+    """
+    Returns the indices of points which are farther than :code:`tolerance`
+    from the previous kept point. The first and last points are always kept.
+
+    Parameters
+    ----------
+    xs : Sequence[float]
+        x positions
+    ys : Sequence[float]
+        y positions
+    tolerance : float
+        Minimal distance between two consecutive points
+
+    Returns
+    -------
+    list[int]
+        Indices of kept points
+    """
+    n = len(xs)
+    if n < 3:
+        return list(range(n))
+    sq_tolerance = tolerance * tolerance
+    px = xs[0]
+    py = ys[0]
+    indices = [0]
+    for i in range(1, n - 1):
+        x = xs[i]
+        y = ys[i]
+        dx = x - px
+        dy = y - py
+        if dx * dx + dy * dy > sq_tolerance:
+            indices.append(i)
+            px = x
+            py = y
+    indices.append(n - 1)
+    return indices
+
+
+def simplify_douglas_peucker(
+    xs: Sequence[float], ys: Sequence[float], tolerance: float
+) -> list[int]:
+    """
+    Returns the indices of points kept by the Douglas-Peucker algorithm: a
+    point is kept if it is farther than :code:`tolerance` from the segment
+    joining the kept points around it.
+
+    Parameters
+    ----------
+    xs : Sequence[float]
+        x positions
+    ys : Sequence[float]
+        y positions
+    tolerance : float
+        Maximal distance between removed points and the simplified line
+
+    Returns
+    -------
+    list[int]
+        Indices of kept points
+    """
+    n = len(xs)
+    if n < 3:
+        return list(range(n))
+    sq_tolerance = tolerance * tolerance
+    keep = bytearray(n)
+    keep[0] = keep[n - 1] = 1
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        ax = xs[first]
+        ay = ys[first]
+        dx = xs[last] - ax
+        dy = ys[last] - ay
+        sq_length = dx * dx + dy * dy
+        max_sq_distance = sq_tolerance
+        index = 0
+        for i in range(first + 1, last):
+            px = xs[i] - ax
+            py = ys[i] - ay
+            if sq_length:
+                t = (px * dx + py * dy) / sq_length
+                if t > 1:
+                    px -= dx
+                    py -= dy
+                elif t > 0:
+                    px -= t * dx
+                    py -= t * dy
+            sq_distance = px * px + py * py
+            if sq_distance > max_sq_distance:
+                index = i
+                max_sq_distance = sq_distance
+        if index:
+            keep[index] = 1
+            stack.append((first, index))
+            stack.append((index, last))
+    return [i for i in range(n) if keep[i]]
+
+
+def simplify_visvalingam(
+    xs: Sequence[float], ys: Sequence[float], tolerance: float
+) -> list[int]:
+    """
+    Returns the indices of points kept by the Visvalingam-Whyatt algorithm:
+    points are removed by increasing area of the triangle formed with their
+    neighbors, as long as this area is smaller than :code:`tolerance ** 2`.
+
+    Parameters
+    ----------
+    xs : Sequence[float]
+        x positions
+    ys : Sequence[float]
+        y positions
+    tolerance : float
+        Square root of the minimal area of kept triangles
+
+    Returns
+    -------
+    list[int]
+        Indices of kept points
+    """
+    n = len(xs)
+    if n < 3:
+        return list(range(n))
+    threshold = tolerance * tolerance
+    previous = list(range(-1, n - 1))
+    next_ = list(range(1, n + 1))
+
+    def area(i: int) -> float:
+        a = previous[i]
+        b = next_[i]
+        x = xs[i]
+        y = ys[i]
+        return abs((xs[a] - x) * (ys[b] - y) - (xs[b] - x) * (ys[a] - y)) / 2
+
+    areas = [inf] * n
+    for i in range(1, n - 1):
+        areas[i] = area(i)
+    heap = [(areas[i], i) for i in range(1, n - 1)]
+    heapq.heapify(heap)
+    removed = bytearray(n)
+    while heap:
+        value, i = heapq.heappop(heap)
+        if removed[i] or value != areas[i]:
+            continue
+        if value >= threshold:
+            break
+        removed[i] = 1
+        a = previous[i]
+        b = next_[i]
+        next_[a] = b
+        previous[b] = a
+        for j in (a, b):
+            if 0 < j < n - 1:
+                # The area of a point never decreases below the area of the
+                # points removed before it.
+                areas[j] = max(area(j), value)
+                heapq.heappush(heap, (areas[j], j))
+    return [i for i in range(n) if not removed[i]]
+
+
+def radial_first(
+    simplify: Callable[[Sequence[float], Sequence[float], float], list[int]],
+) -> Callable[[Sequence[float], Sequence[float], float], list[int]]:
+    """
+    Returns a simplification function which removes points close to their
+    previous point with :func:`simplify_radial` before calling
+    :code:`simplify` on the remaining points. The first pass is linear and
+    removes most points of dense lines.
+
+    Parameters
+    ----------
+    simplify : Callable[[Sequence[float], Sequence[float], float], list[int]]
+        Simplification function
+
+    Returns
+    -------
+    Callable[[Sequence[float], Sequence[float], float], list[int]]
+        Simplification function
+    """
+
+    def simplify_dense(
+        xs: Sequence[float], ys: Sequence[float], tolerance: float
+    ) -> list[int]:
+        indices = simplify_radial(xs, ys, tolerance)
+        if len(indices) == len(xs):
+            return simplify(xs, ys, tolerance)
+        kept = simplify([xs[i] for i in indices], [ys[i] for i in indices], tolerance)
+        return [indices[i] for i in kept]
+
+    return simplify_dense
+
+
+def downsample_m4(
+    xs: Sequence[float], ys: Sequence[float], x0: float, x1: float, pixels: int
+) -> list[int]:
+    """
+    Returns the indices of points kept by the M4 aggregation: the range
+    :code:`[x0, x1]` is divided into :code:`pixels` columns and, for each
+    column, only its first, last, lowest and highest points are kept. Points
+    outside of the range belong to the first or last column.
+
+    Only monotonic x positions (increasing or decreasing) are downsampled,
+    columns being found by binary search. Otherwise (including when x
+    positions contain NaN), keeping extrema of columns would reorder the
+    path, so every point is kept.
+
+    Parameters
+    ----------
+    xs : Sequence[float]
+        x positions
+    ys : Sequence[float]
+        y positions
+    x0 : float
+        Start of the x range
+    x1 : float
+        End of the x range
+    pixels : int
+        Number of columns
+
+    Returns
+    -------
+    list[int]
+        Indices of kept points
+    """
+    n = len(xs)
+    if n <= 4:
+        return list(range(n))
+    if all(map(le, xs, islice(xs, 1, None))):
+        return downsample_sorted(xs, ys, x0, x1, pixels)
+    if all(map(ge, xs, islice(xs, 1, None))):
+        last = n - 1
+        indices = downsample_sorted(xs[::-1], ys[::-1], x0, x1, pixels)
+        return [last - i for i in reversed(indices)]
+    return list(range(n))
+
+
+def downsample_sorted(
+    xs: Sequence[float], ys: Sequence[float], x0: float, x1: float, pixels: int
+) -> list[int]:
+    """
+    Returns the indices of points kept by the M4 aggregation of
+    :func:`downsample_m4` when x positions are sorted in increasing order.
+
+    Parameters
+    ----------
+    xs : Sequence[float]
+        Sorted x positions
+    ys : Sequence[float]
+        y positions
+    x0 : float
+        Start of the x range
+    x1 : float
+        End of the x range
+    pixels : int
+        Number of columns
+
+    Returns
+    -------
+    list[int]
+        Indices of kept points
+    """
+    n = len(xs)
+    low, high = min(x0, x1), max(x0, x1)
+    if low == high:
+        pixels = 1
+    indices = []
+
+    def keep(start: int, stop: int):
+        if stop - start <= 4:
+            indices.extend(range(start, stop))
+            return
+        column = ys[start:stop]
+        bottom = start + column.index(min(column))
+        top = start + column.index(max(column))
+        indices.extend(sorted({start, bottom, top, stop - 1}))
+
+    width = (high - low) / pixels
+    start = 0
+    for k in range(1, pixels):
+        stop = bisect_left(xs, low + k * width, start)
+        if stop > start:
+            keep(start, stop)
+            start = stop
+    if start < n:
+        keep(start, n)
+    return indices
+
+
+SIMPLIFICATIONS = {
+    "douglas_peucker": radial_first(simplify_douglas_peucker),
+    "visvalingam": radial_first(simplify_visvalingam),
+}
+
+
+def simplification(
+    method: str,
+) -> Callable[[Sequence[float], Sequence[float], float], list[int]]:
+    """
+    Returns the simplification function associated to :code:`method`.
+
+    Parameters
+    ----------
+    method : str
+        :code:`"douglas_peucker"` or :code:`"visvalingam"`
+
+    Returns
+    -------
+    Callable[[Sequence[float], Sequence[float], float], list[int]]
+        Function returning the indices of kept points
+    """
+    try:
+        return SIMPLIFICATIONS[method]
+    except KeyError:
+        raise ValueError(
+            f"Invalid simplification method {method!r}; expected one of "
+            f"{list(SIMPLIFICATIONS)}."
+        ) from None
+
+
+def reduce_points(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    downsample: tuple[float, float, int] | None,
+    tolerance: float | None,
+    method: str,
+) -> list[int]:
+    """
+    Returns the indices of points kept after M4 downsampling (when
+    :code:`downsample` is not :code:`None`) followed by simplification (when
+    :code:`tolerance` is not :code:`None`).
+
+    Parameters
+    ----------
+    xs : Sequence[float]
+        x positions
+    ys : Sequence[float]
+        y positions
+    downsample : tuple[float, float, int] | None
+        Arguments :code:`x0`, :code:`x1` and :code:`pixels` of
+        :func:`downsample_m4`
+    tolerance : float | None
+        Tolerance of simplification
+    method : str
+        Simplification method
+
+    Returns
+    -------
+    list[int]
+        Indices of kept points
+    """
+    if downsample is None:
+        indices = list(range(len(xs)))
+    else:
+        indices = downsample_m4(xs, ys, *downsample)
+        xs = [xs[i] for i in indices]
+        ys = [ys[i] for i in indices]
+    if tolerance is not None:
+        kept = SIMPLIFICATIONS[method](xs, ys, tolerance)
+        indices = [indices[k] for k in kept]
+    return indices
@@ -6,9 +6,15 @@ from typing import Any, Generic
 from ..array import argpass
 from ..types import T, U, V
 from .constant import constant
-from .offset import offset_none
-from .order import order_none
-from .series import Serie, Series
+from .offset import offset_diverging, offset_expand, offset_none
+from .order import order_none, order_reverse
+from .series import Series
+
+# Offsets computing each column independently of the others
+COLUMN_OFFSETS = (offset_none, offset_expand, offset_diverging)
+
+# Orders which do not depend on values
+STATIC_ORDERS = (order_none, order_reverse)
 
 
 def stack_value(d: dict, key: U) -> V:
@@ -57,6 +63,7 @@ class Stack(Generic[T]):
     def __init__(self):
         self._keys = argpass(constant([]))
         self._order = order_none
+        self._static_order = True
         self._offset = offset_none
         self._value = argpass(stack_value)
 
@@ -86,7 +93,9 @@ class Stack(Generic[T]):
             j += 1
             for i in range(n):
                 series = sz[i]
-                series.append(Serie([0, self._value(d, series.key, j, data)], d))
+                series.y0s.append(0)
+                series.y1s.append(self._value(d, series.key, j, data))
+                series.data.append(d)
 
         oz = list(self._order(sz))
         for i in range(n):
@@ -95,6 +104,77 @@ class Stack(Generic[T]):
         self._offset(sz, oz)
         return sz
 
+    def extend(self, series: list[Series], rows: list[T], *args: Any) -> list[Series]:
+        """
+        Appends the given rows of data to series previously generated by this
+        stack and returns the series, updated in place.
+
+        When the offset computes each column independently (:func:`none
+        <detroit.stack_offset_none>`, :func:`expand
+        <detroit.stack_offset_expand>` and :func:`diverging
+        <detroit.stack_offset_diverging>`) and the order does not depend on
+        values (:func:`none <detroit.stack_order_none>`, :func:`reverse
+        <detroit.stack_order_reverse>` or a list of indices), only the new
+        columns are computed. Otherwise, the whole stack is computed again
+        from the data of the series and the new rows. In both cases, series
+        are the same as the series generated from all data at once, as long
+        as values do not depend on rows appended later.
+
+        Parameters
+        ----------
+        series : list[Series]
+            Series generated by this stack
+        rows : list[T]
+            New rows of data
+        *args : Any
+            Additional arguments passed to :code:`keys` method.
+
+        Returns
+        -------
+        list[Series]
+            Updated series
+
+        Examples
+        --------
+
+        >>> stack = d3.stack().set_keys(["a", "b"])
+        >>> series = stack([{"a": 1, "b": 2}])
+        >>> series = stack.extend(series, [{"a": 3, "b": 1}])
+        >>> [[(serie[0], serie[1]) for serie in s] for s in series]
+        [[(0.0, 1.0), (0.0, 3.0)], [(1.0, 3.0), (3.0, 4.0)]]
+        """
+        if not series:
+            series[:] = self(list(rows), *args)
+            return series
+        data = series[0].data + list(rows)
+        if not (self._static_order and self._offset in COLUMN_OFFSETS):
+            series[:] = self(data, *args)
+            return series
+
+        n = len(series)
+        start = len(series[0])
+        columns = []
+        for source in series:
+            column = Series()
+            column.key = source.key
+            column.index = source.index
+            columns.append(column)
+        for j in range(start, len(data)):
+            d = data[j]
+            for column in columns:
+                column.y0s.append(0)
+                column.y1s.append(self._value(d, column.key, j, data))
+                column.data.append(d)
+
+        oz = [0] * n
+        for i, column in enumerate(columns):
+            oz[column.index] = i
+
+        self._offset(columns, oz)
+        for source, column in zip(series, columns):
+            source.extend(column)
+        return series
+
     def set_keys(self, keys: Callable[[...], list[str]] | list[str]) -> Stack:
         """
         Sets the :code:`keys` method and returns itself.
@@ -168,10 +248,13 @@ class Stack(Generic[T]):
         """
         if order is None:
             self._order = order_none
+            self._static_order = True
         elif callable(order):
             self._order = order
+            self._static_order = order in STATIC_ORDERS
         else:
             self._order = constant(list(order))
+            self._static_order = True
         return self
 
     def set_offset(
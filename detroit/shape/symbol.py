@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from zlib import crc32
 
 from ..path import Path
+from ..selection import Selection
 from .constant import constant
 from .path import WithPath
 from .symbols import (
@@ -44,6 +47,58 @@ SYMBOLS_STROKE = [
 ]
 
 
+@lru_cache(maxsize=256)
+def symbol_template(
+    symbol_type: Callable[[Path, float], None], size: float, digits: int
+) -> Path:
+    """
+    Returns the path of a symbol centered on the origin. Paths are computed
+    once per symbol type, size and number of digits, and must not be modified.
+
+    Parameters
+    ----------
+    symbol_type : Callable[[Path, float], None]
+        Symbol type
+    size : float
+        Size of the symbol
+    digits : int
+        Number of digits of the path
+
+    Returns
+    -------
+    Path
+        Path of the symbol
+    """
+    path = Path(digits)
+    symbol_type(path, size)
+    return path
+
+
+@lru_cache(maxsize=256)
+def symbol_path(
+    symbol_type: Callable[[Path, float], None], size: float, digits: int
+) -> str:
+    """
+    Returns the string of :func:`symbol_template`, computed once per symbol
+    type, size and number of digits.
+
+    Parameters
+    ----------
+    symbol_type : Callable[[Path, float], None]
+        Symbol type
+    size : float
+        Size of the symbol
+    digits : int
+        Number of digits of the path
+
+    Returns
+    -------
+    str
+        Path of the symbol
+    """
+    return str(symbol_template(symbol_type, size, digits))
+
+
 class Symbol(WithPath):
     """
     Builds a new symbol generator of the specified symbol type and size.
@@ -78,14 +133,183 @@ class Symbol(WithPath):
             Symbol path
         """
         if self._context is None:
-            buffer = self._path()
-            self._context = buffer
-
+            return self._symbol_path(self._size())
         self._symbol_type(self._context, self._size())
 
-        if buffer:
-            self._context = None
-            return str(buffer)
+    def _symbol_template(self, size: float) -> Path:
+        try:
+            return symbol_template(self._symbol_type, size, self._digits)
+        except TypeError:
+            # Unhashable symbol types are drawn without cache
+            path = Path(self._digits)
+            self._symbol_type(path, size)
+            return path
+
+    def _symbol_path(self, size: float) -> str:
+        try:
+            return symbol_path(self._symbol_type, size, self._digits)
+        except TypeError:
+            return str(self._symbol_template(size))
+
+    def render_many(self, points: Iterable[tuple[float, float]]) -> str | None:
+        """
+        Generates one symbol centered on each point and returns all symbols
+        in a single path, which can be drawn by a single :code:`path` element
+        instead of one translated element per symbol.
+
+        The symbol is drawn once per distinct size (see
+        :func:`symbol_template`) and translated in bulk to the points.
+
+        Parameters
+        ----------
+        points : Iterable[tuple[float, float]]
+            Centers of symbols
+
+        Returns
+        -------
+        str | None
+            Path of all symbols if the symbol generator is not associated to a
+            context
+
+        Examples
+        --------
+
+        >>> symbol = d3.symbol(d3.symbol_square, 16)
+        >>> symbol.render_many([(0, 0), (10, 20)])
+        'M-2,-2h4v4h-4ZM8,18h4v4h-4Z'
+        """
+        context = self._context
+        buffer = None
+        if context is None:
+            context = buffer = self._path()
+        elif not isinstance(context, Path):
+            raise TypeError("'render_many' requires a Path context.")
+
+        def flush(size: float, xs: list[float], ys: list[float]):
+            context.repeat(self._symbol_template(size), xs, ys)
+
+        xs = []
+        ys = []
+        current = None
+        for x, y in points:
+            size = self._size()
+            if size != current and xs:
+                flush(current, xs, ys)
+                xs = []
+                ys = []
+            current = size
+            xs.append(x)
+            ys.append(y)
+        if xs:
+            flush(current, xs, ys)
+
+        if buffer is not None:
+            return self._release(buffer) or None
+
+    def render_uses(
+        self,
+        selection: Selection,
+        points: Iterable[tuple[float, float]],
+        prefix: str = "symbol",
+    ) -> Selection:
+        """
+        Draws one :code:`use` element per point in a group of class
+        :code:`prefix` appended as a child of :code:`selection`. The group
+        holds a :code:`defs` element containing one :code:`symbol` element per
+        distinct path, such that the geometry of each symbol is written once
+        in the document.
+
+        Calling this method again on the same selection with the same
+        :code:`prefix` reuses the group (a direct child of the selected
+        element; groups nested deeper are ignored): existing :code:`symbol` elements are
+        kept and :code:`use` elements are joined to the new points. Other
+        elements of :code:`selection` are left untouched.
+
+        Parameters
+        ----------
+        selection : Selection
+            Selection of the parent element
+        points : Iterable[tuple[float, float]]
+            Positions of symbols
+        prefix : str
+            Class of the group and prefix of the identifiers of :code:`symbol`
+            elements, which are suffixed by a checksum of their path (and by a
+            counter when different paths have the same checksum)
+
+        Returns
+        -------
+        Selection
+            Selection of :code:`use` elements
+
+        Examples
+        --------
+
+        >>> svg = d3.create("svg")
+        >>> symbol = d3.symbol(d3.symbol_square, 16)
+        >>> uses = symbol.render_uses(svg, [(0, 0), (10, 20)])
+        >>> print(svg.to_string())
+        <svg xmlns="http://www.w3.org/2000/svg">
+          <g class="symbol">
+            <defs>
+              <symbol id="symbol-35318bce" overflow="visible">
+                <path d="M-2,-2h4v4h-4Z"/>
+              </symbol>
+            </defs>
+            <use href="#symbol-35318bce" x="0" y="0"/>
+            <use href="#symbol-35318bce" x="10" y="20"/>
+          </g>
+        </svg>
+        """
+        points = list(points)
+        containers = selection.nodes()
+        group = selection.select_all(f"g.{prefix}").filter(
+            lambda d, i, nodes: nodes[i].getparent() in containers
+        )
+        if not group.nodes():
+            group = selection.append("g").attr("class", prefix)
+        defs = group.select("defs")
+        if not defs.nodes():
+            defs = group.append("defs")
+        defined = {
+            path.getparent().get("id"): path.get("d")
+            for path in defs.select_all("symbol path").nodes()
+        }
+        identifiers = {}
+        hrefs = []
+        for _ in points:
+            size = self._size()
+            identifier = identifiers.get(size)
+            if identifier is None:
+                d = self._symbol_path(size)
+                base = identifier = f"{prefix}-{crc32(d.encode()):08x}"
+                k = 0
+                # Different paths with the same checksum get distinct suffixes
+                while defined.get(identifier, d) != d:
+                    k += 1
+                    identifier = f"{base}-{k}"
+                identifiers[size] = identifier
+                if identifier not in defined:
+                    defined[identifier] = d
+                    (
+                        defs.append("symbol")
+                        .attr("id", identifier)
+                        .attr("overflow", "visible")
+                        .append("path")
+                        .attr("d", d)
+                    )
+            hrefs.append(f"#{identifier}")
+        return (
+            group.select_all("use")
+            .data(points)
+            .join("use")
+            .attr_columns(
+                {
+                    "href": hrefs,
+                    "x": [x for x, _ in points],
+                    "y": [y for _, y in points],
+                }
+            )
+        )
 
     def set_symbol_type(
         self, symbol_type: Callable[[Path, int | float], None]
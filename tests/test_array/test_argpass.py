@@ -1,6 +1,8 @@
+from copy import deepcopy
 from operator import itemgetter
 
 from detroit.array import argpass
+from detroit.array.argpass import ARITIES, argpass2
 
 
 def test_argpass_1():
@@ -18,3 +20,26 @@ def test_argpass_2():
     args = [[0.2, -0.8], 0, [[0.2, -0.8], [0.9, 0.7]]]
     assert argpass(get_x) == get_x
     assert argpass(get_x)(*args) == 0.2
+
+
+def test_argpass_3():
+    def f(d, i=0):
+        return d + i
+
+    wrapped = argpass(f)
+    assert isinstance(wrapped, argpass2)
+    assert f.__code__ in ARITIES
+    assert argpass(wrapped) is wrapped
+    assert wrapped(1) == 1
+    assert wrapped(1, 2) == 3
+    assert wrapped(1, 2, None, None) == 3
+    assert deepcopy(wrapped)(1, 2) == 3
+
+
+def test_argpass_4():
+    def f(a, b, c, d):
+        return a + b + c + d
+
+    assert argpass(lambda: 1)(1, 2, 3) == 1
+    assert argpass(lambda a, b, c: a + b + c)(1, 2, 3, 4) == 6
+    assert argpass(f)(1, 2, 3, 4, 5) == 10
@@ -386,3 +386,80 @@ def test_path_53():
     p = d3.path()
     p.move_to(150, 100), p.rect(100, 200, 50, 25)
     assert str(p) == "M150,100M100,200h50v25h-50Z"
+
+
+def test_path_54():
+    p = d3.path()
+    p.move_to(-0.0001, 1.5), p.line_to(2.0004, -3), p.rect(0, 0, 0, -0.0)
+    assert str(p) == "M0,1.500L2,-3M0,0h0v0h-0Z"
+    p.line_to(1e16, float("nan"))
+    assert str(p) == "M0,1.500L2,-3M0,0h0v0h-0ZL1e+16,nan"
+
+
+def test_path_55():
+    p = d3.path()
+    p.move_to(150, 50), p.line_to(200, 100)
+    assert str(p) == "M150,50L200,100"
+    p.clear()
+    assert str(p) == ""
+    p.arc_to(270, 39, 163, 100, 53)
+    assert str(p) == "M270,39"
+    p.clear()
+    p.move_to(100, 50), p.line_to(200, 50)
+    assert str(p) == "M100,50L200,50"
+
+
+def test_path_56():
+    from array import array
+
+    p = d3.path()
+    p.move_to(0, 0)
+    p.polyline([1, 2.5, 3], array("d", [4, 5, 6.25]))
+    assert str(p) == "M0,0M1,4L2.500,5L3,6.250"
+    p.polygon(array("i", [0, 10, 10]), memoryview(array("d", [0, 0, 10])))
+    assert str(p) == "M0,0M1,4L2.500,5L3,6.250M0,0L10,0L10,10Z"
+    p.arc(0, 0, 0, 0, 0)
+    assert str(p) == "M0,0M1,4L2.500,5L3,6.250M0,0L10,0L10,10Z"
+    p.polyline([], [])
+    assert str(p) == "M0,0M1,4L2.500,5L3,6.250M0,0L10,0L10,10Z"
+    with pytest.raises(ValueError):
+        p.polyline([1, 2], [3])
+
+
+def test_path_57():
+    template = d3.path()
+    template.move_to(1, 0), template.arc(0, 0, 1, 0, math.pi), template.close_path()
+    p = d3.path()
+    p.repeat(template, [10, 20.5], [0, -1])
+    assert str(p) == "M11,0A1,1,0,1,1,9,0ZM21.500,-1A1,1,0,1,1,19.500,-1Z"
+    p.line_to(0, 0)
+    assert str(p).endswith("ZL0,0")
+    p.repeat(d3.path(), [1], [2])
+    assert str(p).endswith("ZL0,0")
+    template.arc_to(1, 1, 2, 2, 1)
+    with pytest.raises(ValueError):
+        p.repeat(template, [0], [0])
+
+
+def test_path_58():
+    p = Path()
+    p.move_to("1", "2")
+    p.line_to("2.5", 3)
+    p.polyline(["3", "4"], ["5", "6"])
+    assert str(p) == "M1,2L2.500,3M3,5L4,6"
+    with pytest.raises(ValueError):
+        p.line_to("a", 1)
+    assert str(p) == "M1,2L2.500,3M3,5L4,6"
+
+
+def test_path_59():
+    p = Path(1)
+    p.rect(0, 0, -1e-9, 1)
+    assert str(p) == "M0,0h0v1h-0Z"
+    p = Path(1)
+    p.rect(0, -1e-9, 1e-9, -5)
+    assert str(p) == "M0,0h0v-5h-0Z"
+    p = Path(1)
+    p.rect(0, 0, -5, 1)
+    p.line_to(-1e-9, 2)
+    assert str(p) == "M0,0h-5v1h--5ZL0,2"
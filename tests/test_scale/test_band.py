@@ -268,3 +268,10 @@ def test_band_28():
     assert s1.get_range() == [3, 5]
     assert list(map(s1, s1.get_domain())) == [3, 4]
     assert list(map(s2, s2.get_domain())) == [5, 6]
+
+
+def test_band_29():
+    s = d3.scale_band(["a", "b", "c"], [0, 120]).set_padding(0.2)
+    values = ["a", "c", "d", "b"]
+    assert s.map_many(values) == [s(v) for v in values]
+    assert s.get_domain() == ["a", "b", "c"]
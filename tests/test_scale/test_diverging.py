@@ -151,3 +151,25 @@ def test_diverging_16():
     s = d3.scale_diverging([1, 3, 10])
     assert s.get_interpolator()(0.5) == 3
     assert s.get_range() == [1, 3, 10]
+
+
+def test_diverging_17():
+    values = [-2, -1, 0, 0.5, 1, 3, math.nan, None]
+    for s in [
+        d3.scale_diverging([-1, 0, 1], d3.interpolate_rgb("red", "blue")),
+        d3.scale_diverging([1, 0, -1], lambda t: t).set_clamp(True),
+    ]:
+        assert s.map_many(values) == [s(v) for v in values]
+
+
+def test_diverging_18():
+    s = d3.scale_diverging([-1, 0, 1], lambda t: t).set_quantization(5)
+    assert s.get_quantization() == 5
+    assert s.to_lut(5) == [0, 0.25, 0.5, 0.75, 1]
+    assert s(0) == 0.5
+    assert s(0.3) == 0.75
+    assert s(-0.9) == 0
+    assert s(2) == 1.5
+    assert s.map_many([0.3, 2, math.nan]) == [0.75, 1.5, None]
+    assert s.set_interpolator(lambda t: -t)(0.3) == -0.75
+    assert s.copy().get_quantization() == 5
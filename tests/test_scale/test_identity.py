@@ -213,3 +213,9 @@ def test_identity_17():
     s4.set_range([2, 3])
     assert s3.get_range() == [1, 2]
     assert s4.get_range() == [2, 3]
+
+
+def test_identity_18():
+    s = d3.scale_identity().set_unknown(-1)
+    assert s.map_many([1, None, math.nan, 2.5]) == [1, -1, -1, 2.5]
+    assert s.invert_many([1, math.nan]) == [1, -1]
@@ -4,6 +4,7 @@ from datetime import datetime
 import pytest
 
 import detroit as d3
+from detroit.format import default_locale
 
 
 def round_epsilon(x):
@@ -667,3 +668,84 @@ def test_linear_54():
     assert x(math.nan) == 2
     assert y(math.nan) == 3
     assert x.get_unknown() == 2
+
+
+def test_linear_55():
+    values = [-1, 0, 0.25, 1.5, None, math.nan]
+    for x in [
+        d3.scale_linear([1, 2], [10, 20]),
+        d3.scale_linear([1, 2], [10, 20]).set_clamp(True).set_unknown(-1),
+        d3.scale_linear([0, 1, 2], ["red", "blue", "green"]),
+    ]:
+        assert x.map_many(values) == [x(v) for v in values]
+    x = d3.scale_linear([1, 2], [10, 20]).set_clamp(True)
+    assert x.invert_many([0, 15, 30]) == [x.invert(v) for v in [0, 15, 30]]
+
+
+def test_linear_56():
+    x = d3.scale_linear([10, 0], [0, 100]).set_clamp(True)
+    assert [x(v) for v in [-5, 0, 2.5, 10, 20]] == [100, 100, 75, 0, 0]
+    assert [x.invert(v) for v in [-50, 25, 150]] == [10, 7.5, 0]
+    x.set_range_round([0, 99])
+    assert x(2.5) == 74
+    x.set_interpolate(d3.interpolate_number).set_range(["0", "100"])
+    assert x(2.5) == 75
+    x.set_domain([0, 5, 10]).set_range([0, 10, 1000])
+    assert x(7.5) == 505
+    x.set_domain([0, 10]).set_range([0, 100]).set_clamp(False)
+    assert x(20) == 200 and x.invert(200) == 20
+
+
+def test_linear_57():
+    domain = [i / 100 for i in range(101)]
+    x = d3.scale_linear(domain, [i * i for i in range(101)])
+    assert x(0.255) == pytest.approx(25 * 25 + 0.5 * (26 * 26 - 25 * 25))
+    assert x(0.5) == 2500
+    assert x(-0.01) == pytest.approx(-1)
+    assert x(2) == pytest.approx(100 * 100 + 100 * 199)
+    values = [-1, 0, 0.013, 0.5, 0.99, 1, 1.5, math.nan, None]
+    assert x.map_many(values) == [x(v) for v in values]
+    values = sorted(i / 997 for i in range(997))
+    assert x.map_many(values) == [x(v) for v in values]
+    assert x.invert_many([0, 2500, 10000]) == [0, 0.5, 1]
+
+
+def test_linear_58():
+    s = d3.scale_linear([0, 1])
+    ticks = s.ticks(5)
+    assert s.ticks(5) == ticks == [0, 0.2, 0.4, 0.6, 0.8, 1]
+    assert s.ticks(5) is not s.ticks(5)
+    f = s.tick_format(5, "+f")
+    assert s.tick_format(5, "+f") is f
+    assert s.tick_cache_info() == (4, 2, 2)
+    s.set_domain([0, 10])
+    assert s.tick_cache_info().currsize == 0
+    assert s.ticks(5) == [0, 2, 4, 6, 8, 10]
+    s.set_range([0, 100])
+    assert s.tick_cache_info() == (4, 3, 0)
+    s.ticks(5).append(12)
+    assert s.ticks(5) == [0, 2, 4, 6, 8, 10]
+    s.tick_cache_clear()
+    assert s.tick_cache_info() == (0, 0, 0)
+    assert s.set_domain([0.1, 9.9]).nice().ticks(5) == [0, 2, 4, 6, 8, 10]
+
+
+def test_linear_59():
+    x = d3.scale_linear([0, 1, 2, 3], [0, 10, 5, 20])
+    values = [2, 7, 9, 12, 4, 18, 1]
+    assert x.invert_many(values) == [x.invert(v) for v in values]
+    assert x.invert_many(values)[1] == pytest.approx(2.1333333333333333)
+    x = d3.scale_linear([0, 10, 5, 20], [0, 1, 2, 3])
+    values = [2, 7, 9, 12, 4, 18, 1, None, math.nan]
+    assert x.map_many(values) == [x(v) for v in values]
+
+
+def test_linear_60(monkeypatch):
+    s = d3.scale_linear([0, 10000])
+    assert s.tick_format(2, ",.0f")(10000) == "10,000"
+    locale = d3.format_default_locale({"thousands": " ", "grouping": [3]})
+    monkeypatch.setattr(default_locale, "locale", locale)
+    assert s.tick_format(2, ",.0f")(10000) == "10 000"
+    monkeypatch.undo()
+    assert s.tick_format(2, ",.0f")(10000) == "10,000"
+    assert s.tick_cache_info() == (1, 2, 2)
@@ -1140,3 +1140,21 @@ def test_log_46():
         assert x.set_domain([-1, 1]).ticks() == []
     with pytest.raises(ValueError):
         assert x.set_domain([0, 0]).ticks() == []
+
+
+def test_log_47():
+    x = d3.scale_log([1, 100], [0, 2]).set_clamp(True)
+    assert x.map_many([0.5, 1, 10, 1000]) == [x(v) for v in [0.5, 1, 10, 1000]]
+    assert x.invert_many([0, 1, 3]) == [x.invert(v) for v in [0, 1, 3]]
+
+
+def test_log_48():
+    s = d3.scale_log().set_domain([1, 8])
+    assert s.ticks() == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert s.ticks() == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert s.tick_cache_info() == (1, 1, 1)
+    s.set_base(2)
+    assert s.ticks() == [1, 1.5, 2, 2.5, 3, 3.5, 4, 4.5, 5, 5.5, 6, 6.5, 7, 7.5, 8]
+    assert s.tick_cache_info() == (1, 2, 1)
+    s.nice()
+    assert s.tick_cache_info().currsize == 0
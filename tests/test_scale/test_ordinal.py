@@ -232,3 +232,17 @@ def test_ordinal_22():
     assert s2(2) == "baz"
     assert s1.get_range() == ["bar", "foo"]
     assert s2.get_range() == ["foo", "baz"]
+
+
+def test_ordinal_23():
+    s = d3.scale_ordinal(["a", "b"], ["red", "green", "blue"])
+    assert s.map_many(["b", "a", "c", "d", "c"]) == [
+        "green",
+        "red",
+        "blue",
+        "red",
+        "blue",
+    ]
+    assert s.get_domain() == ["a", "b", "c", "d"]
+    s = d3.scale_ordinal(["a"], ["red"]).set_unknown("gray")
+    assert s.map_many(["a", "z"]) == ["red", "gray"]
@@ -160,3 +160,13 @@ def test_quantile_17():
     assert s(2) == 0
     assert s(3) == 0
     assert s(21) == 3
+
+
+def test_quantile_18():
+    s = (
+        d3.scale_quantile()
+        .set_domain([3, 6, 7, 8, 8, 10, 13, 15, 16, 20])
+        .set_range([0, 1, 2, 3])
+    )
+    values = [1, 7, 8, 9, 15, 21, None, math.nan]
+    assert s.map_many(values) == [s(v) for v in values]
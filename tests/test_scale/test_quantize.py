@@ -141,3 +141,9 @@ def test_quantize_13():
         e = s.invert_extent(y)
         assert s(e[0]) == y
         assert s(e[1]) == (y + 1 if y < 9 else y)
+
+
+def test_quantize_14():
+    s = d3.scale_quantize([0, 1], ["a", "b", "c"]).set_unknown("?")
+    values = [-1, 0, 0.3, 0.5, 0.9, 2, None, math.nan]
+    assert s.map_many(values) == [s(v) for v in values]
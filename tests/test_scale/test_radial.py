@@ -108,3 +108,9 @@ def test_radial_12():
     assert d3.scale_radial([-1, -2]).set_clamp(True)(-0.5) == -1
     assert d3.scale_radial().set_clamp(True)(-0.5) == 0
     assert d3.scale_radial([-0.25, 0], [1, 2]).set_clamp(True)(-0.5) == 1
+
+
+def test_radial_13():
+    x = d3.scale_radial([0, 100], [0, 10]).set_round(True)
+    assert x.map_many([0, 25, 50, 100]) == [0, 5, 7, 10]
+    assert x.invert_many([0, 5, 10]) == [x.invert(v) for v in [0, 5, 10]]
@@ -125,3 +125,35 @@ def test_sequential_14():
     s = d3.scale_sequential([1, 3])
     assert s.get_interpolator()(0.5) == 2
     assert s.get_range() == [1, 3]
+
+
+def test_sequential_15():
+    values = [-1, 0, 0.5, 1, 2, None, math.nan]
+    for s in [
+        d3.scale_sequential([0, 1], d3.interpolate_rgb("red", "blue")),
+        d3.scale_sequential(d3.interpolate_rgb("red", "blue")).set_clamp(True),
+        d3.scale_sequential([1, 1], lambda t: t).set_unknown("none"),
+    ]:
+        assert s.map_many(values) == [s(v) for v in values]
+    s = d3.scale_sequential_log([1, 10], lambda t: t)
+    assert s.map_many([1, 5, 100]) == [s(v) for v in [1, 5, 100]]
+
+
+def test_sequential_16():
+    s = d3.scale_sequential([0, 10], d3.interpolate_rgb("red", "blue"))
+    assert s.to_lut(3) == ["rgb(255, 0, 0)", "rgb(128, 0, 128)", "rgb(0, 0, 255)"]
+    assert s.get_quantization() is None
+    assert s.set_quantization(3) == s
+    assert s.get_quantization() == 3
+    assert s(0) == "rgb(255, 0, 0)"
+    assert s(2) == "rgb(255, 0, 0)"
+    assert s(3) == "rgb(128, 0, 128)"
+    assert s(10) == "rgb(0, 0, 255)"
+    assert s(20) == d3.interpolate_rgb("red", "blue")(2)
+    assert s.map_many([2, 3, 20, None]) == [s(2), s(3), s(20), None]
+    s.set_range(["black", "white"])
+    assert s(3) == "rgb(128, 128, 128)"
+    assert s.copy().get_quantization() == 3
+    assert s.set_quantization(None)(3) == "rgb(77, 77, 77)"
+    with pytest.raises(ValueError):
+        s.set_quantization(1)
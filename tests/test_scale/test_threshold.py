@@ -70,3 +70,9 @@ def test_threshold_8():
     assert x.invert_extent(b) == [1 / 3, 2 / 3]
     assert x.invert_extent(c) == [2 / 3, None]
     assert x.invert_extent({}) == [None, None]
+
+
+def test_threshold_9():
+    s = d3.scale_threshold([0, 1], ["a", "b", "c"])
+    values = [-1, 0, 0.5, 1, 2, None, math.nan]
+    assert s.map_many(values) == [s(v) for v in values]
@@ -523,3 +523,21 @@ def test_time_46():
     assert f(datetime(2011, 2, 2, 12, 1, 9)) == ":09"
     assert f(datetime(2011, 2, 2, 12, 1, 10)) == ":10"
     assert f(datetime(2011, 2, 2, 12, 1, 11)) == ":11"
+
+
+def test_time_47():
+    x = d3.scale_time([datetime(2009, 1, 1), datetime(2010, 1, 1)], [0, 1200])
+    dates = [datetime(2009, 1, 1), datetime(2009, 7, 1), datetime(2010, 1, 1)]
+    assert x.map_many(dates) == [x(d) for d in dates]
+    assert x.invert_many([0, 600, 1200]) == [x.invert(v) for v in [0, 600, 1200]]
+
+
+def test_time_48():
+    s = d3.scale_time([datetime(2009, 1, 1), datetime(2009, 1, 2)])
+    ticks = s.ticks(4)
+    assert s.ticks(4) == ticks
+    assert s.tick_format() is s.tick_format()
+    assert s.tick_cache_info() == (2, 2, 2)
+    s.set_domain([datetime(2009, 1, 1), datetime(2009, 1, 3)])
+    assert s.ticks(4) != ticks
+    assert s.tick_cache_info() == (2, 3, 1)
@@ -0,0 +1,94 @@
+import io
+
+import pytest
+
+import detroit as d3
+from detroit.selection.emit import EmitSelection
+
+
+def build(emit):
+    svg = d3.create("svg", emit=emit).attr("width", 100)
+    g = svg.append("g").attr("class", "points")
+    (
+        g.select_all("circle")
+        .data(list(range(5)))
+        .join("circle")
+        .attrs({"cx": lambda d: d, "cy": lambda d, i: i * 2})
+        .style("fill", "red")
+        .classed("even", lambda d: d % 2 == 0)
+    )
+    text = svg.append("text").text('a<b&"c').attr("title", 'x"\n<')
+    text.append("tspan").text("x")
+    svg.append("text").attr("title", "ü > é").text("hé 😀").append("tspan").text("ç")
+    svg.append("foreignObject").append("xhtml:div").append("xhtml:p")
+    return svg
+
+
+def test_emit_1():
+    svg = build(True)
+    assert isinstance(svg, EmitSelection)
+    expected = build(False)
+    assert svg.to_string() == expected.to_string()
+    assert str(svg) == str(expected)
+
+
+def test_emit_2():
+    svg = build(True)
+    for chunk_size in [1, 2, 1024]:
+        stream = io.BytesIO()
+        svg.write(stream, chunk_size=chunk_size)
+        assert stream.getvalue().decode("utf-8") == str(build(False))
+
+
+def update(emit):
+    svg = d3.create("svg", emit=emit)
+    svg.append("g").attr("class", "axis").call(
+        d3.axis_bottom(d3.scale_linear([0, 10], [0, 100])).set_ticks(3)
+    )
+    g = svg.append("g").attr("class", "points")
+    for data in [[1, 2, 3], [3, 4], [5, 4, 3, 2]]:
+        g.select_all("circle").data(data, lambda d: d).join("circle").attr(
+            "r", lambda d: d
+        )
+    svg.select("g").attr("fill", "red")
+    svg.select("g.points circle:last-of-type").attr("stroke", "black")
+    svg.select_all('circle[r="4"]').style("fill", "blue")
+    g.insert("rect", "circle").attr("width", 5)
+    g.select_all("rect").clone(True).attr("width", 6)
+    svg.select_all("g.tick text").remove()
+    row = d3.create("g")
+    row.append("text").attr("x", 2)
+    g.select_all("g").data(["a", "b"]).enter().stamp(row, texts={"text": lambda d: d})
+    return svg
+
+
+def test_emit_3():
+    assert str(update(True)) == str(update(False))
+    assert update(True).to_string() == update(False).to_string()
+
+
+def test_emit_4():
+    svg = d3.create("svg", emit=True)
+    circle = svg.append("circle").attr("r", 5).style("fill", "red")
+    assert circle.attr("r") == "5"
+    assert circle.style("fill") == "red"
+    assert svg.select_all("circle").nodes() == circle.nodes()
+    assert svg.select("rect").nodes() == []
+    with pytest.raises(ValueError):
+        circle.attr("xlink:href", "#")
+    with pytest.raises(ValueError):
+        svg.select_all("circle:first-of-type")
+    circle.remove()
+    assert str(svg) == '<svg xmlns="http://www.w3.org/2000/svg"/>'
+
+
+def test_emit_5():
+    svg = d3.create("svg", emit=True)
+    svg.append("text").text("hé").attr("title", "ü")
+    assert svg.to_string(False) == (
+        '<svg xmlns="http://www.w3.org/2000/svg">'
+        '<text title="&#252;">h&#233;</text></svg>'
+    )
+    stream = io.BytesIO()
+    svg.write(stream)
+    assert stream.getvalue().decode("ascii") == svg.to_string(False)
@@ -1,3 +1,4 @@
+import io
 from datetime import datetime
 from typing import Union
 
@@ -6,6 +7,8 @@ from lxml import etree
 
 import detroit as d3
 from detroit.selection.enter import EnterNode
+from detroit.selection.node_data import NodeData
+from detroit.selection.selection import compile_selector
 
 
 @pytest.fixture
@@ -456,6 +459,7 @@ def test_selection_36(root):
 
     circle = subnode(root, "circle")
     circle.set("fill", "blue")
+    circle.set("stroke", "black")
     circle = subnode(root, "circle")
     circle.set("fill", "green")
     circle.set("stroke", "black")
@@ -721,3 +725,258 @@ def test_selection_55():
     a = svg.append("a")
     a.attr("xlink:href", lambda _: "https://www.google.com/")
     assert a.attr("xlink:href") == "https://www.google.com/"
+
+
+def test_selection_56(g_classes):
+    compile_selector.cache_clear()
+    g_classes.select_all("g")
+    g_classes.select_all("g")
+    info = compile_selector.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert len(g_classes.select_all("g text").nodes()) == 10
+    assert g_classes.select("text:last-of-type").node().tag == "text"
+
+
+def test_selection_57():
+    svg = d3.create("svg")
+    rect = svg.select_all("rect").data([1, 2, 3]).enter().append("rect")
+    rect.attrs({"x": lambda d, i: d + i, "width": 5, "xlink:href": "#a"})
+    expected = d3.create("svg")
+    (
+        expected.select_all("rect")
+        .data([1, 2, 3])
+        .enter()
+        .append("rect")
+        .attr("x", lambda d, i: d + i)
+        .attr("width", 5)
+        .attr("xlink:href", "#a")
+    )
+    assert str(svg) == str(expected)
+
+
+def test_selection_58():
+    svg = d3.create("svg")
+    rect = svg.select_all("rect").data([1, 2]).enter().append("rect")
+    rect.attr_columns({"x": [0.5, 1.5], "y": [2, 3]})
+    assert [node.get("x") for node in rect.nodes()] == ["0.5", "1.5"]
+    assert [node.get("y") for node in rect.nodes()] == ["2", "3"]
+    with pytest.raises(ValueError):
+        rect.attr_columns({"x": [0]})
+
+
+def test_selection_59():
+    svg = d3.create("svg")
+    text = svg.select_all("text").data([1, 2]).enter().append("text")
+    text.style("fill", "black").style("stroke", lambda d: f"#{d}").style("fill", "red")
+    assert text.node().get("style") == "fill:red;stroke:#1;"
+    assert text.style("stroke") == "#1"
+    assert str(svg) == (
+        '<svg xmlns="http://www.w3.org/2000/svg">'
+        '<text style="fill:red;stroke:#1;"/>'
+        '<text style="fill:red;stroke:#2;"/>'
+        "</svg>"
+    )
+    text.attr("style", "opacity:0;").style("fill", "blue")
+    assert text.node().get("style") == "opacity:0;fill:blue;"
+
+
+def test_selection_60(tmp_path):
+    svg = d3.create("svg")
+    svg.call(d3.axis_bottom(d3.scale_linear([0, 10], [0, 100])))
+    svg.append("a").attr("xlink:href", "#").append("text").text("a<b")
+    svg.append("g").style("fill", "red").append("g").text("t")
+    for chunk_size in [1, 3, 1024]:
+        stream = io.BytesIO()
+        svg.write(stream, chunk_size=chunk_size)
+        assert stream.getvalue().decode("utf-8") == str(svg)
+    path = tmp_path / "output.svg"
+    svg.write(str(path))
+    assert path.read_text() == str(svg)
+    with pytest.raises(ValueError):
+        svg.write(io.BytesIO(), chunk_size=0)
+
+
+def test_selection_61():
+    svg = d3.create("svg")
+    svg.append("rect").style("fill", "red").attr("x", 1).style("stroke", "none")
+    assert str(svg) == (
+        '<svg xmlns="http://www.w3.org/2000/svg">'
+        '<rect style="fill:red;stroke:none;" x="1"/>'
+        "</svg>"
+    )
+
+
+def test_selection_62():
+    svg = d3.create("svg")
+    g = svg.select_all("g").data([1, 2, 3]).enter().append("g")
+    g.append("text")
+    assert isinstance(svg._data, NodeData)
+    assert svg._data.get_many(g.nodes()) == [1, 2, 3]
+    assert len(svg._data) == 6
+    svg.select_all("g").filter(lambda d: d == 2).remove()
+    assert len(svg._data) == 4
+    svg.append("rect").datum(4)
+    assert len(svg._data) == 5
+    assert svg.select("rect").node() in svg._data
+    assert svg._data[svg.select("rect").node()] == 4
+
+
+def test_selection_63():
+    svg = d3.create("svg")
+    svg.select_all("g").data(["a", "b", "c"]).enter().append("g").attr(
+        "class", lambda d: d
+    )
+    assert svg.select_all("g").bind_stats() is None
+    g = svg.select_all("g").data(["d", "c", "a"], lambda d: d)
+    stats = g.bind_stats()
+    assert (stats.enter, stats.update, stats.exit) == (1, 2, 1)
+    assert stats.key_time >= 0 and stats.join_time >= 0
+    assert [node.get("class") for node in g.exit().nodes()] == ["b"]
+    enter = g.enter()._groups[0][0]
+    assert enter.__data__ == "d"
+    assert enter._next.get("class") == "c"
+
+
+def test_selection_64():
+    svg = d3.create("svg")
+    svg.select_all("text").data(["a", "b", "c", "d"]).join("text").text(lambda d: d)
+    text = (
+        svg.select_all("text")
+        .data(["d", "e", "b", "f", "a"], lambda d: d)
+        .join("text")
+        .text(lambda d: d)
+    )
+    assert [node.text for node in svg.node()] == ["d", "e", "b", "f", "a"]
+    assert [node.text for node in text.nodes()] == ["d", "e", "b", "f", "a"]
+
+
+def test_selection_65():
+    svg = d3.create("svg")
+    g = svg.append("g")
+    g.append("path")
+    g.select_all("rect").data([1, 2, 3]).join("rect").attr("x", lambda d: d)
+    g.append("line")
+    rect = g.select_all("rect").data([3, 1, 2], lambda d: d).order()
+    assert [node.tag for node in g.node()] == ["path", "rect", "rect", "rect", "line"]
+    assert [node.get("x") for node in rect.nodes()] == ["3", "1", "2"]
+    assert [node.get("x") for node in g.select_all("rect").nodes()] == ["3", "1", "2"]
+
+
+def test_selection_66():
+    data = [("a", 20), ("b", 30), ("c", 40)]
+    expected = d3.create("svg")
+    g = (
+        expected.select_all("g")
+        .data(data)
+        .enter()
+        .append("g")
+        .attr("transform", lambda d, i: f"translate(0,{i * 12})")
+    )
+    g.append("rect").attr("height", 10).attr("width", lambda d: d[1])
+    g.append("text").attr("x", -5).text(lambda d: d[0])
+    g.append("title").text("row")
+
+    row = d3.create("g")
+    row.append("rect").attr("height", 10)
+    row.append("text").attr("x", -5)
+    row.append("title").text("row")
+    svg = d3.create("svg")
+    stamped = (
+        svg.select_all("g")
+        .data(data)
+        .enter()
+        .stamp(
+            row,
+            {
+                "": {"transform": lambda d, i: f"translate(0,{i * 12})"},
+                "rect": {"width": lambda d: d[1]},
+            },
+            {"text": lambda d: d[0]},
+        )
+    )
+    assert str(svg) == str(expected)
+    assert len(stamped.nodes()) == 3
+    assert [d[0] for d in svg._data.get_many(svg.select_all("rect").nodes())] == [
+        "a",
+        "b",
+        "c",
+    ]
+    assert str(row) == '<g><rect height="10"/><text x="-5"/><title>row</title></g>'
+
+
+def test_selection_67():
+    svg = d3.create("svg")
+    outer = svg.append("g").attr("id", "a")
+    outer.append("g").attr("id", "b").append("g").attr("id", "c")
+    svg.append("g").attr("id", "d")
+    assert svg.select("g").attr("id") == "a"
+    assert outer.select("g").attr("id") == "b"
+    groups = svg.select_all("g")._groups
+    assert [[node.get("id") for node in group] for group in groups] == [
+        ["a", "d"],
+        ["b"],
+        ["c"],
+    ]
+
+
+def test_selection_68():
+    svg = d3.create("svg")
+    g = svg.append("g").style("fill", "red")
+    d3.select(svg.node()).select("g").style("stroke", "blue")
+    g.style("opacity", 0.5)
+    assert g.node().get("style") == "fill:red;stroke:blue;opacity:0.5;"
+    d3.select(g.node()).style("fill", "green")
+    g.node().set("style", g.node().get("style") + "display:none;")
+    g.style("stroke", "none")
+    assert etree.tostring(svg.node()).decode("utf-8") == str(svg)
+    assert str(svg) == (
+        '<svg xmlns="http://www.w3.org/2000/svg">'
+        '<g style="fill:green;stroke:none;opacity:0.5;display:none;"/>'
+        "</svg>"
+    )
+
+
+def test_selection_69():
+    svg = d3.create("svg")
+    g = svg.select_all("g").data([1, 2]).enter().append("g")
+    merged = g.merge(g)
+    assert isinstance(merged._data, NodeData)
+    assert merged._data is not g._data
+    assert merged._data == g._data
+    data = NodeData({"a": 1})
+    assert (data | {"b": 2}) == {"a": 1, "b": 2}
+    assert data == {"a": 1}
+
+
+def test_selection_70():
+    svg = d3.create("svg")
+    svg.append("text").text("hé 😀").attr("title", "ü")
+    g = svg.append("g").attr("class", "ç")
+    g.append("text").text("ö")
+    g.append("rect").attr("title", "ß")
+    for chunk_size in [1, 1024]:
+        stream = io.BytesIO()
+        svg.write(stream, chunk_size=chunk_size)
+        assert stream.getvalue() == svg.to_string(False).encode("ascii")
+    assert '<text title="&#252;">h&#233; &#128512;</text>' in svg.to_string(False)
+
+
+def test_selection_71():
+    svg = d3.create("svg")
+    for data in [[1, 2, 3], [3, 4]]:
+        (
+            svg.select_all("g")
+            .data(data, lambda d: d)
+            .join("g")
+            .style("fill", "red")
+            .append("rect")
+            .style("stroke", "blue")
+        )
+    assert len(svg._styles) == 5
+    assert set(svg._styles) == set(svg.select_all("g").nodes()) | set(
+        svg.select_all("rect").nodes()
+    )
+    svg.select_all("g").remove()
+    assert svg._styles == {}
+    assert svg._data == {}
@@ -833,3 +833,45 @@ def test_arc_51():
         .set_corner_radius(4)
     )
     assert a() == "M22.369,-8.697L13.981,-5.435Z"
+
+
+def test_arc_52():
+    arcs = d3.pie()([1, 2, 2, 3, 1, 0, 2])
+    for corner_radius, pad_angle in [(0, 0), (0, 0.05), (6, 0), (6, 0.05)]:
+        a = (
+            d3.arc()
+            .set_inner_radius(50)
+            .set_outer_radius(100)
+            .set_corner_radius(corner_radius)
+            .set_pad_angle(pad_angle)
+        )
+        assert a.render_many(arcs) == [a(d) for d in arcs]
+
+
+def test_arc_53():
+    arcs = d3.pie()([1, 1])
+    context = d3.path()
+    a = d3.arc().set_inner_radius(0).set_outer_radius(100).set_context(context)
+    assert a.render_many(arcs) is None
+    assert str(context) == (
+        "M0,-100A100,100,0,1,1,0,100L0,0Z"
+        "M0,100A100,100,0,1,1,0,-100L0,0Z"
+    )
+
+
+def test_arc_54():
+    arc = d3.arc().set_inner_radius(0).set_start_angle(0).set_end_angle(pi / 2)
+    expected = arc.set_outer_radius(100)()
+    nested = []
+
+    def outer_radius(*args):
+        if not nested:
+            nested.append(None)
+            nested[0] = arc()
+        return 100
+
+    arc.set_outer_radius(outer_radius)
+    assert arc() == expected
+    assert nested[0] == expected
+    assert arc() == expected
+    assert len(arc._pool) == 2
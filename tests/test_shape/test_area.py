@@ -1,3 +1,5 @@
+import pytest
+
 import detroit as d3
 
 
@@ -325,3 +327,39 @@ def test_area_20():
     assert l.get_context() == context
     assert l.get_x() == x
     assert l.get_y() == y1
+
+
+def test_area_21():
+    points = [[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6], [5, 7]]
+    a = d3.area().set_simplify(0.5)
+    assert a.get_simplify() == (0.5, "douglas_peucker")
+    assert a(points) == "M0,0L2,-0.100L3,5L5,7L5,0L0,0Z"
+    assert a.area_line().get_simplify() == (0.5, "douglas_peucker")
+    a.set_defined(lambda d, i, data: i != 2)
+    assert a(points) == "M0,0L1,0.100L1,0L0,0ZM3,5L5,7L5,0L3,0Z"
+
+
+def test_area_22():
+    points = [[0, 5], [0.2, 1], [0.4, 9], [0.6, 4], [0.8, 6], [1.5, 2]]
+    a = d3.area().set_downsample([0, 2])
+    assert a.get_downsample() == (0, 2, 2)
+    assert a(points) == "M0,5L0.200,1L0.400,9L0.800,6L1.500,2L1.500,0L0.800,0L0,0Z"
+    assert a.area_line().get_downsample() == (0, 2, 2)
+
+
+def test_area_23():
+    from array import array
+
+    points = [[0, 5], [1, 3], [2, 4], [3, 1]]
+    xs = array("d", [0, 1, 2, 3])
+    ys = array("d", [5, 3, 4, 1])
+    a = d3.area()
+    assert a.from_columns(xs, 0, ys) == a(points)
+    assert a.from_columns(xs, [0, 0, 0, 0], ys, [1, 2, 3, 4]) == a.x1(
+        lambda d: d[0] + 1
+    )(points)
+    a = d3.area().set_curve(d3.curve_step).set_defined(lambda d, i, data: i != 1)
+    assert a.from_columns(xs, 0, ys, defined=[1, 0, 1, 1]) == a(points)
+    assert a.from_columns([], 0) is None
+    with pytest.raises(ValueError):
+        a.from_columns(xs, 0, ys[:2])
@@ -1,5 +1,7 @@
 import math
 
+import pytest
+
 import detroit as d3
 from detroit.shape.curves.linear import curve_linear
 
@@ -105,3 +107,80 @@ def test_line_10():
     assert l.digits(3) == l
     assert l.digits() == 3
     assert str(l(points)) == "M0,3.142L2.718,4"
+
+
+def test_line_11():
+    points = [[0, 1], [2, 3], [4, 5], [6, 7]]
+    assert d3.line()(points[:1]) == "M0,1Z"
+    assert d3.line(lambda d, i: d[0] + i)(points) == "M0,1L3,3L6,5L9,7"
+    l = d3.line().set_defined(lambda d, i, data: d[0] != 4)
+    assert l(points) == "M0,1L2,3M6,7Z"
+    context = d3.path()
+    assert d3.line().set_context(context)(points) is None
+    assert str(context) == "M0,1L2,3L4,5L6,7"
+
+
+def test_line_12():
+    points = [[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6], [5, 7], [5.1, 7.1]]
+    l = d3.line().set_simplify(0.5)
+    assert l.get_simplify() == (0.5, "douglas_peucker")
+    assert l(points) == "M0,0L2,-0.100L3,5L5.100,7.100"
+    assert l.set_simplify(0.5, "visvalingam")(points) == "M0,0L2,-0.100L3,5L5.100,7.100"
+    assert l.set_simplify(None)(points) == d3.line()(points)
+    l = d3.line().set_simplify(0.5).set_defined(lambda d, i, data: i != 3)
+    assert l(points) == "M0,0L2,-0.100M4,6L5.100,7.100"
+    l.set_curve(d3.curve_step)
+    assert l(points) == "M0,0L1,0L1,-0.100L2,-0.100M4,6L4.550,6L4.550,7.100L5.100,7.100"
+    with pytest.raises(ValueError):
+        d3.line().set_simplify(-1)
+    with pytest.raises(ValueError):
+        d3.line().set_simplify(1, "unknown")
+
+
+def test_line_13():
+    points = [[0, 5], [0.2, 1], [0.4, 9], [0.6, 4], [0.8, 6], [1.5, 2]]
+    l = d3.line().set_downsample([0, 2])
+    assert l.get_downsample() == (0, 2, 2)
+    assert l(points) == "M0,5L0.200,1L0.400,9L0.800,6L1.500,2"
+    assert l(points[::-1]) == "M1.500,2L0.800,6L0.400,9L0.200,1L0,5"
+    assert d3.line().set_downsample([0, 2], 1)(points) == "M0,5L0.200,1L0.400,9L1.500,2"
+    assert l.set_downsample(None)(points) == d3.line()(points)
+    with pytest.raises(ValueError):
+        d3.line().set_downsample([0, 2], 0)
+
+
+def test_line_14():
+    from array import array
+
+    xs = array("d", [0, 1, 2, 3])
+    ys = [5, 3, 4, 1]
+    l = d3.line()
+    assert l.from_columns(xs, ys) == "M0,5L1,3L2,4L3,1"
+    assert l.from_columns(xs, ys, [1, 1, 0, 1]) == "M0,5L1,3M3,1Z"
+    assert l.from_columns([], []) is None
+    l.set_curve(d3.curve_step).set_defined(lambda d, i, data: i != 2)
+    assert l.from_columns(xs, ys, [1, 1, 0, 1]) == l(list(zip(xs, ys)))
+    with pytest.raises(ValueError):
+        l.from_columns(xs, ys[:2])
+
+
+def test_line_15():
+    line = d3.line().x(lambda d: d[0]).y(lambda d: d[1])
+    assert line([["0", "1"], ["2.5", "3"]]) == "M0,1L2.500,3"
+
+
+def test_line_16():
+    l = d3.line().set_downsample([0, 2], 2)
+    for points in [
+        [[0, 5], [1.5, 2], [0.2, 1], [0.4, 9], [0.6, 4], [0.8, 6]],
+        [[0, 5], [0.2, 1], [math.nan, 9], [0.6, 4], [0.8, 6], [1.5, 2]],
+        [[0, 5], [math.inf, 1], [0.4, 9], [-math.inf, 4], [0.8, 6], [1.5, 2]],
+    ]:
+        assert l(points) == d3.line()(points)
+    points = [[-math.inf, 5], [0.2, 1], [0.4, 9], [0.6, 4], [0.8, 6], [math.inf, 2]]
+    assert l(points) == "M-inf,5L0.200,1L0.400,9L0.800,6Linf,2"
+    for pixels in [2.5, "2", -1]:
+        with pytest.raises(ValueError):
+            d3.line().set_downsample([0, 2], pixels)
+        with pytest.raises(ValueError):
+            d3.area().set_downsample([0, 2], pixels)
@@ -1,3 +1,5 @@
+import pytest
+
 import detroit as d3
 from detroit.shape.series import Serie, Series
 
@@ -149,3 +151,73 @@ def test_stack_13():
         )
     )
     assert computed == expected
+
+
+def test_stack_14():
+    data = [
+        {"a": 1, "b": 3, "c": -2},
+        {"a": 2, "b": 0, "c": 4},
+        {"a": -1, "b": 2, "c": 1},
+        {"a": 3, "b": 1, "c": 0},
+        {"a": 0, "b": 5, "c": -3},
+    ]
+    offsets = [
+        d3.stack_offset_none,
+        d3.stack_offset_expand,
+        d3.stack_offset_diverging,
+        d3.stack_offset_silhouette,
+        d3.stack_offset_wiggle,
+    ]
+    orders = [d3.stack_order_none, d3.stack_order_reverse, d3.stack_order_ascending]
+    for offset in offsets:
+        for order in orders + [[2, 0, 1]]:
+            s = d3.stack().set_keys(["a", "b", "c"]).set_offset(offset)
+            s.set_order(order)
+            series = s(data[:2])
+            assert s.extend(series, data[2:4]) is series
+            assert s.extend(series, data[4:]) == s(data)
+
+
+def test_stack_15():
+    s = d3.stack().set_keys(["a", "b"]).set_value(lambda d, key, i: d[key] * i)
+    data = [{"a": 1, "b": 2}] * 3
+    series = s.extend(s([]), data[:1])
+    assert s.extend(series, data[1:]) == s(data)
+
+
+def test_stack_16():
+    data = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+    series = d3.stack().set_keys(["a", "b"])(data)
+    assert list(series[1].y0s) == [1, 3]
+    assert list(series[1].y1s) == [3, 7]
+    assert series[1].data == data
+    serie = series[1][-1]
+    assert (serie[0], serie[1], len(serie), serie.data) == (3, 7, 2, data[1])
+    serie[1] = 8
+    assert series[1].y1s[1] == 8
+    assert serie == Serie([3, 8], data[1])
+    with pytest.raises(IndexError):
+        series[1][2]
+    area = d3.area()
+    assert area.from_columns([0, 1], series[1].y0s, series[1].y1s) == (
+        "M0,3L1,8L1,3L0,1Z"
+    )
+
+
+def test_stack_17():
+    data = [{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"a": 5, "b": 6}]
+    series = d3.stack().set_keys(["a", "b"])(data)
+    assert series[1][0][0:2] == [1, 3]
+    assert series[1][0][::-1] == [3, 1]
+    assert series[1][1:] == [Serie([3, 7], data[1]), Serie([5, 11], data[2])]
+    assert series[1][::-2] == [Serie([5, 11], data[2]), Serie([1, 3], data[0])]
+    assert series[1][5:] == []
+    assert Serie([1, 3], None)[:1] == [1]
+
+
+def test_stack_18():
+    data = [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+    series = d3.stack().set_keys(["a", "b"])(data)
+    values = [[serie[0], serie[1]] for serie in series[1]]
+    assert values == [[1, 3], [3, 7]]
+    assert all(isinstance(value, float) for pair in values for value in pair)
@@ -0,0 +1,136 @@
+import pytest
+
+import detroit as d3
+from detroit.shape import symbol as symbol_module
+
+
+def test_symbol_1():
+    symbol = d3.symbol(d3.symbol_square, 16)
+    assert symbol() == "M-2,-2h4v4h-4Z"
+    assert symbol() == "M-2,-2h4v4h-4Z"
+    assert symbol.render_many([(0, 0), (10, 20)]) == "M-2,-2h4v4h-4ZM8,18h4v4h-4Z"
+    assert symbol.render_many([]) is None
+
+
+def test_symbol_2():
+    sizes = iter([16, 16, 4])
+    symbol = d3.symbol(d3.symbol_square, lambda: next(sizes))
+    assert symbol.render_many([(0, 0), (1, 1), (2, 2)]) == (
+        "M-2,-2h4v4h-4ZM-1,-1h4v4h-4ZM1,1h2v2h-2Z"
+    )
+    context = d3.path()
+    assert (
+        d3.symbol(d3.symbol_square, 4).set_context(context).render_many([(1, 1)])
+        is None
+    )
+    assert str(context) == "M0,0h2v2h-2Z"
+    with pytest.raises(TypeError):
+        d3.symbol().set_context(object()).render_many([(0, 0)])
+
+
+def test_symbol_3():
+    calls = []
+
+    def symbol_type(context, size):
+        calls.append(size)
+        context.rect(0, 0, size, size)
+
+    first = d3.symbol(symbol_type, 5)
+    second = d3.symbol(symbol_type, 5)
+    assert first() == second() == "M0,0h5v5h-5Z"
+    assert calls == [5]
+    assert d3.symbol(symbol_type, 5).digits(1)() == "M0,0h5v5h-5Z"
+    assert calls == [5, 5]
+
+
+def test_symbol_4():
+    sizes = iter([16, 4, 16])
+    svg = d3.create("svg")
+    uses = d3.symbol(d3.symbol_square, lambda: next(sizes)).render_uses(
+        svg, [(0, 0), (1, 2), (3, 4)], prefix="marker"
+    )
+    assert len(uses.nodes()) == 3
+    ids = [symbol.get("id") for symbol in svg.select_all("symbol").nodes()]
+    assert ids == ["marker-35318bce", "marker-c1e802e7"]
+    assert [node.get("href") for node in uses.nodes()] == [
+        f"#{ids[0]}",
+        f"#{ids[1]}",
+        f"#{ids[0]}",
+    ]
+    assert [path.get("d") for path in svg.select_all("symbol path").nodes()] == [
+        "M-2,-2h4v4h-4Z",
+        "M-1,-1h2v2h-2Z",
+    ]
+    assert uses.attr("x") == "0" and uses.attr("y") == "0"
+
+
+def test_symbol_5():
+    svg = d3.create("svg")
+    svg.append("use").attr("href", "#other")
+    square = d3.symbol(d3.symbol_square, 16)
+    square.render_uses(svg, [(0, 0), (1, 2)])
+    uses = square.render_uses(svg, [(3, 4)])
+    assert len(svg.select_all("g").nodes()) == 1
+    assert len(svg.select_all("defs").nodes()) == 1
+    assert len(svg.select_all("symbol").nodes()) == 1
+    assert [node.get("x") for node in uses.nodes()] == ["3"]
+    assert [node.get("href") for node in svg.select_all("use").nodes()] == [
+        "#other",
+        "#symbol-35318bce",
+    ]
+
+    d3.symbol(d3.symbol_circle, 16).render_uses(svg, [(5, 6)], prefix="circle")
+    ids = [symbol.get("id") for symbol in svg.select_all("symbol").nodes()]
+    assert len(ids) == len(set(ids)) == 2
+    assert [node.get("href") for node in svg.select_all("use").nodes()] == [
+        "#other",
+        "#symbol-35318bce",
+        f"#{ids[1]}",
+    ]
+
+
+def test_symbol_6():
+    class SymbolType:
+        __hash__ = None
+
+        def __call__(self, context, size):
+            context.rect(0, 0, size, size)
+
+    symbol = d3.symbol(SymbolType(), 5)
+    assert symbol() == "M0,0h5v5h-5Z"
+    assert symbol.render_many([(0, 0), (1, 1)]) == "M0,0h5v5h-5ZM1,1h5v5h-5Z"
+    svg = d3.create("svg")
+    uses = symbol.render_uses(svg, [(0, 0)])
+    assert len(uses.nodes()) == 1
+    assert svg.select("symbol path").attr("d") == "M0,0h5v5h-5Z"
+
+
+def test_symbol_7(monkeypatch):
+    monkeypatch.setattr(symbol_module, "crc32", lambda data: 1)
+    sizes = iter([16, 4, 16, 4])
+    svg = d3.create("svg")
+    symbol = d3.symbol(d3.symbol_square, lambda: next(sizes))
+    uses = symbol.render_uses(svg, [(0, 0), (1, 2)])
+    assert [node.get("href") for node in uses.nodes()] == [
+        "#symbol-00000001",
+        "#symbol-00000001-1",
+    ]
+    uses = symbol.render_uses(svg, [(0, 0), (1, 2)])
+    assert [node.get("href") for node in uses.nodes()] == [
+        "#symbol-00000001",
+        "#symbol-00000001-1",
+    ]
+    paths = svg.select_all("symbol path").nodes()
+    assert [path.get("d") for path in paths] == ["M-2,-2h4v4h-4Z", "M-1,-1h2v2h-2Z"]
+
+
+def test_symbol_8():
+    svg = d3.create("svg")
+    outer = svg.append("g")
+    square = d3.symbol(d3.symbol_square, 16)
+    square.render_uses(outer, [(0, 0)])
+    square.render_uses(svg, [(1, 2), (3, 4)])
+    groups = svg.select_all("g.symbol").nodes()
+    assert len(groups) == 2
+    assert [group.getparent() for group in groups] == [outer.node(), svg.node()]
+    assert [node.get("x") for node in outer.select_all("use").nodes()] == ["0"]